@@ -14,5 +14,6 @@ from termgame import Engine
 W = 32
 H = 32
 
-e = Engine(W, H, gameobjects=[Background(W, H), DVDLogo()])
+# the background covers the whole screen, so there is no need to clear it between frames
+e = Engine(W, H, gameobjects=[Background(W, H), DVDLogo()], auto_clear=False)
 e.run(fps=10)
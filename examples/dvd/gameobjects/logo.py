@@ -1,7 +1,7 @@
 from __future__ import annotations
 from random import randint, choice
-from termgame import Gameobject, Screen
-from termgame.util import stretch_animation
+from termgame import Gameobject
+from termgame.graphics import IndexedScreen
 import os
 
 
@@ -12,20 +12,20 @@ class DVDLogo(Gameobject):
 
     def __init__(self):
 
-        sprites = stretch_animation(
-            [
-                Screen.from_image(DVDLogo.SPRITES_FOLDER + "dvd.png", resize=DVDLogo.DVD_SIZE),
-                Screen.from_image(
-                    DVDLogo.SPRITES_FOLDER + "dvd_yellow.png", resize=DVDLogo.DVD_SIZE
-                ),
-            ],
-            randint(1, 5),
+        logo = IndexedScreen.from_image(
+            DVDLogo.SPRITES_FOLDER + "dvd.png", resize=DVDLogo.DVD_SIZE
         )
+        # the yellow logo is a palette swap of the blue one: (r, g, b) -> (b, b, r)
+        sprites = [logo, logo.with_palette(logo.palette[:, [2, 2, 0]])]
 
         Gameobject.__init__(
             self, sprites=sprites, x=0, y=0, name="DVD Logo", on_update=self.bounce
         )
 
+        # switch colors every few ticks
+        self.add_animation("colors", sprites, durations=randint(1, 5))
+        self.play("colors")
+
     def on_start(self, engine):
         pass
 
@@ -139,4 +139,4 @@ class DVDLogo(Gameobject):
             elif on_right(self):
                 apply_dir(choice(["up", "down", "left", "upleft", "downleft"]))
             else:
-                apply_dir("downright")
\ No newline at end of file
+                apply_dir("downright")
@@ -19,13 +19,15 @@ WALL_THICKNESS = 2
 N_PARTICLES = 100
 
 
+# one prefab per shade of blue, the particles are instances of them sharing their sprites
+PARTICLE_PREFABS = [Particle(0, 0, (0, 0, blue)) for blue in range(100, 256, 16)]
+
+
 def create_particle() -> Particle:
-    random_pos = (
-        random.randint(0 + WALL_THICKNESS, W - WALL_THICKNESS),
-        random.randint(0 + WALL_THICKNESS, H - WALL_THICKNESS),
+    return random.choice(PARTICLE_PREFABS).clone(
+        x=random.randint(0 + WALL_THICKNESS, W - WALL_THICKNESS),
+        y=random.randint(0 + WALL_THICKNESS, H - WALL_THICKNESS),
     )
-    random_blue = (0, 0, random.randint(100, 255))
-    return Particle(*random_pos, random_blue)
 
 
 e = PhysicsEngine(
@@ -40,6 +42,8 @@ e = PhysicsEngine(
         Wall(W - WALL_THICKNESS, 0, WALL_THICKNESS, H),
         Background(W, H),
     ],
+    # the background covers the whole screen, so there is no need to clear it between frames
+    auto_clear=False,
 )
 
 e.run(fps=20, ppf=10)
@@ -1,7 +1,6 @@
 import os
 
 from termgame import Engine, Gameobject, Screen
-from termgame.util import scroll_sprite
 
 
 class Background(Gameobject):
@@ -20,5 +19,5 @@ class Background(Gameobject):
 
         # scroll the background every 10 frammes
         if frame % 10 == 0:
-            self.background_image = scroll_sprite(self.background_image, 0, -1)
-            self.set_sprites([self.background_image])
+            # only the offset of the sprite changes, the animation keeps playing
+            self.background_image.scroll(0, -1)
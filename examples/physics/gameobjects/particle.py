@@ -1,11 +1,13 @@
 import pymunk
 
-from termgame import PhysicsEngine, PhysicsGameobject, Screen
+from termgame import PhysicsEngine, PhysicsGameobject
+from termgame.graphics.sprite_pool import sprite_pool
 
 
 class Particle(PhysicsGameobject):
     def __init__(self, x, y, color):
-        sprites = [Screen(1, 1).fill(color)]
+        # particles of the same color share a single sprite
+        sprites = [sprite_pool.solid(1, 1, color)]
         PhysicsGameobject.__init__(
             self,
             x=x,
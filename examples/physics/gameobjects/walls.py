@@ -1,12 +1,14 @@
 import pymunk
 
-from termgame import Engine, PhysicsGameobject, Screen
+from termgame import Engine, PhysicsGameobject
+from termgame.graphics.sprite_pool import sprite_pool
 from termgame.util import get_bb_poly
 
 
 class Wall(PhysicsGameobject):
     def __init__(self, x, y, w, h):
-        sprites = [Screen(w, h).fill((128, 128, 128))]
+        # opposite walls share a single sprite
+        sprites = [sprite_pool.solid(w, h, (128, 128, 128))]
         PhysicsGameobject.__init__(
             self,
             x=x,
@@ -9,18 +9,31 @@ from gameobjects.ground import Ground
 from gameobjects.player import Player
 
 from termgame import PhysicsEngine
+from termgame.assets import Asset
 from termgame.settings import Settings
 
 W = 72
 H = 40
 GROUND_HEIGHT = 2
 
+e = PhysicsEngine(W, H)
+
+# decode all the sprites at once, the gameobjects below pick them up from the cache.
+# The engine shows the loading progress before starting the game.
+e.preload(
+    [
+        Asset(Background.SPRITES_FOLDER + "background.png", (W, H)),
+        *[Asset(Player.SPRITES_FOLDER + f"walk{i}.png", has_alpha=True) for i in range(1, 4)],
+    ]
+)
+
 level_ground = Ground(x=0, y=H - GROUND_HEIGHT, width=W, height=GROUND_HEIGHT)
 
 p1 = Player(H, GROUND_HEIGHT, lru=["left", "right", "up"], name="Player 1")
 p2 = Player(H, GROUND_HEIGHT, lru=["a", "d", "w"], name="Player 2")
 
-e = PhysicsEngine(W, H, gameobjects=[level_ground, Background(W, H), p1, p2])
+for gameobject in [level_ground, Background(W, H), p1, p2]:
+    e.add_gameobject(gameobject)
 
 Settings.runtime_settings.headless = False
 e.run()
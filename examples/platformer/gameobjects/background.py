@@ -1,7 +1,6 @@
 import os
 
 from termgame import *
-from termgame.util import scroll_sprite
 
 
 class Background(Gameobject):
@@ -21,5 +20,5 @@ class Background(Gameobject):
 
         # scroll the background every 10 frammes
         if frame % 10 == 0:
-            self.background_image = scroll_sprite(self.background_image, -1, 0)
-            self.set_sprites([self.background_image])
+            # only the offset of the sprite changes, the animation keeps playing
+            self.background_image.scroll(-1, 0)
@@ -3,7 +3,7 @@ import os
 import keyboard
 
 from termgame import PhysicsGameobject, Screen
-from termgame.util import flip_animation, get_bb_poly, stretch_animation
+from termgame.util import flip_animation, get_bb_poly
 
 
 class Player(PhysicsGameobject):
@@ -21,30 +21,30 @@ class Player(PhysicsGameobject):
         self.pressed = False
 
         # animations
-        self.stand = [
+        walk_right = [
             Screen.from_image(Player.SPRITES_FOLDER + "walk1.png", has_alpha=True),
+            Screen.from_image(Player.SPRITES_FOLDER + "walk2.png", has_alpha=True),
+            Screen.from_image(Player.SPRITES_FOLDER + "walk3.png", has_alpha=True),
         ]
-        self.walk_right_animation = stretch_animation(
-            [
-                Screen.from_image(Player.SPRITES_FOLDER + "walk1.png", has_alpha=True),
-                Screen.from_image(Player.SPRITES_FOLDER + "walk2.png", has_alpha=True),
-                Screen.from_image(Player.SPRITES_FOLDER + "walk3.png", has_alpha=True),
-            ],
-            3,
-        )
-        self.walk_left_animation = flip_animation(self.walk_right_animation, "x")
+        walk_left = flip_animation(walk_right, "x")
 
         PhysicsGameobject.__init__(
             self,
             x=0,
             y=screen_height - ground_height - Player.PLAYER_SIZE[1],
-            sprites=self.walk_right_animation,
+            sprites=walk_right,
             on_start=self.on_start,
             on_fixed_update=self.on_fixed_update,
             name=name,
             max_velocity=30,
         )
 
+        # each walking frame is shown for 3 ticks
+        self.add_animation("stand", [walk_right[0]])
+        self.add_animation("walk_right", walk_right, durations=3)
+        self.add_animation("walk_left", walk_left, durations=3)
+        self.play("walk_right")
+
     def on_start(self, engine):
 
         c = get_bb_poly(self)
@@ -59,7 +59,7 @@ class Player(PhysicsGameobject):
 
         if not self.pressed:
             self.pressed = True
-            self.set_sprites(self.walk_right_animation)
+            self.play("walk_right")
         if self.x <= engine.width - Player.PLAYER_SIZE[0]:
             walk_impulse = (Player.RUNNING_FORCE, 0)
             center = (self.width // 2, self.height // 2)
@@ -73,7 +73,7 @@ class Player(PhysicsGameobject):
 
         if not self.pressed:
             self.pressed = True
-            self.set_sprites(self.walk_left_animation)
+            self.play("walk_left")
         if self.x >= 0:
             walk_impulse = (-Player.RUNNING_FORCE, 0)
             center = (self.width // 2, self.height // 2)
@@ -90,7 +90,7 @@ class Player(PhysicsGameobject):
         self.rb._set_velocity((0.00, self.rb.velocity[1]))
 
         self.pressed = False
-        self.set_sprites(self.stand)
+        self.play("stand")
 
     def on_fixed_update(self, frame, engine):
 
@@ -0,0 +1,85 @@
+"""
+Description: Preload sprites concurrently, so games start as soon as the slowest image is
+    decoded instead of after decoding every image one by one.
+Author: Gregory Glatzer
+Date: 4/21/2023
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Tuple
+
+from .graphics.screen import Screen
+
+
+@dataclass(frozen=True)
+class Asset:
+    """
+    An image to load as a sprite, with the same options as Screen.from_image.
+
+    :ivar path: Path to the image.
+    :vartype path: str
+    :ivar resize: The size to resize the image to, if not None.
+    :vartype resize: Tuple[int, int] | None
+    :ivar has_alpha: Whether the image has an alpha channel.
+    :vartype has_alpha: bool
+    """
+
+    path: str
+    resize: Tuple[int, int] | None = None
+    has_alpha: bool = False
+
+    def load(self) -> Screen:
+        """
+        Load the asset as a sprite.
+
+        :return: The sprite.
+        :rtype: Screen
+        """
+        return Screen.from_image(self.path, resize=self.resize, has_alpha=self.has_alpha)
+
+
+def preload(
+    assets: Iterable[Asset | str],
+    on_progress: Callable[[int, int], None] | None = None,
+    max_workers: int | None = None,
+) -> List[Future[Screen]]:
+    """
+    Decode images on a thread pool. Decoded images land in the image cache, so
+    later calls to Screen.from_image with the same options return immediately
+    (or wait for the image being decoded, instead of decoding it again).
+
+    :param assets: The images to load, as Assets or paths.
+    :type assets: Iterable[Asset | str]
+    :param on_progress: Called with (number of loaded assets, number of assets) every time
+        an asset finishes loading, in order. Called from the worker threads, one at a time.
+    :type on_progress: Callable[[int, int], None] | None
+    :param max_workers: Maximum number of threads. Defaults to ThreadPoolExecutor's default.
+    :type max_workers: int | None
+    :return: A future for each asset, resolving to its sprite.
+    :rtype: List[Future[Screen]]
+    """
+    assets = [Asset(asset) if isinstance(asset, str) else asset for asset in assets]
+
+    lock = threading.Lock()
+    done = 0
+
+    def report_progress(_: Future[Screen]) -> None:
+        nonlocal done
+        # report under the lock, so the counts are reported in increasing order
+        with lock:
+            done += 1
+            if on_progress is not None:
+                on_progress(done, len(assets))
+
+    # the threads exit once every asset is loaded, nothing waits for them here
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="termgame-assets")
+    futures = [executor.submit(asset.load) for asset in assets]
+    executor.shutdown(wait=False)
+
+    for future in futures:
+        future.add_done_callback(report_progress)
+    return futures
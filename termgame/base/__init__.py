@@ -5,9 +5,18 @@ gameobjects and a physics gameobject wrapper.
 """
 
 
+from .camera import Camera
 from .engine import Engine
 from .gameobject import Gameobject
+from .overload import OverloadPolicy
 from .physics_engine import PhysicsEngine
 from .physics_gameobject import PhysicsGameobject
 
-__all__ = ["Engine", "Gameobject", "PhysicsGameobject", "PhysicsEngine"]
+__all__ = [
+    "Camera",
+    "Engine",
+    "Gameobject",
+    "OverloadPolicy",
+    "PhysicsGameobject",
+    "PhysicsEngine",
+]
@@ -0,0 +1,90 @@
+"""
+Description: The camera, showing the part of the world that fits on the screen.
+Author: Gregory Glatzer
+Date: 4/28/2023
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+from ..graphics.rect import Rect
+from ..util import clamp
+from .gameobject import Gameobject
+
+
+class Camera:
+    """
+    A viewport onto the world: the rectangle of world coordinates shown on the screen.
+    Gameobjects are positioned in world coordinates, and drawn on the screen
+    at their position minus the position of the camera.
+    """
+
+    def __init__(self, width: int, height: int, world: Rect | None = None):
+        """
+        Initialize a camera at the top-left corner of the world.
+
+        :param width: Width of the viewport, usually the width of the screen.
+        :type width: int
+        :param height: Height of the viewport, usually the height of the screen.
+        :type height: int
+        :param world: If given, the camera is kept inside this rectangle
+            (see move_to). Default is None, which lets the camera move anywhere.
+        :type world: Rect | None
+        """
+        self.width = width
+        self.height = height
+        self.world = world
+        self.x = 0
+        self.y = 0
+
+    @property
+    def viewport(self) -> Rect:
+        """The rectangle of world coordinates shown on the screen."""
+        return Rect(int(self.x), int(self.y), self.width, self.height)
+
+    def move_to(self, x: int | float, y: int | float) -> None:
+        """
+        Move the top-left corner of the viewport to the given world coordinates,
+        keeping the viewport inside the world, if the camera has one.
+
+        :param x: x-coordinate of the viewport.
+        :type x: int | float
+        :param y: y-coordinate of the viewport.
+        :type y: int | float
+        """
+        if self.world is not None:
+            x = clamp(x, self.world.x, max(self.world.right - self.width, self.world.x))
+            y = clamp(y, self.world.y, max(self.world.bottom - self.height, self.world.y))
+        self.x, self.y = x, y
+
+    def move_by(self, dx: int | float, dy: int | float) -> None:
+        """
+        Move the camera by the given offset (see move_to).
+        """
+        self.move_to(self.x + dx, self.y + dy)
+
+    def center_on(self, gameobject: Gameobject) -> None:
+        """
+        Move the camera so the gameobject is in the middle of the viewport (see move_to).
+        Call it every frame to follow a gameobject.
+
+        :param gameobject: The gameobject to center on.
+        :type gameobject: Gameobject
+        """
+        self.move_to(
+            int(gameobject.x + gameobject.width / 2 - self.width / 2),
+            int(gameobject.y + gameobject.height / 2 - self.height / 2),
+        )
+
+    def to_screen(self, x: int | float, y: int | float) -> Tuple[int, int]:
+        """
+        Convert world coordinates to screen coordinates.
+        """
+        return int(x) - int(self.x), int(y) - int(self.y)
+
+    def to_world(self, x: int, y: int) -> Tuple[int, int]:
+        """
+        Convert screen coordinates to world coordinates.
+        """
+        return x + int(self.x), y + int(self.y)
@@ -0,0 +1,278 @@
+"""
+Description: Paint gameobjects onto the engine's screen, only repainting the regions that changed.
+Author: Gregory Glatzer
+Date: 4/23/2023
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from itertools import groupby
+from typing import Callable, Dict, List, Tuple
+
+from ..graphics.rect import Rect, merge_rects
+from ..graphics.screen import Screen
+from .gameobject import Gameobject
+
+
+@dataclass
+class DrawnSprite:
+    """
+    What the compositor painted for a gameobject on the last frame.
+
+    :ivar gameobject: The gameobject.
+    :vartype gameobject: Gameobject
+    :ivar sprite: Its active sprite.
+    :vartype sprite: Screen
+    :ivar revision: The revision of the sprite when it was painted.
+    :vartype revision: int
+    :ivar x: x-coordinate the sprite was painted at.
+    :vartype x: int
+    :ivar y: y-coordinate the sprite was painted at.
+    :vartype y: int
+    :ivar rect: The pixels of the screen covered by the sprite.
+    :vartype rect: Rect
+    :ivar depth: The depth of the gameobject.
+    :vartype depth: int
+    :ivar still: Number of frames the gameobject was drawn the same in a row.
+    :vartype still: int
+    """
+
+    gameobject: Gameobject
+    sprite: Screen
+    revision: int
+    x: int
+    y: int
+    rect: Rect
+    depth: int
+    still: int = 0
+
+    def same_as(self, other: DrawnSprite) -> bool:
+        """
+        Check if two drawn sprites paint the same pixels.
+        """
+        return (
+            self.sprite is other.sprite
+            and self.revision == other.revision
+            and (self.x, self.y, self.depth) == (other.x, other.y, other.depth)
+        )
+
+
+@dataclass
+class Layer:
+    """
+    Gameobjects of consecutive depth levels, painted together into a single screen.
+
+    :ivar members: The gameobjects in the layer, as they were drawn into it.
+    :vartype members: List[DrawnSprite]
+    :ivar screen: The layer, the size of the compositor's screen.
+    :vartype screen: Screen
+    :ivar rect: The pixels covered by the members.
+    :vartype rect: Rect
+    """
+
+    members: List[DrawnSprite]
+    screen: Screen
+    rect: Rect = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.rect = self.members[0].rect
+        for member in self.members[1:]:
+            self.rect = self.rect.union(member.rect)
+
+    def same_as(self, members: List[DrawnSprite]) -> bool:
+        """
+        Check if the layer holds the given gameobjects, drawn the same.
+        """
+        return len(members) == len(self.members) and all(
+            member.gameobject is cached.gameobject and member.same_as(cached)
+            for member, cached in zip(members, self.members)
+        )
+
+
+class Compositor:
+    """
+    Paints the active sprites of gameobjects onto a screen. The compositor remembers where
+    each gameobject was drawn, and which sprite it showed, so every frame only the regions
+    (dirty rectangles) where a gameobject moved, changed sprite, or appeared or disappeared
+    are cleared and repainted, in depth order. The rest of the screen is left untouched.
+
+    Consecutive depth levels whose gameobjects all stood still for a while are painted
+    into a cached layer, so repainting a region under static scenery (e.g. a background
+    and the decorations on it) paints a single layer instead of every gameobject.
+    A layer is rebuilt once its gameobjects stand still again after one of them changed.
+    """
+
+    def __init__(self, screen: Screen, static_frames: int = 10):
+        """
+        Initialize a compositor painting onto a screen.
+
+        :param screen: The screen to paint onto.
+        :type screen: Screen
+        :param static_frames: Number of frames a gameobject must be drawn the same
+            before it is cached in a layer. Default is 10.
+        :type static_frames: int
+        """
+        self.screen = screen
+        self.static_frames = static_frames
+        # keyed by the id of the gameobjects, in depth order
+        self.__drawn: Dict[int, DrawnSprite] = {}
+        self.__full = True
+        # keyed by the ids of the gameobjects in the layer
+        self.__layers: Dict[Tuple[int, ...], Layer] = {}
+        # screens of dropped layers, reused for new ones
+        self.__free_screens: List[Screen] = []
+
+    def reset(self) -> None:
+        """
+        Forget the last frame, so the next one is painted in full.
+        """
+        self.__drawn = {}
+        self.__full = True
+        self.__layers = {}
+
+    @property
+    def layers(self) -> List[Layer]:
+        """
+        The cached layers used on the last repaint, in depth order.
+        """
+        return list(self.__layers.values())
+
+    @property
+    def sprites(self) -> List[Tuple[Screen, int, int]]:
+        """
+        The sprites painted on the last frame, as (sprite, x, y), in depth order.
+        """
+        return [(drawn.sprite, drawn.x, drawn.y) for drawn in self.__drawn.values()]
+
+    def compose(
+        self,
+        gameobjects: List[Gameobject],
+        clear: Callable[[Rect], None] | None = None,
+        origin: Tuple[int, int] = (0, 0),
+    ) -> List[Rect]:
+        """
+        Paint the gameobjects onto the screen, only repainting the regions that changed
+        since the last frame.
+
+        :param gameobjects: The gameobjects to paint, sorted by depth.
+        :type gameobjects: List[Gameobject]
+        :param clear: Called with each region before it is repainted, e.g. to clear it.
+            Default is None, which paints over the last frame.
+        :type clear: Callable[[Rect], None] | None
+        :param origin: The (x, y) position painted at the top-left corner of the screen,
+            e.g. the position of the camera. Default is (0, 0).
+        :type origin: Tuple[int, int]
+        :return: The regions of the screen that were repainted.
+        :rtype: List[Rect]
+        """
+        screen_rect = Rect(0, 0, self.screen.width, self.screen.height)
+        drawn: Dict[int, DrawnSprite] = {}
+        dirty: List[Rect] = []
+
+        for gameobject in gameobjects:
+
+            # we can't draw gameobjects that don't have any sprites
+            if gameobject.get_sprites() is None or len(gameobject.get_sprites()) == 0:
+                continue
+
+            sprite = gameobject.get_active_sprite()
+            x, y = int(gameobject.x) - origin[0], int(gameobject.y) - origin[1]
+            current = DrawnSprite(
+                gameobject,
+                sprite,
+                sprite.revision,
+                x,
+                y,
+                Rect(x, y, sprite.width, sprite.height).intersection(screen_rect),
+                gameobject.depth,
+            )
+            drawn[id(gameobject)] = current
+
+            # the drawn sprites keep their gameobjects alive, so their ids are not reused
+            previous = self.__drawn.pop(id(gameobject), None)
+            if previous is None:
+                dirty.append(current.rect)
+            elif not current.same_as(previous):
+                dirty.extend((previous.rect, current.rect))
+            else:
+                current.still = previous.still + 1
+
+        # the gameobjects left were removed, or lost their sprites
+        dirty.extend(previous.rect for previous in self.__drawn.values())
+        self.__drawn = drawn
+
+        if self.__full:
+            self.__full = False
+            regions = [screen_rect]
+        else:
+            regions = merge_rects(dirty)
+
+        if not regions:
+            return regions
+
+        painted = self.__layered(list(drawn.values()))
+        for region in regions:
+            if clear is not None:
+                clear(region)
+            for sprite, x, y, rect in painted:
+                if rect.overlaps(region):
+                    self.screen.paint_screen(sprite, x, y, region)
+        return regions
+
+    def __layered(self, drawn: List[DrawnSprite]) -> List[Tuple[Screen, int, int, Rect]]:
+        """
+        Split the drawn gameobjects into cached layers of static depth levels, and
+        gameobjects painted on their own.
+
+        :return: What to paint, in depth order, as (screen, x, y, covered pixels).
+        """
+        painted: List[Tuple[Screen, int, int, Rect]] = []
+        layers: Dict[Tuple[int, ...], Layer] = {}
+        run: List[DrawnSprite] = []
+
+        def end_run() -> None:
+            # a single gameobject is painted just as fast as a layer
+            if len(run) > 1:
+                layer = self.__layer(run)
+                layers[tuple(id(member.gameobject) for member in run)] = layer
+                painted.append((layer.screen, 0, 0, layer.rect))
+            else:
+                painted.extend((member.sprite, member.x, member.y, member.rect) for member in run)
+            run.clear()
+
+        for _, level in groupby(drawn, key=lambda member: member.depth):
+            level = list(level)
+            if all(member.still >= self.static_frames for member in level):
+                run.extend(level)
+            else:
+                end_run()
+                painted.extend(
+                    (member.sprite, member.x, member.y, member.rect) for member in level
+                )
+        end_run()
+
+        # recycle the screens of the layers that are not used anymore
+        for key, layer in self.__layers.items():
+            if layers.get(key) is not layer:
+                self.__free_screens.append(layer.screen)
+        self.__layers = layers
+        return painted
+
+    def __layer(self, members: List[DrawnSprite]) -> Layer:
+        """
+        Get the cached layer of the given gameobjects, painting it if needed.
+        """
+        key = tuple(id(member.gameobject) for member in members)
+        layer = self.__layers.get(key)
+        if layer is not None and layer.same_as(members):
+            return layer
+
+        if self.__free_screens:
+            screen = self.__free_screens.pop()
+            screen.clear()
+        else:
+            screen = Screen(self.screen.width, self.screen.height)
+        for member in members:
+            screen.paint_screen(member.sprite, member.x, member.y)
+        return Layer(list(members), screen)
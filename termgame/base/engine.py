@@ -8,40 +8,124 @@ from __future__ import annotations
 
 import bisect  # For sorting gameobjects by depth.
 import os
-import time
-from typing import Callable, List, Dict, Any
+from concurrent.futures import Future, as_completed
+from typing import Callable, Iterable, List, Dict, Any, Tuple
 
 # for hiding the cursor
 import cursor  # type: ignore
 
+from ..assets import Asset, preload
+from ..graphics.pipeline import RenderPipeline
+from ..graphics.process_renderer import ProcessRenderer
+from ..graphics.rect import Rect
+from ..graphics.renderer import Renderer
 from ..graphics.screen import Screen
+from .camera import Camera
+from .compositor import Compositor
 from .gameobject import Gameobject
+from .overload import OverloadPolicy
+from .scheduler import FrameScheduler
+from .spatial_grid import SpatialGrid
+from ..logger import Logger
 from ..settings import Settings
 
 
 class Engine:
-    def __init__(self, width: int, height: int, gameobjects: List[Gameobject] = None):
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        gameobjects: List[Gameobject] = None,
+        clear_color: Tuple[int, int, int] | None = None,
+        auto_clear: bool = True,
+        world_size: Tuple[int, int] | None = None,
+        overload_policy: OverloadPolicy | None = None,
+    ):
+        """
+        :param width: Screen width.
+        :param height: Screen height.
+        :param gameobjects: Gameobjects to add to the engine.
+        :param clear_color: Color the screen is cleared to between frames.
+            None clears to transparent (black) pixels.
+        :param auto_clear: Whether to clear the screen between frames. Turn it off for
+            scenes that paint a full-screen background every frame anyway.
+        :param world_size: (width, height) of the world the gameobjects live in, which
+            can be larger than the screen. The camera shows the part of it on the screen.
+            Default is None, which makes the world the size of the screen.
+        :param overload_policy: What to drop when frames take longer than their budget,
+            see OverloadPolicy. Default is None, which renders every frame at full quality.
+        """
         self.width = width
         self.height = height
+        self.world_width, self.world_height = world_size or (width, height)
+        self.clear_color = clear_color
+        self.auto_clear = auto_clear
+        # allocated once, and reset in place every frame
         self.screen = Screen(self.width, self.height)
+        self.renderer = Renderer(
+            self.width,
+            self.height,
+            Settings.render_settings.synchronized_output,
+            Settings.render_settings.mode,
+            Settings.render_settings.color_depth,
+            Settings.render_settings.dither,
+        )
+        # encodes and writes frames on a writer thread, or in other processes, if enabled
+        self.pipeline: RenderPipeline | ProcessRenderer | None = None
+        if Settings.render_settings.render_processes > 0:
+            self.pipeline = ProcessRenderer(
+                self.width,
+                self.height,
+                Settings.render_settings.synchronized_output,
+                Settings.render_settings.mode,
+                Settings.render_settings.color_depth,
+                Settings.render_settings.dither,
+                Settings.render_settings.render_processes,
+            )
+        elif Settings.render_settings.pipelined:
+            self.pipeline = RenderPipeline(self.renderer)
+        # repaints the regions of the screen where gameobjects changed
+        self.compositor = Compositor(self.screen)
+        # the part of the world shown on the screen, kept inside the world
+        self.camera = Camera(width, height, Rect(0, 0, self.world_width, self.world_height))
+        # finds the gameobjects in the camera's viewport
+        self.spatial_grid = SpatialGrid()
+        # paces the game loop, and measures the time between frames
+        self.scheduler = FrameScheduler(Settings.runtime_settings.fps)
+        self.overload_policy = overload_policy
         self.state: Dict[Any, Any] = {}
         self.__gameobjects: List[Gameobject] = []
+        self.__loading_assets: List[Future[Screen]] = []
+        self.__on_loading_progress: Callable[[int, int], None] = self.__show_loading_progress
         if gameobjects is not None:
             for gameobject in gameobjects:
                 self.add_gameobject(gameobject)
 
-    def clear(self) -> None:
+    def clear(self, region: Rect | None = None) -> None:
         """
-        Clear the screen without any blinking.
+        Clear the screen (or a region of it) without any blinking. The terminal itself is
+        not cleared, the renderer overwrites the pixels that changed on the next frame.
         """
-        print(f"\033[{self.height}A\033[2K", end="")
-        self.screen.clear()
+        if self.clear_color is None:
+            self.screen.clear(region)
+        else:
+            self.screen.fill(self.clear_color, region)
 
     def add_gameobject(self, gameobject: Gameobject) -> None:
         """
         Add a gameobject to the engine.
         """
         bisect.insort(self.__gameobjects, gameobject, key=lambda go: go.depth)
+        self.spatial_grid.add(gameobject)
+
+    def remove_gameobject(self, gameobject: Gameobject) -> None:
+        """
+        Remove a gameobject from the engine.
+        """
+        # by identity, as gameobjects compare equal
+        index = next(i for i, go in enumerate(self.__gameobjects) if go is gameobject)
+        del self.__gameobjects[index]
+        self.spatial_grid.remove(gameobject)
 
     def get_gameobjects(self, names: str | List[str] = "") -> List[Gameobject]:
         """
@@ -54,6 +138,57 @@ class Engine:
             names = [names]
         return [go for go in self.gameobjects if go.name in names]
 
+    def preload(
+        self,
+        assets: Iterable[Asset | str],
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> List[Future[Screen]]:
+        """
+        Start loading sprites in the background (see assets.preload). The engine waits for
+        them before starting the game, showing the loading progress instead of the
+        wait_for_start prompt (see wait_for_assets).
+
+        :param assets: The images to load, as Assets or paths.
+        :type assets: Iterable[Asset | str]
+        :param on_progress: Called with (number of loaded assets, number of assets) while
+            the engine waits for the assets. Default is None, which keeps the callback given
+            before, or prints the progress.
+        :type on_progress: Callable[[int, int], None] | None
+        :return: A future for each asset, resolving to its sprite.
+        :rtype: List[Future[Screen]]
+        """
+        if on_progress is not None:
+            self.__on_loading_progress = on_progress
+        futures = preload(assets)
+        self.__loading_assets.extend(futures)
+        return futures
+
+    @staticmethod
+    def __show_loading_progress(loaded: int, total: int) -> None:
+        """Print the loading progress, on a single line."""
+        print(
+            f"\rLoading assets... {loaded}/{total}",
+            end="\n" if loaded == total else "",
+            flush=True,
+        )
+
+    def wait_for_assets(self) -> bool:
+        """
+        Wait for the preloaded assets, reporting the progress (see preload) as they finish.
+        Called by run, once the terminal is cleared, so assets loaded before are reported
+        too.
+
+        :return: Whether any assets were preloaded.
+        :rtype: bool
+        """
+        total = len(self.__loading_assets)
+        for loaded, future in enumerate(as_completed(self.__loading_assets), start=1):
+            # raise any error that happened while loading
+            future.result()
+            self.__on_loading_progress(loaded, total)
+        self.__loading_assets = []
+        return total > 0
+
     @property
     def gameobjects(self) -> List[Gameobject]:
         return self.__gameobjects
@@ -64,7 +199,16 @@ class Engine:
 
     @property
     def elapsed_time(self) -> float:
-        return time.time() - self.__starting_time
+        """Seconds since the game started."""
+        return self.scheduler.elapsed
+
+    @property
+    def dt(self) -> float:
+        """
+        Seconds since the previous frame. Use it in on_update to move gameobjects
+        at a speed that does not depend on the frame rate.
+        """
+        return self.scheduler.dt
 
     def run(self) -> None:
         """
@@ -78,24 +222,38 @@ class Engine:
         runtime_injection: Callable[[Any], None] | None,
     ) -> None:
         self.__frame: int = 0
-        self.__starting_time: float = time.time()
 
         # clear the screen of anything before we start
         cursor.hide()
         os.system("cls")
 
-        if Settings.runtime_settings.wait_for_start:
+        # the loading progress replaces the prompt
+        preloaded = self.wait_for_assets()
+
+        if Settings.runtime_settings.wait_for_start and not preloaded:
             _ = input(
                 f"Press any key to start the game at {Settings.runtime_settings.fps} fps."
                 f" Recommended font size is {Settings.render_settings.fontsize}pt..."
             )
 
+        # the first frame is drawn in full, on a cleared screen
+        self.renderer.reset()
+        self.compositor.reset()
+        self.clear()
+
         # initialize the gameobjects
         for gameobject in self.gameobjects:
             gameobject.on_start(self)
 
         # start game loop
+        self.scheduler.fps = Settings.runtime_settings.fps
+        self.scheduler.start()
+        if self.overload_policy is not None:
+            self.overload_policy.start(self.renderer.encoder.color_depth)
+        if self.pipeline is not None:
+            self.pipeline.start()
         while True:
+            self.scheduler.begin_frame()
 
             if Settings.runtime_settings.headless:
                 print(f"Frame: {self.__frame}")
@@ -110,25 +268,49 @@ class Engine:
             if runtime_injection:
                 runtime_injection(self)
 
-            if not Settings.runtime_settings.headless:
-
-                # after updating the gameobjects, redraw them
-                for gameobject in self.gameobjects:
-
-                    # we can't draw gameobjects that don't have any sprites
-                    if gameobject.get_sprites() is None or len(gameobject.get_sprites()) == 0:
-                        continue
-
-                    self.screen.paint_screen(
-                        gameobject.get_active_sprite(), gameobject.x, gameobject.y
-                    )
-
-                self.screen.render()
+            # under load, the overload policy may skip drawing this frame
+            render = not Settings.runtime_settings.headless and (
+                self.overload_policy is None or self.overload_policy.should_render()
+            )
+            if render:
 
-            time.sleep(1 / Settings.runtime_settings.fps)
+                # after updating the gameobjects, redraw the ones that moved or changed sprite.
+                # Only the gameobjects in the camera's viewport are drawn. The renderer only
+                # looks at the repainted regions, and reuses the encoded rows of sprites
+                # drawn unaltered. In pipelined mode, the frame is rendered on the writer
+                # thread (or in the renderer processes) while the next one is simulated.
+                viewport = self.camera.viewport
+                self.spatial_grid.update()
+                regions = self.compositor.compose(
+                    self.spatial_grid.query(viewport),
+                    self.clear if self.auto_clear else None,
+                    origin=(viewport.x, viewport.y),
+                )
+                if self.pipeline is not None:
+                    self.pipeline.submit(self.screen, self.compositor.sprites, regions)
+                else:
+                    self.renderer.render(self.screen, self.compositor.sprites, regions)
 
-            if not Settings.runtime_settings.headless:
-                self.clear()
+            # sleep for what is left of the frame's time budget
+            on_time = self.scheduler.wait()
+            if not on_time:
+                Logger.debug(
+                    "Frame %s missed its deadline (%.1f ms for a %.1f ms budget)",
+                    self.__frame,
+                    self.scheduler.frame_time * 1000,
+                    self.scheduler.period * 1000,
+                )
+            if self.overload_policy is not None and not Settings.runtime_settings.headless:
+                frame_time = self.scheduler.frame_time
+                if self.pipeline is not None:
+                    # frames are encoded and written by the pipeline, in parallel with
+                    # the game: the slower of the two sets the load
+                    frame_time = max(frame_time, self.pipeline.render_time)
+                self.overload_policy.frame_done(render, frame_time, self.scheduler.period, on_time)
+                if self.pipeline is not None:
+                    self.pipeline.color_depth = self.overload_policy.color_depth
+                else:
+                    self.renderer.set_color_depth(self.overload_policy.color_depth)
 
             # update internal counters
             self.__frame += 1
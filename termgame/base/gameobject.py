@@ -6,30 +6,264 @@ Date: 10/23/2022
 
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
+from types import MethodType
 from typing import Callable, List, Dict, Any
+from ..settings import Settings
 from ..util import clamp
 
+# How clips play: "loop" restarts at the end, "once" stops on the last frame,
+# and "pingpong" plays back and forth.
+ANIMATION_MODES = ("loop", "once", "pingpong")
+
+# Name of the clip holding the sprites (or meshes) given to the gameobject.
+DEFAULT_CLIP = "default"
+
+# Slack for rounding errors when durations are in seconds.
+_EPSILON = 1e-9
+
+
+@dataclass
+class AnimationClip:
+    """
+    A sequence of sprites (or meshes), each shown for a given duration.
+
+    :ivar frames: The sprites or meshes of the clip.
+    :vartype frames: List
+    :ivar durations: How long each frame is shown, either a single duration for every frame
+        or one per frame. In ticks (engine frames), or in seconds if seconds is True.
+        Default is 1 tick.
+    :vartype durations: float | List[float]
+    :ivar mode: One of ANIMATION_MODES. Default is "loop".
+    :vartype mode: str
+    :ivar seconds: Whether the durations are in seconds instead of ticks.
+    :vartype seconds: bool
+    """
+
+    frames: List
+    durations: float | List[float] = 1
+    mode: str = "loop"
+    seconds: bool = False
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.frames, list):
+            raise TypeError(f"AnimationClip got type {type(self.frames)}. Expected list.")
+        if self.mode not in ANIMATION_MODES:
+            raise ValueError(
+                f"Invalid animation mode: {self.mode}. Must be one of {ANIMATION_MODES}"
+            )
+
+        durations = self.durations if isinstance(self.durations, list) else [self.durations]
+        if isinstance(self.durations, list) and len(self.durations) != len(self.frames):
+            raise ValueError(
+                f"Got {len(self.durations)} durations for {len(self.frames)} frames."
+                " Give one duration per frame, or a single duration."
+            )
+        if any(duration <= 0 for duration in durations):
+            raise ValueError("Frame durations must be positive")
+
+    def duration(self, index: int) -> float:
+        """
+        How long the frame at the given index is shown.
+
+        :param index: Index of the frame.
+        :type index: int
+        :return: The duration, in ticks or seconds.
+        :rtype: float
+        """
+        if isinstance(self.durations, list):
+            return self.durations[index]
+        return self.durations
+
+    @property
+    def total_duration(self) -> float:
+        """Duration of a single play of the clip, in ticks or seconds."""
+        if isinstance(self.durations, list):
+            return sum(self.durations)
+        return self.durations * len(self.frames)
+
 
 class GameobjectAnimator:
-    """Class for animating gameobjects by looping through a list of sprites or meshes."""
+    """
+    Class for animating gameobjects by playing clips of sprites or meshes.
 
-    def __init__(self, elements: List):
-        if not isinstance(elements, list):
-            raise TypeError(f"GameobjectAnimator got type {type(elements)}. Expected list.")
+    The animator keeps its own playback state (active frame, time left on it, and direction),
+    so the active frame is known without any lookup, and advancing costs O(1) per frame shown.
+    Copies of an animator (see copy) share its clips until one of them changes them.
+    """
 
-        self.elements = elements
+    def __init__(self, elements: List):
+        self.clips: Dict[str, AnimationClip] = {DEFAULT_CLIP: AnimationClip(elements)}
+        self.clip_name = DEFAULT_CLIP
         self.active_el_idx: int | None = None
+        # time left on the active frame, in the unit of the clip
+        self.__remaining: float = 0
+        # 1 forwards, -1 backwards (ping-pong clips)
+        self.__direction = 1
+        # the engine frame the animator was last updated on
+        self.__frame = 0
+        # whether the clips dict is shared with copies of the animator
+        self.__shared_clips = False
 
-    def start(self) -> None:
-        """Start the animation."""
-        if self.elements != []:
-            self.active_el_idx = 0
+    @property
+    def clip(self) -> AnimationClip:
+        """The clip being played."""
+        return self.clips[self.clip_name]
 
-    def next(self, frame: int) -> None:
-        """Move the animation to the next frame in the list of elements."""
+    @property
+    def elements(self) -> List:
+        """The sprites or meshes of the clip being played."""
+        return self.clip.frames
+
+    @property
+    def finished(self) -> bool:
+        """Whether a clip played once has shown its last frame for its whole duration."""
+        return (
+            self.clip.mode == "once"
+            and self.active_el_idx == len(self.elements) - 1
+            and self.__remaining <= _EPSILON
+        )
+
+    def copy(self) -> GameobjectAnimator:
+        """
+        Create a copy of the animator with its own playback state. The copy shares the clips
+        (and their sprites) of this animator, until either of them adds or replaces a clip.
+
+        :return: The copied animator.
+        :rtype: GameobjectAnimator
+        """
+        animator = copy.copy(self)
+        self.__shared_clips = animator.__shared_clips = True
+        return animator
+
+    def __own_clips(self) -> None:
+        """
+        Copy the clips dict before changing it, if it is shared with other animators.
+        """
+        if self.__shared_clips:
+            self.clips = dict(self.clips)
+            self.__shared_clips = False
+
+    def add_clip(self, name: str, clip: AnimationClip) -> None:
+        """
+        Add (or replace) a named clip. Replacing the clip being played restarts it.
+        """
+        self.__own_clips()
+        self.clips[name] = clip
+        if name == self.clip_name and self.active_el_idx is not None:
+            self.start()
+
+    def set_elements(self, elements: List) -> None:
+        """
+        Play the given sprites or meshes as the default clip. Setting the sprites that are
+        already playing does nothing, so this can be called every frame.
+        """
+        default = self.clips[DEFAULT_CLIP]
+        if elements is default.frames and self.clip_name == DEFAULT_CLIP:
+            return
+
+        if elements is not default.frames:
+            self.__own_clips()
+            durations = default.durations if not isinstance(default.durations, list) else 1
+            self.clips[DEFAULT_CLIP] = AnimationClip(
+                elements, durations, default.mode, default.seconds
+            )
+        self.play(DEFAULT_CLIP, restart=True)
+
+    def play(self, name: str, restart: bool = False) -> None:
+        """
+        Switch to a named clip. Playing the clip already being played does nothing,
+        unless restart is True.
+        """
+        if name not in self.clips:
+            raise ValueError(f"Unknown animation: {name}. Must be one of {list(self.clips)}")
+        if name == self.clip_name and not restart and self.active_el_idx is not None:
+            return
+
+        self.clip_name = name
+        self.start()
+
+    def start(self, frame: int | None = None) -> None:
+        """
+        Start the animation.
+
+        :param frame: The engine frame the animation starts on. Default is None, which keeps
+            counting ticks from the last update (e.g. when switching clips during the game).
+        :type frame: int | None
+        """
+        if frame is not None:
+            self.__frame = frame
         if self.elements != []:
-            self.active_el_idx = frame % len(self.elements)
+            self.active_el_idx = 0
+            self.__remaining = self.clip.duration(0)
+            self.__direction = 1
+        else:
+            self.active_el_idx = None
+
+    def next(self, frame: int, dt: float | None = None) -> None:
+        """
+        Move the animation to the given engine frame.
+
+        :param frame: The engine frame. The animation advances one tick per engine frame
+            since the last update.
+        :type frame: int
+        :param dt: Time since the last update in seconds (see Engine.dt), used by clips
+            with durations in seconds. Defaults to a tick at the configured fps.
+        :type dt: float | None
+        """
+        # a frame before the last one means the engine started over
+        ticks = frame - self.__frame if frame >= self.__frame else 1
+        self.__frame = frame
+        if self.active_el_idx is None:
+            return
+
+        clip = self.clip
+        if not clip.seconds:
+            self.advance(ticks)
+        else:
+            self.advance(dt if dt is not None else ticks / Settings.runtime_settings.fps)
+
+    def advance(self, amount: float) -> None:
+        """
+        Advance the animation by an amount of time, in the unit of the clip (ticks or seconds).
+        """
+        if self.active_el_idx is None:
+            return
+
+        clip = self.clip
+        # skip whole loops at once
+        if clip.mode == "loop" and amount >= clip.total_duration:
+            amount %= clip.total_duration
+
+        self.__remaining -= amount
+        while self.__remaining <= _EPSILON:
+            if not self.__step():
+                self.__remaining = 0
+                return
+            self.__remaining += clip.duration(self.active_el_idx)
+
+    def __step(self) -> bool:
+        """
+        Move to the next frame of the clip. Returns False if the clip has ended.
+        """
+        last = len(self.elements) - 1
+        index = self.active_el_idx
+        mode = self.clip.mode
+
+        if mode == "loop":
+            index = index + 1 if index < last else 0
+        elif mode == "once":
+            if index == last:
+                return False
+            index += 1
+        else:
+            if not 0 <= index + self.__direction <= last:
+                self.__direction = -self.__direction
+            index = min(max(index + self.__direction, 0), last)
+
+        self.active_el_idx = index
+        return True
 
     def get_active_element(self) -> Any:
         if self.active_el_idx is None:
@@ -50,48 +284,128 @@ class Gameobject:
         on_start: Callable = lambda engine: None,
         on_update: Callable = lambda frame, engine: None,
         name: str = "",
+        clamp_to_world: bool = True,
     ):
-        self.x = x
-        self.y = y
+        # called with the gameobject when its bounding box changes (see add_bounds_listener)
+        self.__bounds_listeners: List[Callable[[Gameobject], None]] = []
+        self.__x = x
+        self.__y = y
         self.depth = depth
         self.update_order = update_order
+        # whether to keep the gameobject inside the engine's world every frame
+        self.clamp_to_world = clamp_to_world
 
         # make sure the developer doesn't try to use both sprites and meshes.
         if (sprites is not None) and (meshes is not None):
             raise ValueError("Cannot use both sprites and meshes.")
         self.__animator = GameobjectAnimator((sprites or meshes) or [])
+        self.__size = (self.width, self.height)
 
         self.state: Dict[Any, Any] = {}
         self.__name = name
 
-        def internal_on_update(frame: int, engine):
-            """Some things we want to do every frame on top of what the developer wants."""
-
-            # update the active sprite/mesh.
-            self.__animator.next(frame)
-
-            # this is a hack to make sure the object always stays within the screen.
-            # TODO: fix this.
-            self.x = clamp(self.x, 0, engine.width - self.width)
-            self.y = clamp(self.y, 0, engine.height - self.height)
+        # the developer's callbacks, called by on_start and on_update
+        self.__on_start = on_start
+        self.__on_update = on_update
+        self.on_update = self.__internal_on_update
+        self.on_start = self.__internal_on_start
+
+    def __internal_on_update(self, frame: int, engine) -> None:
+        """Some things we want to do every frame on top of what the developer wants."""
+
+        # update the active sprite/mesh.
+        self.__animator.next(frame, engine.dt)
+        self.__check_size()
+
+        # keep the object within the world, unless it may leave it.
+        if self.clamp_to_world:
+            self.x = clamp(self.x, 0, engine.world_width - self.width)
+            self.y = clamp(self.y, 0, engine.world_height - self.height)
+
+        # call the developer's on_update function.
+        self.__on_update(frame, engine)
+
+    def __internal_on_start(self, engine) -> None:
+        """Some things we want to do when the gameobject is added to the engine."""
+
+        # start the animator, on the first frame of the engine.
+        self.__animator.start(0)
+        self.__check_size()
+
+        self.__on_start(engine)
+
+    def clone(self, **attributes) -> Gameobject:
+        """
+        Create an instance of the gameobject, using it as a prefab. The instance shares the
+        sprites (or meshes) and animations of the gameobject by reference, and has its own
+        position, state and playback state. Adding or replacing animations on either of them
+        does not affect the other, and sprites can be shared safely by freezing them
+        (see graphics.sprite_pool.SpritePool).
+
+        Callbacks that are methods of the gameobject are called on the instance instead.
+
+        :param attributes: Attributes to set on the instance, e.g. x and y.
+        :return: The instance.
+        :rtype: Gameobject
+        """
+        instance = copy.copy(self)
+        for attribute, value in list(vars(instance).items()):
+            if isinstance(value, MethodType) and value.__self__ is self:
+                setattr(instance, attribute, MethodType(value.__func__, instance))
+        instance.__animator = self.__animator.copy()
+        instance.__bounds_listeners = []
+        instance.state = dict(self.state)
+        for attribute, value in attributes.items():
+            setattr(instance, attribute, value)
+        return instance
 
-            # call the developer's on_update function.
-            on_update(frame, engine)
-
-        def internal_on_start(engine):
-            """Some things we want to do when the gameobject is added to the engine."""
-
-            # start the animator.
-            self.__animator.start()
+    @property
+    def name(self) -> str:
+        return self.__name
 
-            on_start(engine)
+    @property
+    def x(self) -> int | float:
+        return self.__x
 
-        self.on_update = internal_on_update
-        self.on_start = internal_on_start
+    @x.setter
+    def x(self, x: int | float) -> None:
+        if x != self.__x:
+            self.__x = x
+            self.__notify_bounds()
 
     @property
-    def name(self) -> str:
-        return self.__name
+    def y(self) -> int | float:
+        return self.__y
+
+    @y.setter
+    def y(self, y: int | float) -> None:
+        if y != self.__y:
+            self.__y = y
+            self.__notify_bounds()
+
+    def add_bounds_listener(self, listener: Callable[[Gameobject], None]) -> None:
+        """
+        Call a function with the gameobject whenever its bounding box changes, i.e. it moves
+        or its active sprite (or mesh) changes size (see SpatialGrid).
+        """
+        self.__bounds_listeners.append(listener)
+
+    def remove_bounds_listener(self, listener: Callable[[Gameobject], None]) -> None:
+        """
+        Stop calling a function added with add_bounds_listener.
+        """
+        self.__bounds_listeners.remove(listener)
+
+    def __notify_bounds(self) -> None:
+        for listener in self.__bounds_listeners:
+            listener(self)
+
+    def __check_size(self) -> None:
+        """Notify the listeners if the active sprite (or mesh) changed size."""
+        size = (self.width, self.height)
+        if size != self.__size:
+            self.__size = size
+            self.__notify_bounds()
 
     @property
     def has_physics(self) -> bool:
@@ -116,8 +430,38 @@ class Gameobject:
         return self.__animator.elements
 
     def set_sprites(self, sprites) -> None:
-        self.__animator = GameobjectAnimator(sprites)
-        self.__animator.start()
+        """
+        Play the given sprites as the default animation.
+        Setting the sprites that are already playing does nothing.
+        """
+        self.__animator.set_elements(sprites)
+        self.__check_size()
+
+    @property
+    def animator(self) -> GameobjectAnimator:
+        return self.__animator
+
+    def add_animation(
+        self,
+        name: str,
+        frames: List,
+        durations: float | List[float] = 1,
+        mode: str = "loop",
+        seconds: bool = False,
+    ) -> None:
+        """
+        Add a named animation, to switch to with play (see AnimationClip).
+        """
+        self.__animator.add_clip(name, AnimationClip(frames, durations, mode, seconds))
+        self.__check_size()
+
+    def play(self, name: str, restart: bool = False) -> None:
+        """
+        Switch to a named animation. Playing the animation already playing does nothing,
+        unless restart is True.
+        """
+        self.__animator.play(name, restart)
+        self.__check_size()
 
     def get_active_sprite(self) -> Any:
         """Access the active sprite (2D) of the gameobject, if any."""
@@ -0,0 +1,197 @@
+"""
+Description: Keep the game real-time when frames take longer than their budget.
+Author: Gregory Glatzer
+Date: 4/30/2023
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+from ..graphics.quantize import COLOR_DEPTHS
+
+# Events passed to the callback of an OverloadPolicy.
+OVERLOAD_EVENTS = ("skip", "degrade", "restore")
+
+
+@dataclass
+class OverloadStats:
+    """
+    What an overload policy decided so far.
+
+    :ivar frames: Number of frames seen.
+    :vartype frames: int
+    :ivar rendered: Number of frames rendered.
+    :vartype rendered: int
+    :ivar skipped: Number of frames updated but not rendered.
+    :vartype skipped: int
+    :ivar degraded: Number of times the quality was lowered.
+    :vartype degraded: int
+    :ivar restored: Number of times the quality was raised back.
+    :vartype restored: int
+    :ivar level: The current quality level, 0 being the best.
+    :vartype level: int
+    :ivar load: Average time taken by rendered frames, as a fraction of the frame budget.
+    :vartype load: float
+    """
+
+    frames: int = 0
+    rendered: int = 0
+    skipped: int = 0
+    degraded: int = 0
+    restored: int = 0
+    level: int = 0
+    load: float = 0.0
+
+
+class OverloadPolicy:
+    """
+    Decides what to drop when frames take longer than their budget, so the game logic
+    (on_update and physics) keeps running in real time:
+
+    - While the game is behind schedule (a frame missed its deadline), rendering is skipped
+      (up to max_skipped frames in a row), and the skipped frames are only updated.
+    - When rendered frames keep overrunning on average, the output quality is lowered
+      one level (see color_depths), and raised back once there is headroom again.
+
+    The engine asks should_render before drawing each frame, and reports how long the
+    frame took with frame_done.
+    """
+
+    def __init__(
+        self,
+        max_skipped: int = 2,
+        color_depths: Sequence[str] | None = None,
+        degrade_load: float = 1.0,
+        restore_load: float = 0.6,
+        cooldown: int = 30,
+        smoothing: float = 0.1,
+        on_change: Callable[[str, OverloadStats], None] | None = None,
+    ):
+        """
+        Initialize an overload policy.
+
+        :param max_skipped: Maximum number of frames in a row that are not rendered.
+            0 never skips rendering. Default is 2.
+        :type max_skipped: int
+        :param color_depths: The color depth of each quality level, from best to worst.
+            Default is None, which uses the color depth the game starts with (see start)
+            and the lower ones.
+        :type color_depths: Sequence[str] | None
+        :param degrade_load: Average load (see OverloadStats.load) above which the quality
+            is lowered. Default is 1.0, i.e. rendered frames overrun their budget.
+        :type degrade_load: float
+        :param restore_load: Average load below which the quality is raised back.
+            Default is 0.6.
+        :type restore_load: float
+        :param cooldown: Minimum number of rendered frames between two quality changes,
+            so the new quality is measured before deciding again. Default is 30.
+        :type cooldown: int
+        :param smoothing: Weight of the last rendered frame in the average load.
+            Default is 0.1.
+        :type smoothing: float
+        :param on_change: Called with one of OVERLOAD_EVENTS and the stats whenever
+            a frame is skipped or the quality changes. Default is None.
+        :type on_change: Callable[[str, OverloadStats], None] | None
+        """
+        if color_depths is not None and (
+            not color_depths or any(depth not in COLOR_DEPTHS for depth in color_depths)
+        ):
+            raise ValueError(f"Color depths must be some of {COLOR_DEPTHS}. Got {color_depths}")
+        if restore_load >= degrade_load:
+            raise ValueError("restore_load must be lower than degrade_load")
+
+        self.max_skipped = max_skipped
+        self.__color_depths = None if color_depths is None else list(color_depths)
+        self.color_depths = self.__color_depths or list(COLOR_DEPTHS)
+        self.degrade_load = degrade_load
+        self.restore_load = restore_load
+        self.cooldown = cooldown
+        self.smoothing = smoothing
+        self.on_change = on_change
+        self.stats = OverloadStats()
+        self.__skipped_in_row = 0
+        self.__behind = False
+        # rendered frames since the last quality change
+        self.__since_change = 0
+
+    def start(self, color_depth: str) -> None:
+        """
+        Start over at the best quality, e.g. when the game starts.
+
+        :param color_depth: The color depth the game is configured with, the best quality
+            unless color depths were given.
+        :type color_depth: str
+        """
+        if self.__color_depths is None:
+            self.color_depths = list(COLOR_DEPTHS[COLOR_DEPTHS.index(color_depth) :])
+        self.stats = OverloadStats()
+        self.__skipped_in_row = 0
+        self.__behind = False
+        self.__since_change = 0
+
+    @property
+    def color_depth(self) -> str:
+        """The color depth of the current quality level."""
+        return self.color_depths[self.stats.level]
+
+    def should_render(self) -> bool:
+        """
+        Whether to render the next frame. Frames are skipped after a frame missed
+        its deadline, unless max_skipped frames in a row were already skipped.
+        """
+        return not self.__behind or self.__skipped_in_row >= self.max_skipped
+
+    def frame_done(
+        self, rendered: bool, frame_time: float, budget: float, on_time: bool = True
+    ) -> None:
+        """
+        Report how long a frame took.
+
+        :param rendered: Whether the frame was rendered.
+        :type rendered: bool
+        :param frame_time: Seconds spent on the frame (updating it, and rendering it
+            if it was rendered).
+        :type frame_time: float
+        :param budget: Seconds a frame may take at the target frame rate.
+        :type budget: float
+        :param on_time: Whether the frame finished before its deadline (see
+            FrameScheduler.wait). Default is True.
+        :type on_time: bool
+        """
+        stats = self.stats
+        stats.frames += 1
+        load = frame_time / budget
+        self.__behind = not on_time
+
+        if not rendered:
+            stats.skipped += 1
+            self.__skipped_in_row += 1
+            self.__notify("skip")
+            return
+
+        stats.rendered += 1
+        self.__skipped_in_row = 0
+        self.__since_change += 1
+        if stats.rendered == 1:
+            stats.load = load
+        else:
+            stats.load += self.smoothing * (load - stats.load)
+
+        if self.__since_change < self.cooldown:
+            return
+        if stats.load > self.degrade_load and stats.level < len(self.color_depths) - 1:
+            stats.level += 1
+            stats.degraded += 1
+            self.__since_change = 0
+            self.__notify("degrade")
+        elif stats.load < self.restore_load and stats.level > 0:
+            stats.level -= 1
+            stats.restored += 1
+            self.__since_change = 0
+            self.__notify("restore")
+
+    def __notify(self, event: str) -> None:
+        if self.on_change is not None:
+            self.on_change(event, self.stats)
@@ -4,6 +4,8 @@ Author: Gregory Glatzer
 Date: 12/12/2022
 """
 
+from __future__ import annotations
+
 from typing import List, cast
 
 import pymunk
@@ -22,19 +24,38 @@ class PhysicsEngine(Engine):
         width: int,
         height: int,
         gravity: tuple[float, float] = (0, 98.1),
+        max_steps: int | None = None,
+        interpolate: bool = False,
         **engine_kwargs,
     ):
         """A wrapper around the base engine to add physics with pymunk.
 
+        The simulation advances by the real time elapsed between frames, in fixed steps of
+        1 / (fps * ppf) seconds, so it runs at the same speed however long frames take.
+        Time left over that does not fill a step is carried over to the next frame.
+
         Args:
             width (int): Screen Width
             height (int): Screen Height
             gravity (tuple[int, int], optional): The gravity for the physics simulation.
                 Use 98.1, not 9.8. Defaults to (0, 98.1).
+            max_steps (int, optional): Maximum number of steps per frame. When frames take
+                too long to catch up with, the simulation slows down instead of taking ever
+                more steps per frame. Must be at least 1. Defaults to 4 * ppf.
+            interpolate (bool, optional): Whether to draw physics gameobjects between
+                their last two simulated positions, by the fraction of a step carried over.
+                Smoother motion, a step behind the simulation. Defaults to False.
         """
 
+        if max_steps is not None and max_steps < 1:
+            raise ValueError(f"max_steps must be at least 1. Got {max_steps}")
         self.__space = pymunk.Space()
         self.__space.gravity = gravity
+        self.max_steps = max_steps
+        self.interpolate = interpolate
+        # simulated time owed to the simulation, less than a step after each frame
+        self.__accumulator = 0.0
+        self.__alpha = 1.0
         super().__init__(width, height, **engine_kwargs)
 
     def add_gameobject(self, gameobject: Gameobject) -> None:
@@ -64,20 +85,69 @@ class PhysicsEngine(Engine):
         else:
             self.__space.add(gameobject.rb)
 
+    def remove_gameobject(self, gameobject: Gameobject) -> None:
+        """
+        Remove a gameobject from the engine, and its rigidbody from the physics space.
+        """
+        super().remove_gameobject(gameobject)
+        self.__space.remove(gameobject.rb, *gameobject.rb.shapes)
+
     @property
     def space(self) -> pymunk.Space:
         """The pymunk space for 2d physics."""
         return self.__space
 
+    @property
+    def step_time(self) -> float:
+        """Seconds simulated by each physics step."""
+        return 1 / (Settings.runtime_settings.fps * Settings.runtime_settings.ppf)
+
+    @property
+    def interpolation_alpha(self) -> float:
+        """
+        How far between their last two simulated positions physics gameobjects are drawn,
+        from 0 to 1. Always 1 (the last position) unless interpolate is True.
+        """
+        return self.__alpha
+
+    def step_physics(self, dt: float) -> int:
+        """
+        Advance the simulation by dt seconds, in fixed steps (see step_time).
+
+        :param dt: Seconds of real time to simulate.
+        :type dt: float
+        :return: The number of steps taken.
+        :rtype: int
+        """
+        step_time = self.step_time
+        max_steps = self.max_steps
+        if max_steps is None:
+            max_steps = 4 * Settings.runtime_settings.ppf
+        self.__accumulator += dt
+
+        steps = min(int(self.__accumulator / step_time), max_steps)
+        for step in range(steps):
+            # remember the positions before the last step, to interpolate from
+            if self.interpolate and step == steps - 1:
+                for gameobject in cast(List[PhysicsGameobject], self.gameobjects):
+                    gameobject._save_previous_position()
+            self.__space.step(step_time)
+        self.__accumulator -= steps * step_time
+
+        if steps == max_steps and self.__accumulator >= step_time:
+            Logger.debug("Physics fell %.1f ms behind, dropping it", self.__accumulator * 1000)
+            self.__accumulator %= step_time
+
+        self.__alpha = self.__accumulator / step_time if self.interpolate else 1.0
+        return steps
+
     def run(self) -> None:
         def runtime_injection(self: PhysicsEngine):
             """This function is injected into the base engine's run function.
             It is called every frame.
             """
 
-            ppf = Settings.runtime_settings.ppf
-            for _ in range(ppf):
-                self.space.step(1 / (Settings.runtime_settings.fps * ppf))
+            self.step_physics(self.dt)
 
             gos_in_call_order = sorted(
                 cast(List[PhysicsGameobject], self.gameobjects),
@@ -24,7 +24,10 @@ class PhysicsGameobject(Gameobject):
             body_type=pymunk.Body.STATIC if static_body else pymunk.Body.DYNAMIC
         )
         self.__rigidbody.position = (self.x, self.y)
+        # position of the rigidbody before the last physics step, to interpolate from
+        self.__previous_position: pymunk.Vec2d | None = None
 
+        self.__velocity_func: Callable | None = None
         if max_velocity is not None:
 
             def limit_velocity(body, gravity, damping, dt):
@@ -34,39 +37,47 @@ class PhysicsGameobject(Gameobject):
                     scale = max_velocity / body_length
                     body.velocity = body.velocity * scale
 
+            self.__velocity_func = limit_velocity
             self.__rigidbody.velocity_func = limit_velocity
 
-        def internal_on_fixed_update(frame: int, engine):
-            """Some things we want to do every fixed frame on top of what the
-            developer wants, after the physics engine has updated."""
-
-            if len(self.__rigidbody.shapes) == 0:
-                Logger.warning(
-                    (
-                        "%s has no shapes attached to its rigidbody. This may result in errors"
-                        " and unexpected behavior."
-                    ),
-                    self,
-                )
-
-            try:
-                # Update the position of the gameobject to match the rigidbody.
-                self.x = round(self.__rigidbody.position.x)
-                self.y = round(self.__rigidbody.position.y)
-            except ValueError:
-                # if position is NaN for some reason, do not update position.
-                on_fixed_update(frame, engine)
-                return
-
-            # this is a hack to make sure the object always stays within the screen.
-            # TODO: fix this.
-            self.x = clamp(self.x, 0, engine.width - self.width)
-            self.y = clamp(self.y, 0, engine.height - self.height)
-
-            # call the developer's on_fixed_update function.
-            on_fixed_update(frame, engine)
-
-        self.on_fixed_update = internal_on_fixed_update
+        # the developer's callback, called by on_fixed_update
+        self.__on_fixed_update = on_fixed_update
+        self.on_fixed_update = self.__internal_on_fixed_update
+
+    def __internal_on_fixed_update(self, frame: int, engine) -> None:
+        """Some things we want to do every fixed frame on top of what the
+        developer wants, after the physics engine has updated."""
+
+        if len(self.__rigidbody.shapes) == 0:
+            Logger.warning(
+                (
+                    "%s has no shapes attached to its rigidbody. This may result in errors"
+                    " and unexpected behavior."
+                ),
+                self,
+            )
+
+        position = self.__rigidbody.position
+        alpha = engine.interpolation_alpha
+        if self.__previous_position is not None and alpha < 1:
+            position = self.__previous_position.interpolate_to(position, alpha)
+
+        try:
+            # Update the position of the gameobject to match the rigidbody.
+            self.x = round(position.x)
+            self.y = round(position.y)
+        except ValueError:
+            # if position is NaN for some reason, do not update position.
+            self.__on_fixed_update(frame, engine)
+            return
+
+        # keep the object within the world, unless it may leave it.
+        if self.clamp_to_world:
+            self.x = clamp(self.x, 0, engine.world_width - self.width)
+            self.y = clamp(self.y, 0, engine.world_height - self.height)
+
+        # call the developer's on_fixed_update function.
+        self.__on_fixed_update(frame, engine)
 
     @property
     def has_physics(self) -> bool:
@@ -81,6 +92,28 @@ class PhysicsGameobject(Gameobject):
         """Shorthand for self.rigidbody"""
         return self.__rigidbody
 
+    def clone(self, **attributes) -> PhysicsGameobject:
+        """
+        Create an instance of the gameobject (see Gameobject.clone), with a rigidbody of its own
+        at the position of the instance. Shapes are not copied: add them in on_start.
+
+        :param attributes: Attributes to set on the instance, e.g. x and y.
+        :return: The instance.
+        :rtype: PhysicsGameobject
+        """
+        instance = super().clone(**attributes)
+        rigidbody = pymunk.Body(body_type=self.__rigidbody.body_type)
+        rigidbody.position = (instance.x, instance.y)
+        if self.__velocity_func is not None:
+            rigidbody.velocity_func = self.__velocity_func
+        instance._set_rb(rigidbody)
+        instance.__previous_position = None
+        return instance
+
+    def _save_previous_position(self) -> None:
+        """Remember the position of the rigidbody before a physics step."""
+        self.__previous_position = self.__rigidbody.position
+
     def _set_rb(self, value: pymunk.Body):
         """Be careful using this. It will replace the gameobject's rigidbody."""
         self.__rigidbody = value
@@ -96,5 +129,6 @@ class PhysicsGameobject(Gameobject):
             on_start=gameobject.on_start,
             on_update=gameobject.on_update,
             name=gameobject.name,
+            clamp_to_world=gameobject.clamp_to_world,
             static_body=static_body,
         )
@@ -0,0 +1,134 @@
+"""
+Description: Pace the game loop to a target frame rate using deadlines.
+Author: Gregory Glatzer
+Date: 4/29/2023
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+# Sleeping can overshoot by a few milliseconds (about 15 ms on Windows), so the last part
+# of the wait is spent busy-waiting instead.
+DEFAULT_SPIN = 0.002
+
+
+class FrameScheduler:
+    """
+    Paces frames to a target frame rate. Frame n is due at start + n / fps, and
+    the scheduler only sleeps for the time left until that deadline, so the time spent
+    updating and rendering a frame does not slow the game down.
+
+    A frame finished after its deadline counts as a missed deadline. If the game falls
+    more than a frame behind, the deadlines are moved forward instead of rushing
+    through the late frames.
+
+    Time is measured with a monotonic clock (time.perf_counter).
+    """
+
+    def __init__(
+        self,
+        fps: float,
+        spin: float = DEFAULT_SPIN,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize a scheduler.
+
+        :param fps: The target number of frames per second.
+        :type fps: float
+        :param spin: Seconds before each deadline spent busy-waiting instead of sleeping,
+            for accuracy. Default is DEFAULT_SPIN.
+        :type spin: float
+        :param clock: Monotonic clock, in seconds. Default is time.perf_counter.
+        :type clock: Callable[[], float]
+        :param sleep: Function to sleep for a number of seconds. Default is time.sleep.
+        :type sleep: Callable[[float], None]
+        """
+        if fps <= 0:
+            raise ValueError(f"fps must be positive. Got {fps}")
+        self.fps = fps
+        self.spin = spin
+        self.__clock = clock
+        self.__sleep = sleep
+        self.__start = clock()
+        self.__deadline = self.__start + self.period
+        self.__frame_start = self.__start - self.period
+        self.__dt = self.period
+        self.__frame_time = 0.0
+        self.__missed = 0
+
+    @property
+    def period(self) -> float:
+        """Duration of a frame at the target frame rate, in seconds."""
+        return 1 / self.fps
+
+    @property
+    def dt(self) -> float:
+        """Seconds between the start of the previous frame and the start of the current one."""
+        return self.__dt
+
+    @property
+    def frame_time(self) -> float:
+        """Seconds spent on the last frame before waiting for its deadline."""
+        return self.__frame_time
+
+    @property
+    def missed_deadlines(self) -> int:
+        """Number of frames that finished after their deadline since the scheduler started."""
+        return self.__missed
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the scheduler started."""
+        return self.__clock() - self.__start
+
+    def start(self) -> None:
+        """
+        Start (or restart) the scheduler. The first frame is due one period from now.
+        """
+        self.__start = self.__clock()
+        self.__deadline = self.__start + self.period
+        # the first frame counts as a frame after a previous one
+        self.__frame_start = self.__start - self.period
+        self.__dt = self.period
+        self.__frame_time = 0.0
+        self.__missed = 0
+
+    def begin_frame(self) -> float:
+        """
+        Mark the start of a frame.
+
+        :return: The time since the start of the previous frame, in seconds (see dt).
+        :rtype: float
+        """
+        now = self.__clock()
+        self.__dt = now - self.__frame_start
+        self.__frame_start = now
+        return self.__dt
+
+    def wait(self) -> bool:
+        """
+        Wait until the deadline of the current frame, and move on to the next one.
+
+        :return: False if the deadline was missed, True otherwise.
+        :rtype: bool
+        """
+        now = self.__clock()
+        self.__frame_time = now - self.__frame_start
+        deadline = self.__deadline
+
+        if now > deadline:
+            self.__missed += 1
+            # more than a frame behind: start counting from now
+            self.__deadline = (now if now - deadline > self.period else deadline) + self.period
+            return False
+
+        if deadline - now > self.spin:
+            self.__sleep(deadline - now - self.spin)
+        while self.__clock() < deadline:
+            pass
+        self.__deadline = deadline + self.period
+        return True
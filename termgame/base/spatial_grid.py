@@ -0,0 +1,144 @@
+"""
+Description: Uniform grid of gameobjects, to find the ones in a region without testing all of them.
+Author: Gregory Glatzer
+Date: 4/28/2023
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Set, Tuple
+
+from ..graphics.rect import Rect
+from .gameobject import Gameobject
+
+Cell = Tuple[int, int]
+
+
+class SpatialGrid:
+    """
+    Spatial index of gameobjects, bucketing their bounding boxes into square cells.
+    Querying a region only looks at the gameobjects in the cells it covers, so its cost
+    depends on how many gameobjects are near the region, not on how many there are.
+
+    The grid listens to the gameobjects it holds (see Gameobject.add_bounds_listener), so
+    updating it only re-indexes the gameobjects that moved or changed size since.
+    Gameobjects without a sprite (or mesh) are not indexed.
+    """
+
+    def __init__(self, cell_size: int = 16):
+        """
+        Initialize an empty grid.
+
+        :param cell_size: Width and height of the cells, in pixels. Default is 16.
+        :type cell_size: int
+        """
+        if cell_size <= 0:
+            raise ValueError(f"Cell size must be positive. Got {cell_size}")
+        self.cell_size = cell_size
+        self.__cells: Dict[Cell, Set[int]] = {}
+        # keyed by the id of the gameobjects. The entries keep them alive,
+        # so their ids are not reused while they are in the grid.
+        self.__gameobjects: Dict[int, Gameobject] = {}
+        # bounding boxes of the indexed gameobjects
+        self.__rects: Dict[int, Rect] = {}
+        # (depth, number of gameobjects added before), the order queries return them in
+        self.__order: Dict[int, Tuple[int, int]] = {}
+        self.__added = 0
+        # gameobjects whose bounding box changed since the last update
+        self.__moved: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self.__rects)
+
+    def __covered_cells(self, rect: Rect) -> List[Cell]:
+        size = self.cell_size
+        return [
+            (cx, cy)
+            for cy in range(rect.y // size, (rect.bottom - 1) // size + 1)
+            for cx in range(rect.x // size, (rect.right - 1) // size + 1)
+        ]
+
+    def add(self, gameobject: Gameobject) -> None:
+        """
+        Add a gameobject to the grid. It is indexed on the next update.
+
+        :param gameobject: The gameobject.
+        :type gameobject: Gameobject
+        """
+        key = id(gameobject)
+        if key in self.__gameobjects:
+            return
+        self.__gameobjects[key] = gameobject
+        self.__order[key] = (gameobject.depth, self.__added)
+        self.__added += 1
+        self.__moved.add(key)
+        gameobject.add_bounds_listener(self.__on_bounds_changed)
+
+    def remove(self, gameobject: Gameobject) -> None:
+        """
+        Remove a gameobject from the grid. Removing a gameobject not in the grid does nothing.
+
+        :param gameobject: The gameobject.
+        :type gameobject: Gameobject
+        """
+        key = id(gameobject)
+        if self.__gameobjects.get(key) is not gameobject:
+            return
+        gameobject.remove_bounds_listener(self.__on_bounds_changed)
+        if key in self.__rects:
+            self.__unindex(key)
+        del self.__gameobjects[key]
+        del self.__order[key]
+        self.__moved.discard(key)
+
+    def update(self) -> None:
+        """
+        Re-index the gameobjects that moved or changed size since the last update,
+        at their current bounding boxes.
+        """
+        for key in self.__moved:
+            gameobject = self.__gameobjects[key]
+            rect = Rect(int(gameobject.x), int(gameobject.y), gameobject.width, gameobject.height)
+            previous = self.__rects.get(key)
+            if rect == previous:
+                continue
+            if previous is not None:
+                self.__unindex(key)
+            if not rect.is_empty:
+                self.__index(key, rect)
+        self.__moved.clear()
+
+    def __on_bounds_changed(self, gameobject: Gameobject) -> None:
+        self.__moved.add(id(gameobject))
+
+    def __index(self, key: int, rect: Rect) -> None:
+        self.__rects[key] = rect
+        for cell in self.__covered_cells(rect):
+            self.__cells.setdefault(cell, set()).add(key)
+
+    def __unindex(self, key: int) -> None:
+        for cell in self.__covered_cells(self.__rects.pop(key)):
+            members = self.__cells[cell]
+            members.discard(key)
+            if not members:
+                del self.__cells[cell]
+
+    def query(self, region: Rect) -> List[Gameobject]:
+        """
+        Find the gameobjects whose bounding box overlaps a region.
+
+        :param region: The region, in world coordinates.
+        :type region: Rect
+        :return: The gameobjects, by depth, then in the order they were added
+            (like Engine.gameobjects).
+        :rtype: List[Gameobject]
+        """
+        if region.is_empty:
+            return []
+
+        found: Set[int] = set()
+        for cell in self.__covered_cells(region):
+            found.update(self.__cells.get(cell, ()))
+        keys = [key for key in found if self.__rects[key].overlaps(region)]
+        keys.sort(key=self.__order.__getitem__)
+        return [self.__gameobjects[key] for key in keys]
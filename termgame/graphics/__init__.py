@@ -2,7 +2,10 @@
 The graphics module contains classes for working with the screen and pixels.
 """
 
+from .indexed import IndexedScreen
 from .pixel import RGBPixel as Pixel
+from .renderer import Renderer
 from .screen import Screen
+from .sprite_pool import SpritePool
 
-__all__ = ["Pixel", "Screen"]
+__all__ = ["IndexedScreen", "Pixel", "Renderer", "Screen", "SpritePool"]
@@ -0,0 +1,386 @@
+"""
+Description: Encode screens into the text written to the terminal.
+Author: Gregory Glatzer
+Date: 4/16/2023
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List
+
+import numpy as np
+
+from .quantize import COLOR_DEPTHS, quantize
+from .rect import Rect
+
+if TYPE_CHECKING:
+    from .screen import Screen
+
+# Packed color standing for the terminal's default foreground or background color.
+DEFAULT_COLOR = -1
+
+# Color of the symbol drawn on top of each pixel in "full" mode.
+FOREGROUND_COLOR = (255, 0, 0)
+
+RESET_STYLE = "\033[0m"
+
+# Terminals supporting synchronized output hold the frame until the end marker
+# and present it at once. Other terminals ignore these sequences.
+BEGIN_SYNCHRONIZED_UPDATE = "\033[?2026h"
+END_SYNCHRONIZED_UPDATE = "\033[?2026l"
+
+UPPER_HALF_BLOCK = "\u2580"
+LOWER_HALF_BLOCK = "\u2584"
+
+# Render modes, and the number of terminal columns a cell spans in each of them.
+# "full" draws every pixel as its symbol on a cell of its color.
+# "halfblock" draws two vertically stacked pixels per cell, as a half block glyph.
+CELL_WIDTHS = {"full": 2, "halfblock": 1}
+
+
+@dataclass
+class Cells:
+    """
+    The terminal cells a screen is drawn with.
+
+    :ivar fg: Foreground color of each cell (see quantize), or DEFAULT_COLOR.
+    :vartype fg: np.ndarray
+    :ivar bg: Background color of each cell (see quantize), or DEFAULT_COLOR.
+    :vartype bg: np.ndarray
+    :ivar glyphs: Text drawn in each cell.
+    :vartype glyphs: np.ndarray
+    """
+
+    fg: np.ndarray
+    bg: np.ndarray
+    glyphs: np.ndarray
+
+    @property
+    def width(self) -> int:
+        return self.glyphs.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.glyphs.shape[0]
+
+    def copy(self) -> Cells:
+        """
+        Copy the cells, without sharing any buffers.
+
+        :return: The copied cells.
+        :rtype: Cells
+        """
+        return Cells(self.fg.copy(), self.bg.copy(), self.glyphs.copy())
+
+    def view(self, rect: Rect) -> Cells:
+        """
+        The cells inside a rectangle, sharing buffers with these cells.
+
+        :param rect: The rectangle, in cells.
+        :type rect: Rect
+        :return: The cells inside the rectangle.
+        :rtype: Cells
+        """
+        return Cells(self.fg[rect.slices], self.bg[rect.slices], self.glyphs[rect.slices])
+
+    def assign(self, other: Cells) -> None:
+        """
+        Overwrite these cells with other cells of the same size, in place.
+
+        :param other: The cells to copy from.
+        :type other: Cells
+        """
+        self.fg[:] = other.fg
+        self.bg[:] = other.bg
+        self.glyphs[:] = other.glyphs
+
+
+@dataclass
+class CompiledScreen:
+    """
+    A screen encoded ahead of time, one string per row of cells (see FrameEncoder.compile).
+
+    :ivar cells: The cells of the screen.
+    :vartype cells: Cells
+    :ivar rows: Each row of cells, encoded as if the terminal style was reset before it.
+    :vartype rows: List[str]
+    """
+
+    cells: Cells
+    rows: List[str]
+
+
+class FrameEncoder:
+    """
+    Encodes screens into escape sequences, and writes encoded frames to stdout
+    with a single write per frame.
+    """
+
+    def __init__(
+        self,
+        synchronized: bool = False,
+        mode: str = "full",
+        color_depth: str = "truecolor",
+        dither: bool = False,
+    ):
+        """
+        Initialize a frame encoder.
+
+        :param synchronized: Whether to wrap written frames in the terminal's
+            synchronized output mode, so the frame is presented at once.
+        :type synchronized: bool
+        :param mode: How pixels map to terminal cells, either "full" or "halfblock".
+        :type mode: str
+        :param color_depth: The colors used for output, one of "truecolor", "256" or "16".
+        :type color_depth: str
+        :param dither: Whether to dither colors when using the 256 or 16 color palettes.
+        :type dither: bool
+        """
+        if mode not in CELL_WIDTHS:
+            raise ValueError(f"Invalid render mode: {mode}. Must be one of {list(CELL_WIDTHS)}")
+        if color_depth not in COLOR_DEPTHS:
+            raise ValueError(
+                f"Invalid color depth: {color_depth}. Must be one of {list(COLOR_DEPTHS)}"
+            )
+
+        self.synchronized = synchronized
+        self.mode = mode
+        self.color_depth = color_depth
+        self.dither = dither
+        self.__foreground = int(
+            quantize(np.array([[FOREGROUND_COLOR]], dtype=np.uint8), color_depth)[0, 0]
+        )
+        self.__fg_styles: Dict[int, str] = {}
+        self.__bg_styles: Dict[int, str] = {}
+        self.__buffer = io.StringIO()
+        # the colors the terminal currently draws with, None when unknown
+        self.__fg: int | None = None
+        self.__bg: int | None = None
+
+    @property
+    def cell_width(self) -> int:
+        """Number of terminal columns a cell spans."""
+        return CELL_WIDTHS[self.mode]
+
+    def to_cells(self, screen: Screen, region: Rect | None = None) -> Cells:
+        """
+        Convert a screen (or a region of it) into the terminal cells it is drawn with.
+        The cells may share buffers with the screen.
+
+        :param screen: The screen to convert.
+        :type screen: Screen
+        :param region: The region of the screen to convert, in pixels. In "halfblock" mode
+            it must start on an even row. Default is the whole screen.
+        :type region: Rect | None
+        :return: The cells.
+        :rtype: Cells
+        """
+        if region is None:
+            colors = screen.quantized(self.color_depth, self.dither)
+            _, alpha, symbols = screen.buffers()
+        else:
+            colors, alpha, symbols = screen.buffers(region)
+            colors = quantize(colors, self.color_depth, self.dither, (region.x, region.y))
+
+        if self.mode == "full":
+            return Cells(np.full(colors.shape, self.__foreground, dtype=np.int64), colors, symbols)
+
+        # pair up even (top) and odd (bottom) rows. An odd height gets a transparent last row.
+        colors = np.where(alpha, colors, DEFAULT_COLOR)
+        if colors.shape[0] % 2 == 1:
+            colors = np.vstack((colors, np.full((1, colors.shape[1]), DEFAULT_COLOR)))
+        top = colors[0::2]
+        bottom = colors[1::2]
+
+        # the upper half block shows the top pixel in the foreground, the bottom one behind it.
+        # If only the bottom pixel is opaque, flip to the lower half block so the
+        # transparent top keeps the terminal's default background.
+        only_bottom = (top == DEFAULT_COLOR) & (bottom != DEFAULT_COLOR)
+        glyphs = np.where(only_bottom, LOWER_HALF_BLOCK, UPPER_HALF_BLOCK)
+        glyphs[(top == DEFAULT_COLOR) & (bottom == DEFAULT_COLOR)] = " "
+        fg = np.where(only_bottom, bottom, top)
+        bg = np.where(only_bottom, DEFAULT_COLOR, bottom)
+        return Cells(fg, bg, glyphs)
+
+    def __style(self, color: int, background: bool) -> str:
+        """
+        Format the escape sequence selecting a foreground or background color.
+        """
+        if color == DEFAULT_COLOR:
+            return "\033[49m" if background else "\033[39m"
+        code = 48 if background else 38
+        if self.color_depth == "truecolor":
+            return f"\033[{code};2;{color >> 16};{(color >> 8) & 0xFF};{color & 0xFF}m"
+        if self.color_depth == "256":
+            return f"\033[{code};5;{color}m"
+
+        # the 16 colors have their own codes: 30-37 and 90-97 (+10 for backgrounds)
+        code = (40 if background else 30) + (color if color < 8 else 60 + color - 8)
+        return f"\033[{code}m"
+
+    def fg_style(self, color: int) -> str:
+        """
+        Escape sequence selecting the foreground color of the cells that follow.
+
+        :param color: Color of the cells (see quantize), or DEFAULT_COLOR.
+        :type color: int
+        :return: The escape sequence.
+        :rtype: str
+        """
+        style = self.__fg_styles.get(color)
+        if style is None:
+            style = self.__style(color, background=False)
+            self.__fg_styles[color] = style
+        return style
+
+    def bg_style(self, color: int) -> str:
+        """
+        Escape sequence selecting the background color of the cells that follow.
+
+        :param color: Color of the cells (see quantize), or DEFAULT_COLOR.
+        :type color: int
+        :return: The escape sequence.
+        :rtype: str
+        """
+        style = self.__bg_styles.get(color)
+        if style is None:
+            style = self.__style(color, background=True)
+            self.__bg_styles[color] = style
+        return style
+
+    def end_style(self) -> str:
+        """
+        Escape sequence resetting the terminal style, e.g. before a line break.
+
+        :return: The escape sequence.
+        :rtype: str
+        """
+        self.__fg = DEFAULT_COLOR
+        self.__bg = DEFAULT_COLOR
+        return RESET_STYLE
+
+    def encode_row(self, cells: Cells, y: int, x_start: int = 0, x_end: int | None = None) -> str:
+        """
+        Encode (part of) a row of cells. Runs of cells with the same colors share
+        escape sequences, which are only emitted when a color differs from the one
+        the terminal currently draws with.
+
+        :param cells: The cells to encode.
+        :type cells: Cells
+        :param y: The row to encode.
+        :type y: int
+        :param x_start: First cell of the row to encode. Default is 0.
+        :type x_start: int
+        :param x_end: Cell after the last one to encode. Default is the width of the cells.
+        :type x_end: int | None
+        :return: The encoded cells.
+        :rtype: str
+        """
+        fg = cells.fg[y, x_start:x_end]
+        bg = cells.bg[y, x_start:x_end]
+        glyphs = cells.glyphs[y, x_start:x_end].tolist()
+        if not glyphs:
+            return ""
+
+        # split the row wherever a color changes
+        ends = np.flatnonzero((fg[1:] != fg[:-1]) | (bg[1:] != bg[:-1])) + 1
+        starts = np.concatenate(([0], ends))
+        ends = np.append(ends, len(glyphs))
+
+        chunks: List[str] = []
+        for run_fg, run_bg, start, end in zip(
+            fg[starts].tolist(), bg[starts].tolist(), starts.tolist(), ends.tolist()
+        ):
+            if run_fg != self.__fg:
+                chunks.append(self.fg_style(run_fg))
+                self.__fg = run_fg
+            if run_bg != self.__bg:
+                chunks.append(self.bg_style(run_bg))
+                self.__bg = run_bg
+            chunks.append("".join(glyphs[start:end]))
+        return "".join(chunks)
+
+    def compile(self, screen: Screen) -> CompiledScreen:
+        """
+        Encode every row of a screen once, so it can be spliced into frames as is
+        (see splice). Use Screen.compiled to get the rows cached on the screen.
+
+        :param screen: The screen to compile.
+        :type screen: Screen
+        :return: The compiled screen.
+        :rtype: CompiledScreen
+        """
+        cells = self.to_cells(screen)
+
+        # encode each row from a reset style, keeping the style of the frame being written
+        fg, bg = self.__fg, self.__bg
+        rows: List[str] = []
+        for y in range(cells.height):
+            self.__fg = DEFAULT_COLOR
+            self.__bg = DEFAULT_COLOR
+            rows.append(self.encode_row(cells, y))
+        self.__fg, self.__bg = fg, bg
+
+        return CompiledScreen(cells, rows)
+
+    def splice(self, compiled: CompiledScreen, y: int) -> str:
+        """
+        Get a row of a compiled screen, to write at the current cursor position.
+
+        :param compiled: The compiled screen.
+        :type compiled: CompiledScreen
+        :param y: The row of cells.
+        :type y: int
+        :return: The encoded row, preceded by a style reset if needed.
+        :rtype: str
+        """
+        if compiled.cells.width == 0:
+            return ""
+
+        reset = "" if self.__fg == self.__bg == DEFAULT_COLOR else self.end_style()
+        self.__fg = int(compiled.cells.fg[y, -1])
+        self.__bg = int(compiled.cells.bg[y, -1])
+        return reset + compiled.rows[y]
+
+    def encode(self, screen: Screen) -> str:
+        """
+        Encode a full screen, one line per row of cells.
+        The rows are cached on the screen until it is modified (see Screen.compiled).
+
+        :param screen: The screen to encode.
+        :type screen: Screen
+        :return: The encoded screen.
+        :rtype: str
+        """
+        compiled = screen.compiled(self)
+        return "".join(
+            self.splice(compiled, y) + self.end_style() + "\n"
+            for y in range(compiled.cells.height)
+        )
+
+    def begin(self) -> io.StringIO:
+        """
+        Start a new frame.
+
+        :return: The (emptied) buffer to write the frame into.
+        :rtype: io.StringIO
+        """
+        self.__buffer.seek(0)
+        self.__buffer.truncate()
+        self.__fg = None
+        self.__bg = None
+        if self.synchronized:
+            self.__buffer.write(BEGIN_SYNCHRONIZED_UPDATE)
+        return self.__buffer
+
+    def flush(self) -> None:
+        """
+        Write the frame started with begin() to stdout in a single write.
+        """
+        if self.synchronized:
+            self.__buffer.write(END_SYNCHRONIZED_UPDATE)
+        sys.stdout.write(self.__buffer.getvalue())
+        sys.stdout.flush()
@@ -0,0 +1,200 @@
+"""
+Description: Cache decoded images, in memory and optionally on disk,
+    so loading the same sprite twice does not decode it twice.
+Author: Gregory Glatzer
+Date: 4/20/2023
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import numpy as np
+from PIL import Image  # type: ignore
+
+from ..settings import Settings
+
+# (absolute path, resize, has_alpha, modification time in ns)
+CacheKey = Tuple[str, Tuple[int, int] | None, bool, int]
+
+
+def decode_image(path: str, resize: Tuple[int, int] | None, has_alpha: bool) -> np.ndarray:
+    """
+    Decode an image file into a uint8 array of shape (height, width, 3 or 4).
+
+    :param path: Path to the image.
+    :type path: str
+    :param resize: The size to resize the image to, if not None.
+    :type resize: tuple[int, int] | None
+    :param has_alpha: Whether to keep the alpha channel of the image.
+    :type has_alpha: bool
+    :return: The image.
+    :rtype: np.ndarray
+    """
+    img: Image = Image.open(path).convert("RGBA" if has_alpha else "RGB")  # type: ignore
+    if resize:
+        img = img.resize(resize)  # type: ignore
+    return np.asarray(img)
+
+
+class ImageCache:
+    """
+    Least recently used cache of decoded images, bounded by the number of bytes it holds.
+    Entries are keyed by the absolute path, resize and alpha options, and the modification
+    time of the file, so edited files are decoded again.
+
+    If a directory is given, decoded images are also stored there as .npz files,
+    so later runs of the game skip decoding entirely.
+
+    The cache is thread-safe. Images are decoded outside of its lock, and concurrent
+    loads of the same image wait for a single decode.
+    """
+
+    def __init__(self, max_bytes: int, directory: str | None = None):
+        """
+        Initialize an image cache.
+
+        :param max_bytes: Maximum number of bytes of decoded images to keep in memory.
+        :type max_bytes: int
+        :param directory: Directory for the on-disk cache. None disables it.
+        :type directory: str | None
+        """
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.__images: OrderedDict[CacheKey, np.ndarray] = OrderedDict()
+        self.__nbytes = 0
+        self.__lock = threading.Lock()
+        # images being decoded, set once they are in the cache (or failed to load)
+        self.__loading: Dict[CacheKey, threading.Event] = {}
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes of decoded images held in memory."""
+        return self.__nbytes
+
+    def __len__(self) -> int:
+        return len(self.__images)
+
+    def clear(self) -> None:
+        """
+        Drop every image held in memory. The on-disk cache is kept.
+        """
+        with self.__lock:
+            self.__images.clear()
+            self.__nbytes = 0
+
+    def load(
+        self, path: str, resize: Tuple[int, int] | None = None, has_alpha: bool = False
+    ) -> np.ndarray:
+        """
+        Load an image, decoding it only if it is not cached yet.
+        The returned array is shared with the cache and read-only.
+
+        :param path: Path to the image.
+        :type path: str
+        :param resize: The size to resize the image to, if not None.
+        :type resize: tuple[int, int] | None
+        :param has_alpha: Whether to keep the alpha channel of the image.
+        :type has_alpha: bool
+        :return: uint8 array of shape (height, width, 3 or 4).
+        :rtype: np.ndarray
+        """
+        path = os.path.abspath(path)
+        key: CacheKey = (
+            path,
+            tuple(resize) if resize else None,  # type: ignore
+            has_alpha,
+            os.stat(path).st_mtime_ns,
+        )
+
+        with self.__lock:
+            image = self.__images.get(key)
+            if image is not None:
+                self.__images.move_to_end(key)
+                return image
+
+            loading = self.__loading.get(key)
+            if loading is None:
+                self.__loading[key] = threading.Event()
+
+        # another thread is decoding this image, wait for it and look again
+        if loading is not None:
+            loading.wait()
+            return self.load(path, resize, has_alpha)
+
+        try:
+            image = self.__load_from_disk(key)
+            if image is None:
+                image = decode_image(path, resize, has_alpha)
+                self.__save_to_disk(key, image)
+
+            image.flags.writeable = False
+            with self.__lock:
+                self.__add(key, image)
+        finally:
+            with self.__lock:
+                self.__loading.pop(key).set()
+        return image
+
+    def __add(self, key: CacheKey, image: np.ndarray) -> None:
+        """
+        Add an image to the memory cache, evicting the least recently used ones if needed.
+        """
+        # drop stale entries of the same file (e.g. with an older modification time)
+        for stale in [k for k in self.__images if k[:3] == key[:3]]:
+            self.__nbytes -= self.__images.pop(stale).nbytes
+
+        self.__images[key] = image
+        self.__nbytes += image.nbytes
+        while self.__nbytes > self.max_bytes and len(self.__images) > 1:
+            _, evicted = self.__images.popitem(last=False)
+            self.__nbytes -= evicted.nbytes
+
+    @staticmethod
+    def __disk_path(directory: str, key: CacheKey) -> str:
+        """
+        File of the on-disk cache holding the image with the given key.
+        """
+        digest = hashlib.sha1(repr(key[:3]).encode()).hexdigest()
+        return os.path.join(directory, f"{digest}.npz")
+
+    def __load_from_disk(self, key: CacheKey) -> np.ndarray | None:
+        """
+        Load an image from the on-disk cache, if it is there and up to date.
+        """
+        if self.directory is None:
+            return None
+
+        try:
+            with np.load(self.__disk_path(self.directory, key)) as data:
+                if int(data["mtime"]) != key[3]:
+                    return None
+                return data["image"]
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def __save_to_disk(self, key: CacheKey, image: np.ndarray) -> None:
+        """
+        Store an image in the on-disk cache, if enabled.
+        """
+        if self.directory is None:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.__disk_path(self.directory, key)
+
+        # write to a temporary file first, so a crash never leaves a partial file behind
+        temporary_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary_path, "wb") as f:
+            np.savez(f, image=image, mtime=np.int64(key[3]))
+        os.replace(temporary_path, path)
+
+
+# the cache used by Screen.from_image and Screen.paint_image
+image_cache = ImageCache(
+    Settings.asset_settings.cache_size, Settings.asset_settings.cache_dir or None
+)
@@ -0,0 +1,280 @@
+"""
+Description: Sprites stored as palette indices, for cheap color variants.
+Author: Gregory Glatzer
+Date: 4/26/2023
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+from .encoder import CompiledScreen, FrameEncoder
+from .quantize import quantize
+from .rect import Rect
+from .screen import DEFAULT_SYMBOL, SYMBOL_DTYPE, Screen, _Revision
+
+# Maximum number of colors in a palette, so indices fit in a uint8.
+MAX_PALETTE_SIZE = 256
+
+
+def _check_palette(palette: np.ndarray) -> np.ndarray:
+    """
+    Check that a palette is an array of 1 to 256 RGB colors, and return it as uint8.
+    """
+    palette = np.asarray(palette)
+    if palette.ndim != 2 or palette.shape[1] != 3 or not 0 < len(palette) <= MAX_PALETTE_SIZE:
+        raise ValueError(
+            f"Palette must have shape (n_colors, 3) with 1-{MAX_PALETTE_SIZE} colors."
+            f" Got shape {palette.shape}"
+        )
+    if palette.dtype != np.uint8:
+        if palette.min() < 0 or palette.max() > 255:
+            raise ValueError("Invalid palette values. Values must be between 0-255, inclusive")
+        palette = palette.astype(np.uint8)
+    return palette
+
+
+class IndexedScreen:
+    """
+    A sprite stored as a ``uint8`` plane of indices into a palette of up to 256 colors.
+    It uses a third of the memory of a Screen, and can be painted, rendered and animated
+    like one: the indices are resolved through the palette when it is painted (see buffers).
+
+    Color variants share the index plane and only differ in their palette (see with_palette),
+    so they cost a palette instead of a new sprite. Every pixel is drawn with DEFAULT_SYMBOL.
+    """
+
+    def __init__(
+        self,
+        indices: np.ndarray,
+        palette: np.ndarray,
+        transparent_index: int | None = None,
+    ):
+        """
+        Initialize an indexed screen.
+
+        :param indices: Array of shape (height, width) with the palette index of each pixel.
+        :type indices: np.ndarray
+        :param palette: Array of shape (n_colors, 3) with the RGB colors of the palette.
+        :type palette: np.ndarray
+        :param transparent_index: Index of the palette drawn as transparent pixels, if any.
+        :type transparent_index: int | None
+        """
+        palette = _check_palette(palette)
+        indices = np.asarray(indices)
+        if indices.ndim != 2:
+            raise ValueError(f"Indices must have shape (height, width). Got shape {indices.shape}")
+        if indices.size > 0 and (indices.min() < 0 or indices.max() >= len(palette)):
+            raise ValueError(f"Indices must be between 0 and {len(palette) - 1}, inclusive")
+
+        self.indices = indices.astype(np.uint8, copy=False)
+        self.palette = palette
+        self.transparent_index = transparent_index
+        self.height, self.width = self.indices.shape
+        # the index plane is shared with the color variants, the palette is not
+        self.__indices_revision = _Revision()
+        self.__palette_revision = _Revision()
+        self.__quantized: Dict[Tuple[str, bool], Tuple[int, np.ndarray]] = {}
+        self.__compiled: Dict[Tuple[str, str, bool], Tuple[int, CompiledScreen]] = {}
+
+    @property
+    def revision(self) -> int:
+        """
+        Counter incremented every time the screen is modified, used to invalidate caches.
+        Modifying the index plane increments it for every color variant of the screen,
+        changing a palette only for the screen using it.
+        """
+        # both counters only increase, so their sum changes whenever either does
+        return self.__indices_revision.value + self.__palette_revision.value
+
+    def touch(self) -> IndexedScreen:
+        """
+        Mark the screen and its color variants as modified. Call it after writing to indices
+        or palette directly.
+
+        :return: The screen.
+        :rtype: IndexedScreen
+        """
+        self.__indices_revision.value += 1
+        return self
+
+    def set_palette(self, palette: np.ndarray) -> IndexedScreen:
+        """
+        Replace the palette in place, e.g. for flashing effects.
+
+        :param palette: Array of shape (n_colors, 3). Must have a color for every index.
+        :type palette: np.ndarray
+        :return: The screen.
+        :rtype: IndexedScreen
+        """
+        palette = _check_palette(palette)
+        if self.indices.size > 0 and self.indices.max() >= len(palette):
+            raise ValueError(f"Palette has {len(palette)} colors, the screen uses more")
+        self.palette = palette
+        self.__palette_revision.value += 1
+        return self
+
+    def with_palette(self, palette: np.ndarray) -> IndexedScreen:
+        """
+        A color variant of the screen. It shares the index plane of this screen, so only
+        the palette is allocated. Changing the palette of a variant does not invalidate the
+        caches of the others.
+
+        :param palette: Array of shape (n_colors, 3). Must have a color for every index.
+        :type palette: np.ndarray
+        :return: The color variant.
+        :rtype: IndexedScreen
+        """
+        variant = IndexedScreen.__new__(IndexedScreen)
+        variant.indices = self.indices
+        variant.palette = self.palette
+        variant.transparent_index = self.transparent_index
+        variant.width, variant.height = self.width, self.height
+        variant.__indices_revision = self.__indices_revision
+        variant.__palette_revision = _Revision()
+        variant.__quantized = {}
+        variant.__compiled = {}
+        return variant.set_palette(palette)
+
+    def buffers(self, region: Rect | None = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        The (colors, alpha, symbols) buffers of a region of the screen, resolved through
+        the palette. See Screen.buffers. The alpha and symbols buffers are read-only.
+
+        :param region: The region of the screen. Default is the whole screen.
+        :type region: Rect | None
+        :return: The colors, alpha and symbols of the region.
+        :rtype: Tuple[np.ndarray, np.ndarray, np.ndarray]
+        """
+        indices = self.indices if region is None else self.indices[region.slices]
+        if self.transparent_index is None:
+            alpha = np.broadcast_to(np.True_, indices.shape)
+        else:
+            alpha = indices != self.transparent_index
+        symbols = np.broadcast_to(np.array(DEFAULT_SYMBOL, dtype=SYMBOL_DTYPE), indices.shape)
+        return self.palette[indices], alpha, symbols
+
+    def quantized(self, depth: str = "truecolor", dither: bool = False) -> np.ndarray:
+        """
+        The colors of the screen quantized to the given color depth (see quantize.quantize).
+        Without dithering, only the palette is quantized. The result is cached until
+        the screen is modified.
+
+        :param depth: One of "truecolor", "256" or "16". Default is "truecolor".
+        :type depth: str
+        :param dither: Whether to apply ordered dithering. Default is False.
+        :type dither: bool
+        :return: int64 array of shape (height, width).
+        :rtype: np.ndarray
+        """
+        revision = self.revision
+        cached = self.__quantized.get((depth, dither))
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+
+        if dither:
+            colors = quantize(self.palette[self.indices], depth, dither)
+        else:
+            colors = quantize(self.palette[None], depth)[0][self.indices]
+        self.__quantized[(depth, dither)] = (revision, colors)
+        return colors
+
+    def compiled(self, encoder: FrameEncoder) -> CompiledScreen:
+        """
+        The rows of the screen encoded by the given encoder. See Screen.compiled.
+
+        :param encoder: The encoder to encode the screen with.
+        :type encoder: FrameEncoder
+        :return: The compiled screen.
+        :rtype: CompiledScreen
+        """
+        key = (encoder.mode, encoder.color_depth, encoder.dither)
+        revision = self.revision
+        cached = self.__compiled.get(key)
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+
+        compiled = encoder.compile(self)  # type: ignore
+        self.__compiled[key] = (revision, compiled)
+        return compiled
+
+    def to_screen(self) -> Screen:
+        """
+        Convert the indexed screen to a regular screen.
+
+        :return: The screen.
+        :rtype: Screen
+        """
+        screen = Screen(self.width, self.height)
+        screen.colors[:], screen.alpha[:], screen.symbols[:] = self.buffers()
+        return screen.touch()
+
+    def copy(self) -> IndexedScreen:
+        """
+        Create a copy of the screen that does not share any buffers with it.
+
+        :return: The copied screen.
+        :rtype: IndexedScreen
+        """
+        return IndexedScreen(self.indices.copy(), self.palette.copy(), self.transparent_index)
+
+    @staticmethod
+    def from_screen(screen: Screen) -> IndexedScreen:
+        """
+        Create an indexed screen from a screen with at most 256 colors (counting transparent
+        pixels as one more color). The symbols of the screen are not kept.
+
+        :param screen: The screen to convert.
+        :type screen: Screen
+        :return: The indexed screen.
+        :rtype: IndexedScreen
+        :raises ValueError: If the screen has too many colors.
+        """
+        colors, alpha, _ = screen.buffers()
+        palette, indices = np.unique(colors[alpha].reshape(-1, 3), axis=0, return_inverse=True)
+        transparent = not alpha.all()
+        if len(palette) + transparent > MAX_PALETTE_SIZE:
+            raise ValueError(
+                f"Screen has {len(palette) + transparent} colors,"
+                f" indexed screens hold at most {MAX_PALETTE_SIZE}"
+            )
+
+        # transparent pixels get an extra (black) color at the end of the palette
+        plane = np.full((screen.height, screen.width), len(palette), dtype=np.uint8)
+        plane[alpha] = indices.reshape(-1)
+        if transparent or len(palette) == 0:
+            palette = np.vstack((palette, np.zeros((1, 3), dtype=np.uint8)))
+        return IndexedScreen(plane, palette, len(palette) - 1 if transparent else None)
+
+    @staticmethod
+    def from_image(
+        image: np.ndarray | str,
+        resize: Tuple[int, int] | None = None,
+        has_alpha: bool = False,
+        alpha_threshold: int = 0,
+    ) -> IndexedScreen:
+        """
+        Create an indexed screen from an image with at most 256 colors.
+        See Screen.from_image.
+
+        :param image: The image to create the screen from.
+        :type image: numpy.ndarray | str
+        :param resize: The size to resize the image to.
+        :type resize: tuple[int, int] | None
+        :param has_alpha: A boolean indicating whether the image has an alpha channel.
+        :type has_alpha: bool
+        :param alpha_threshold: Pixels with an alpha value at or below this are transparent.
+        :type alpha_threshold: int
+        :return: The indexed screen.
+        :rtype: IndexedScreen
+        """
+        return IndexedScreen.from_screen(
+            Screen.from_image(image, resize, has_alpha, alpha_threshold)
+        )
+
+    def __str__(self) -> str:
+        return f"IndexedScreen ({self.width}, {self.height}), {len(self.palette)} colors"
+
+    __repr__ = __str__
@@ -0,0 +1,240 @@
+"""
+Description: Render frames on a writer thread, while the game simulates the next ones.
+Author: Gregory Glatzer
+Date: 5/01/2023
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Sequence
+
+from .rect import Rect, merge_rects
+from .renderer import Placement, Renderer
+from .screen import Screen
+
+
+@dataclass
+class Framebuffer:
+    """
+    A copy of the game's screen, handed to the writer thread.
+
+    :ivar screen: The copy.
+    :vartype screen: Screen
+    :ivar stale: Regions of the game's screen that changed since the copy was last updated.
+    :vartype stale: List[Rect]
+    """
+
+    screen: Screen
+    stale: List[Rect] = field(default_factory=list)
+
+
+@dataclass
+class PipelineFrame:
+    """
+    A frame waiting to be rendered.
+
+    :ivar framebuffer: The framebuffer holding the frame.
+    :vartype framebuffer: Framebuffer
+    :ivar sprites: The sprites painted on the frame (see Renderer.render).
+    :vartype sprites: Sequence[Placement]
+    :ivar regions: The regions that changed since the last rendered frame,
+        or None to compare the whole frame.
+    :vartype regions: List[Rect] | None
+    :ivar color_depth: The color depth to render the frame with, None to keep the current one.
+    :vartype color_depth: str | None
+    """
+
+    framebuffer: Framebuffer
+    sprites: Sequence[Placement]
+    regions: List[Rect] | None
+    color_depth: str | None = None
+
+
+class RenderPipeline:
+    """
+    Renders frames on a dedicated writer thread, so the game can simulate and compose
+    the next frame while the last one is encoded and written to the terminal. Writing to
+    the terminal blocks on I/O and releases the GIL, so most of its latency is hidden.
+
+    Each submitted frame is copied into a framebuffer of a small pool (only the regions
+    that changed since that framebuffer was last used), so the game never modifies
+    a frame being encoded. The writer always renders the latest frame: a frame submitted
+    before the writer got to the previous one replaces it, and their regions are merged.
+    With three framebuffers (triple buffering), submitting never waits for the writer.
+    """
+
+    def __init__(self, renderer: Renderer, buffers: int = 3):
+        """
+        Initialize a pipeline rendering with the given renderer.
+
+        :param renderer: The renderer. Only the writer thread uses it once the pipeline
+            is started.
+        :type renderer: Renderer
+        :param buffers: Number of framebuffers, at least 2. Default is 3.
+        :type buffers: int
+        """
+        if buffers < 2:
+            raise ValueError(f"A render pipeline needs at least 2 framebuffers. Got {buffers}")
+        self.renderer = renderer
+        # the color depth submitted frames are rendered with, None keeps the renderer's
+        self.color_depth: str | None = None
+        full = Rect(0, 0, renderer.width, renderer.height)
+        self.__framebuffers = [
+            Framebuffer(Screen(renderer.width, renderer.height), [full]) for _ in range(buffers)
+        ]
+        self.__free = list(self.__framebuffers)
+        self.__pending: PipelineFrame | None = None
+        self.__condition = threading.Condition()
+        self.__thread: threading.Thread | None = None
+        self.__stopping = False
+        self.__error: BaseException | None = None
+        self.__rendered = 0
+        self.__replaced = 0
+        self.__render_time = 0.0
+
+    @property
+    def rendered(self) -> int:
+        """Number of frames rendered by the writer thread."""
+        return self.__rendered
+
+    @property
+    def render_time(self) -> float:
+        """
+        Seconds the writer thread took to encode and write the last frame. The game's frame
+        time does not include it, so the engine reports it to the overload policy.
+        """
+        return self.__render_time
+
+    @property
+    def replaced(self) -> int:
+        """Number of frames replaced by a newer one before the writer got to them."""
+        return self.__replaced
+
+    def start(self) -> None:
+        """
+        Start the writer thread.
+        """
+        if self.__thread is not None:
+            return
+        self.__stopping = False
+        self.__thread = threading.Thread(target=self.__write, name="termgame-writer", daemon=True)
+        self.__thread.start()
+        # finish writing the frame, instead of leaving half an escape sequence on the terminal
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """
+        Render the frame waiting to be rendered, if any, and stop the writer thread.
+        Raises the error the writer thread stopped with, if any.
+        """
+        if self.__thread is not None:
+            atexit.unregister(self.stop)
+            with self.__condition:
+                self.__stopping = True
+                self.__condition.notify_all()
+            self.__thread.join()
+            self.__thread = None
+        self.__raise_error()
+
+    def submit(
+        self,
+        screen: Screen,
+        sprites: Sequence[Placement] = (),
+        regions: Sequence[Rect] | None = None,
+    ) -> None:
+        """
+        Queue a frame to be rendered. The screen is copied, so it can be modified
+        as soon as this returns.
+
+        :param screen: The frame. Must match the size of the renderer.
+        :type screen: Screen
+        :param sprites: The sprites painted on the frame, see Renderer.render. Only the
+            frozen ones (see Screen.freeze) are used: the writer reads the sprites while
+            the game runs, so they must not change.
+        :type sprites: Sequence[Placement]
+        :param regions: The regions of the screen that changed since the last submitted
+            frame, see Renderer.render. Default is None, which compares the whole screen.
+        :type regions: Sequence[Rect] | None
+        """
+        self.__raise_error()
+        if (screen.width, screen.height) != (self.renderer.width, self.renderer.height):
+            raise ValueError(
+                f"Cannot render screen of size ({screen.width}, {screen.height}) with a"
+                f" renderer of size ({self.renderer.width}, {self.renderer.height})"
+            )
+
+        # every framebuffer is now behind by the changed regions, the ones held by the
+        # writer too (it never reads the stale regions)
+        changed = [Rect(0, 0, screen.width, screen.height)] if regions is None else regions
+        for framebuffer in self.__framebuffers:
+            framebuffer.stale.extend(changed)
+
+        with self.__condition:
+            self.__condition.wait_for(lambda: self.__free or self.__error is not None)
+            self.__raise_error()
+            framebuffer = self.__free.pop()
+
+        for region in merge_rects(framebuffer.stale):
+            target = framebuffer.screen.buffers(region)
+            for buffer, source in zip(target, screen.buffers(region)):
+                buffer[...] = source
+        framebuffer.stale = []
+        framebuffer.screen.touch()
+
+        frame = PipelineFrame(
+            framebuffer,
+            [placement for placement in sprites if placement[0].frozen],
+            None if regions is None else list(regions),
+            self.color_depth,
+        )
+        with self.__condition:
+            previous = self.__pending
+            if previous is not None:
+                # the writer did not get to the previous frame, draw its changes with this one
+                if previous.regions is None or frame.regions is None:
+                    frame.regions = None
+                else:
+                    frame.regions = merge_rects(previous.regions + frame.regions)
+                self.__free.append(previous.framebuffer)
+                self.__replaced += 1
+            self.__pending = frame
+            self.__condition.notify_all()
+
+    def __write(self) -> None:
+        """
+        Writer thread: render the latest submitted frame, until stopped.
+        """
+        while True:
+            with self.__condition:
+                self.__condition.wait_for(lambda: self.__pending is not None or self.__stopping)
+                frame = self.__pending
+                if frame is None:
+                    return
+                self.__pending = None
+
+            try:
+                start = time.perf_counter()
+                if frame.color_depth is not None:
+                    self.renderer.set_color_depth(frame.color_depth)
+                self.renderer.render(frame.framebuffer.screen, frame.sprites, frame.regions)
+                self.__render_time = time.perf_counter() - start
+                self.__rendered += 1
+            except BaseException as error:  # raised on the game's thread, see submit
+                with self.__condition:
+                    self.__error = error
+                    self.__free.append(frame.framebuffer)
+                    self.__condition.notify_all()
+                return
+
+            with self.__condition:
+                self.__free.append(frame.framebuffer)
+                self.__condition.notify_all()
+
+    def __raise_error(self) -> None:
+        if self.__error is not None:
+            error, self.__error = self.__error, None
+            raise RuntimeError("The render pipeline's writer thread failed") from error
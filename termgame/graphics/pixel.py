@@ -1,7 +1,10 @@
 """
-Description: This file defines two classes for working with RGB colors: RGBColor and RGBPixel. 
-RGBColor is a simple class for representing an RGB color with values between 0-255 for the red, green, and blue channels. 
-RGBPixel extends RGBColor to include a symbol and transparency value for displaying pixels in a terminal. 
+Description: This file defines two classes for working with RGB colors: RGBColor and RGBPixel.
+RGBColor is a simple class for representing an RGB color with values between 0-255 for the red, green, and blue channels.
+RGBPixel extends RGBColor to include a symbol and transparency value for displaying pixels in a terminal.
+
+Both classes are immutable and interned: creating the same color (or pixel) twice returns
+the same instance, as long as it is still in use somewhere.
 
 Author: Gregory Glatzer
 
@@ -10,8 +13,8 @@ Date: 3/25/2023
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import Tuple
+from weakref import WeakValueDictionary
 
 from colr import color  # type: ignore
 
@@ -19,11 +22,20 @@ from colr import color  # type: ignore
 class RGBColor:
     """
     Represents an RGB color. It stores values for red, green, and blue channels, each with a range of 0 to 255.
+    Colors are immutable, and identical colors share a single instance.
     """
 
-    def __init__(self, r: int = 0, g: int = 0, b: int = 0) -> None:
+    __slots__ = ("r", "g", "b", "__weakref__")
+
+    r: int
+    g: int
+    b: int
+
+    __interned: WeakValueDictionary[Tuple[int, int, int], RGBColor] = WeakValueDictionary()
+
+    def __new__(cls, r: int = 0, g: int = 0, b: int = 0) -> RGBColor:
         """
-        Initialize an RGBColor object with the given red, green, and blue channel values.
+        Create an RGBColor object with the given red, green, and blue channel values.
 
         :param r: The red channel value. Defaults to 0.
         :type r: int
@@ -31,17 +43,44 @@ class RGBColor:
         :type g: int
         :param b: The blue channel value. Defaults to 0.
         :type b: int
+        :raises ValueError: If a value is not between 0 and 255, inclusive.
         """
 
-        self.r = 0
-        self.g = 0
-        self.b = 0
-        self.set(r, "r")
-        self.set(g, "g")
-        self.set(b, "b")
+        # Check the validity of the input values
+        for value in (r, g, b):
+            if not 0 <= value <= 255:
+                raise ValueError(f"Invalid value: {value}. Value must be between 0-255, inclusive")
+
+        return cls.unchecked(r, g, b)
+
+    @classmethod
+    def unchecked(cls, r: int, g: int, b: int) -> RGBColor:
+        """
+        Get the RGBColor with the given channel values, without validating them.
+        Only use this when the values are known to be between 0-255 (e.g. read from a uint8 buffer).
+
+        :param r: The red channel value.
+        :type r: int
+        :param g: The green channel value.
+        :type g: int
+        :param b: The blue channel value.
+        :type b: int
+        :return: The (shared) RGBColor object.
+        :rtype: RGBColor
+        """
+        key = (int(r), int(g), int(b))
+        rgb = cls.__interned.get(key)
+        if rgb is None:
+            rgb = object.__new__(cls)
+            object.__setattr__(rgb, "r", key[0])
+            object.__setattr__(rgb, "g", key[1])
+            object.__setattr__(rgb, "b", key[2])
+            cls.__interned[key] = rgb
+        return rgb
 
     def set(self, value: int, channel: str) -> RGBColor:
-        """Set the color value for a specific RGB channel.
+        """Get a copy of this color with the value of a specific RGB channel changed.
+        Colors are immutable, so this color is left unchanged.
 
         :param value: An integer value between 0 and 255, inclusive, representing the color value to set.
         :type value: int
@@ -52,20 +91,16 @@ class RGBColor:
         :raises ValueError: If the value is not between 0 and 255, inclusive, or if the channel is not one of "r", "g", or "b".
         """
 
-        # Check the validity of the input values
-        if not 0 <= value <= 255:
-            raise ValueError(f"Invalid value: {value}. Value must be between 0-255, inclusive")
         if channel not in ["r", "g", "b"]:
             raise ValueError("Channel must be r, g, or b")
 
-        # Set the color value
-        self.__setattr__(channel, value)
-
-        return self
+        values = {"r": self.r, "g": self.g, "b": self.b, channel: value}
+        return RGBColor(values["r"], values["g"], values["b"])
 
     def set_tuple(self, values: Tuple[int, int, int]) -> RGBColor:
         """
-        Sets the color for the RGB channels using a tuple of 3 integer values between 0-255, inclusive.
+        Get the color with the given RGB values, from a tuple of 3 integer values between 0-255, inclusive.
+        Colors are immutable, so this color is left unchanged.
 
         :param values: A tuple of 3 integers representing the RGB values of the color.
         :type values: Tuple[int, int, int]
@@ -73,10 +108,10 @@ class RGBColor:
         :rtype: RGBColor
         :raises ValueError: If the input values are not integers between 0-255, inclusive.
         """
-        self.set(values[0], "r")
-        self.set(values[1], "g")
-        self.set(values[2], "b")
-        return self
+        return RGBColor(*values)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("RGBColor is immutable. Use set() to get an updated color.")
 
     def __repr__(self):
         """
@@ -99,18 +134,27 @@ class RGBColor:
         :rtype: bool
         """
 
+        if self is other:
+            return True
+
         if not isinstance(other, RGBColor):
             raise NotImplementedError(f"Cannot compare RGBColor to {type(other)}")
 
         return (self.r == other.r) and (self.g == other.g) and (self.b == other.b)
 
+    def __hash__(self) -> int:
+        return hash((self.r, self.g, self.b))
+
+    def __reduce__(self):
+        return (RGBColor.unchecked, (self.r, self.g, self.b))
+
     __str__ = __repr__
 
 
-@dataclass
 class RGBPixel:
     """
     A class representing an RGB pixel that can keep track of its color.
+    Pixels are immutable, and identical pixels share a single instance.
 
     Attributes
     ----------
@@ -123,6 +167,8 @@ class RGBPixel:
 
     Methods
     -------
+    unchecked(color, symbol, transparent) -> RGBPixel:
+        Gets the (shared) pixel with the given values, without checking their types.
     display() -> None:
         Prints the pixel to the console with its current color.
     get() -> str:
@@ -133,11 +179,61 @@ class RGBPixel:
     Notes
     -----
     A pixel's color can be set by creating an RGBColor object and passing it to the constructor.
+    Screens do not store RGBPixel objects; they are created on demand when accessing
+    ``screen.pixels[y][x]`` and unpacked into the screen's buffers by ``Screen.set_px``.
     """
 
-    color: RGBColor = RGBColor()
-    symbol: str = "\u2001\u2001"
-    transparent: bool = False
+    __slots__ = ("color", "symbol", "transparent", "__weakref__")
+
+    color: RGBColor
+    symbol: str
+    transparent: bool
+
+    __interned: WeakValueDictionary[Tuple[RGBColor, str, bool], RGBPixel] = WeakValueDictionary()
+
+    def __new__(
+        cls, color: RGBColor | None = None, symbol: str = "\u2001\u2001", transparent: bool = False
+    ) -> RGBPixel:
+        if color is None:
+            color = RGBColor()
+        if not isinstance(color, RGBColor):
+            raise TypeError(f"Pixel color must be an RGBColor, got {type(color)}")
+        return cls.unchecked(color, str(symbol), bool(transparent))
+
+    @classmethod
+    def unchecked(cls, color: RGBColor, symbol: str, transparent: bool) -> RGBPixel:
+        """
+        Get the pixel with the given values, without checking their types.
+
+        Parameters
+        ----------
+        color : RGBColor
+            The color of the pixel.
+        symbol : str
+            The symbol that represents the pixel.
+        transparent : bool
+            Whether the pixel is transparent.
+
+        Returns
+        -------
+        RGBPixel
+            The (shared) pixel.
+        """
+        key = (color, symbol, transparent)
+        px = cls.__interned.get(key)
+        if px is None:
+            px = object.__new__(cls)
+            object.__setattr__(px, "color", color)
+            object.__setattr__(px, "symbol", symbol)
+            object.__setattr__(px, "transparent", transparent)
+            cls.__interned[key] = px
+        return px
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("RGBPixel is immutable. Create a new pixel instead.")
+
+    def __reduce__(self):
+        return (RGBPixel.unchecked, (self.color, self.symbol, self.transparent))
 
     def display(self) -> None:
         """
@@ -171,10 +267,15 @@ class RGBPixel:
         bool
             True if the objects are equal, False otherwise.
         """
+        if self is other:
+            return True
         if not isinstance(other, RGBPixel):
             return NotImplementedError(f"Cannot compare RGBPixel to {type(other)}")
         return self.color == other.color
 
+    def __hash__(self) -> int:
+        return hash(self.color)
+
     def __str__(self) -> str:
         """
         Returns a string representation of the pixel with its current color.
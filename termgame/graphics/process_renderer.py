@@ -0,0 +1,514 @@
+"""
+Description: Render frames in a separate process, fed through a shared-memory framebuffer.
+Author: Gregory Glatzer
+Date: 5/02/2023
+"""
+
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import sys
+import time
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from .encoder import BEGIN_SYNCHRONIZED_UPDATE, END_SYNCHRONIZED_UPDATE, Cells, FrameEncoder
+from .quantize import COLOR_DEPTHS
+from .rect import Rect
+from .renderer import CLEAR_TERMINAL, Placement, changed_runs, move_cursor
+from .screen import DEFAULT_SYMBOL, SYMBOL_DTYPE, Screen
+
+# Size of the header of a shared framebuffer, in int64: the sequence number, and the index
+# of the color depth in COLOR_DEPTHS.
+_HEADER = 2
+
+# Number of times a reader retries a frame torn by a concurrent write before giving up.
+READ_RETRIES = 100
+
+
+class SharedFramebuffer:
+    """
+    A screen's buffers (colors, alpha and symbols) in shared memory, with a frame sequence
+    number, so a frame written by one process can be read by others without copying
+    it through a pipe.
+
+    Frames are handed off without locks, with a sequence lock: the writer makes the
+    sequence number odd while it writes and even once it is done, and readers retry
+    when the number was odd or changed while they read. There must be a single writer.
+    """
+
+    def __init__(self, width: int, height: int, name: str | None = None):
+        """
+        Create a shared framebuffer, or attach to an existing one.
+
+        :param width: Width of the frames.
+        :type width: int
+        :param height: Height of the frames.
+        :type height: int
+        :param name: Name of the shared memory block to attach to. Default is None,
+            which creates a new block (see unlink).
+        :type name: str | None
+        """
+        self.width = width
+        self.height = height
+        pixels = width * height
+        symbol_size = np.dtype(SYMBOL_DTYPE).itemsize
+        size = _HEADER * 8 + pixels * (3 + 1 + symbol_size)
+        self.__shm = SharedMemory(name=name, create=name is None, size=size)
+
+        buffer = self.__shm.buf
+        self.__header = np.ndarray((_HEADER,), dtype=np.int64, buffer=buffer)
+        offset = _HEADER * 8
+        self.colors = np.ndarray((height, width, 3), dtype=np.uint8, buffer=buffer, offset=offset)
+        offset += pixels * 3
+        self.alpha = np.ndarray((height, width), dtype=bool, buffer=buffer, offset=offset)
+        offset += pixels
+        self.symbols = np.ndarray(
+            (height, width), dtype=SYMBOL_DTYPE, buffer=buffer, offset=offset
+        )
+        if name is None:
+            # start as a cleared screen, so a first frame written in part is drawn correctly
+            self.__header[:] = 0
+            self.symbols[:] = DEFAULT_SYMBOL
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block, to attach to it from other processes."""
+        return self.__shm.name
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the last frame written. Odd while a frame is being written."""
+        return int(self.__header[0])
+
+    def write(
+        self, screen: Screen, regions: Sequence[Rect] | None = None, color_depth: str = "truecolor"
+    ) -> int:
+        """
+        Write a frame. Only the regions that changed since the last frame are copied.
+
+        :param screen: The frame. Must match the size of the framebuffer.
+        :type screen: Screen
+        :param regions: The regions that changed since the last frame written.
+            Default is None, which copies the whole screen.
+        :type regions: Sequence[Rect] | None
+        :param color_depth: The color depth to render the frame with. Default is "truecolor".
+        :type color_depth: str
+        :return: The sequence number of the frame.
+        :rtype: int
+        """
+        if (screen.width, screen.height) != (self.width, self.height):
+            raise ValueError(
+                f"Cannot write screen of size ({screen.width}, {screen.height}) to a"
+                f" framebuffer of size ({self.width}, {self.height})"
+            )
+        if regions is None:
+            regions = [Rect(0, 0, self.width, self.height)]
+
+        header = self.__header
+        header[0] += 1
+        for region in regions:
+            colors, alpha, symbols = screen.buffers(region)
+            self.colors[region.slices] = colors
+            self.alpha[region.slices] = alpha
+            self.symbols[region.slices] = symbols
+        header[1] = COLOR_DEPTHS.index(color_depth)
+        header[0] += 1
+        return int(header[0])
+
+    def read(self, screen: Screen, last: int = -1) -> Tuple[int, str] | None:
+        """
+        Copy the last frame written into a screen, if it is newer than the given one.
+
+        :param screen: The screen to copy into, the size of the framebuffer.
+        :type screen: Screen
+        :param last: Sequence number of the last frame read. Default is -1.
+        :type last: int
+        :return: The sequence number and color depth of the frame copied, or None if there
+            is no newer frame (or it could not be read without being torn).
+        :rtype: Tuple[int, str] | None
+        """
+        header = self.__header
+        for _ in range(READ_RETRIES):
+            sequence = int(header[0])
+            if sequence == last:
+                return None
+            if sequence % 2 == 1:
+                # the frame is being written
+                time.sleep(0)
+                continue
+
+            color_depth = COLOR_DEPTHS[int(header[1])]
+            np.copyto(screen.colors, self.colors)
+            np.copyto(screen.alpha, self.alpha)
+            np.copyto(screen.symbols, self.symbols)
+            if int(header[0]) == sequence:
+                screen.touch()
+                return sequence, color_depth
+        return None
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory block.
+        """
+        # the arrays must not outlive the memory they view
+        del self.colors, self.alpha, self.symbols, self.__header
+        self.__shm.close()
+
+    def unlink(self) -> None:
+        """
+        Free the shared memory block. Call it once, from the process that created it.
+        """
+        self.__shm.unlink()
+
+
+class BandEncoder:
+    """
+    Encodes the changes of a band of cell rows of a frame, as the escape sequences drawing
+    them at their place on the terminal. It keeps the cells of the band from the last frame
+    it encoded, like Renderer, so only the cells that changed are encoded.
+    """
+
+    def __init__(self, encoder: FrameEncoder, row_start: int):
+        """
+        :param encoder: The encoder to encode the cells with.
+        :type encoder: FrameEncoder
+        :param row_start: The first row of cells of the band, on the terminal.
+        :type row_start: int
+        """
+        self.encoder = encoder
+        self.row_start = row_start
+        self.__front: Cells | None = None
+
+    def set_color_depth(self, color_depth: str) -> None:
+        """
+        Change the colors used for output (see Renderer.set_color_depth).
+        """
+        if color_depth != self.encoder.color_depth:
+            self.encoder = FrameEncoder(False, self.encoder.mode, color_depth, self.encoder.dither)
+
+    def encode(self, band: Screen) -> str:
+        """
+        Encode the cells of the band that changed since the last call.
+
+        :param band: The pixels of the band. In "halfblock" mode, it must start
+            on an even row of the frame.
+        :type band: Screen
+        :return: The escape sequences drawing the changes, ending with the style reset.
+        :rtype: str
+        """
+        encoder = self.encoder
+        # the style of the terminal depends on what was written before the band
+        encoder.begin()
+        cells = encoder.to_cells(band)
+        front = self.__front
+        if front is None:
+            changed = np.ones(cells.glyphs.shape, dtype=bool)
+            self.__front = cells.copy()
+        else:
+            changed = (
+                (cells.fg != front.fg) | (cells.bg != front.bg) | (cells.glyphs != front.glyphs)
+            )
+            front.assign(cells)
+
+        encoded: List[str] = []
+        for y, x_start, x_end in changed_runs(changed):
+            encoded.append(move_cursor(x_start, self.row_start + y, encoder.cell_width))
+            encoded.append(encoder.encode_row(cells, y, x_start, x_end))
+        if encoded:
+            encoded.append(encoder.end_style())
+        return "".join(encoded)
+
+
+def _row_bands(width: int, height: int, mode: str, bands: int) -> List[Tuple[int, int]]:
+    """
+    Split the rows of pixels of a frame into bands of whole rows of cells.
+
+    :return: The (first row, row after the last) of each band, in pixels.
+    """
+    pixel_rows = 2 if mode == "halfblock" else 1
+    cell_rows = -(-height // pixel_rows)
+    edges = np.linspace(0, cell_rows, bands + 1).round().astype(int).tolist()
+    return [
+        (start * pixel_rows, min(end * pixel_rows, height))
+        for start, end in zip(edges[:-1], edges[1:])
+        if end > start
+    ]
+
+
+def _band_screen(frame: SharedFramebuffer | Screen, rows: Tuple[int, int]) -> Screen:
+    """
+    A screen whose buffers are views of a band of rows of a frame.
+    """
+    start, end = rows
+    band = Screen(frame.width, end - start)
+    band.colors = frame.colors[start:end]
+    band.alpha = frame.alpha[start:end]
+    band.symbols = frame.symbols[start:end]
+    return band
+
+
+def _encode_worker(
+    snapshot_name: str,
+    width: int,
+    height: int,
+    encoder_options: Tuple[str, str, bool],
+    rows: Tuple[int, int],
+    connection: Connection,
+) -> None:
+    """
+    Worker process encoding a band of rows of the frames copied into a snapshot.
+    Receives the color depth of each frame to encode, and sends back the encoded band.
+    None stops the worker.
+    """
+    snapshot = SharedFramebuffer(width, height, snapshot_name)
+    band = _band_screen(snapshot, rows)
+    pixel_rows = 2 if encoder_options[0] == "halfblock" else 1
+    band_encoder = BandEncoder(FrameEncoder(False, *encoder_options), rows[0] // pixel_rows)
+    try:
+        while True:
+            try:
+                color_depth = connection.recv()
+            except EOFError:  # the renderer process exited
+                break
+            if color_depth is None:
+                break
+            band_encoder.set_color_depth(color_depth)
+            band.touch()
+            connection.send(band_encoder.encode(band))
+    finally:
+        del band
+        snapshot.close()
+
+
+def _render_process(
+    framebuffer_name: str,
+    snapshot_name: str,
+    width: int,
+    height: int,
+    synchronized: bool,
+    encoder_options: Tuple[str, str, bool],
+    rows: Tuple[int, int],
+    connections: List[Connection],
+    frame_ready,
+    stopping,
+    render_time,
+) -> None:
+    """
+    Renderer process: copy the latest frame of the shared framebuffer into the snapshot,
+    encode the first band of rows while the workers encode theirs, and write the frame
+    to stdout, storing how long that took in render_time. Stops the workers when it stops,
+    once no frame is left to render.
+    """
+    framebuffer = SharedFramebuffer(width, height, framebuffer_name)
+    snapshot = SharedFramebuffer(width, height, snapshot_name)
+    pixel_rows = 2 if encoder_options[0] == "halfblock" else 1
+    screen = Screen(width, height)
+    band = _band_screen(snapshot, rows)
+    band_encoder = BandEncoder(FrameEncoder(False, *encoder_options), 0)
+    last = -1
+    first_frame = True
+    try:
+        while True:
+            if not frame_ready.wait(0.1):
+                if stopping.is_set():
+                    break
+                continue
+            frame_ready.clear()
+            start = time.perf_counter()
+            read = framebuffer.read(screen, last)
+            if read is None:
+                continue
+            last, color_depth = read
+
+            # the workers read the snapshot, which only changes between frames
+            snapshot.write(screen, color_depth=color_depth)
+            for connection in connections:
+                connection.send(color_depth)
+            band_encoder.set_color_depth(color_depth)
+            band.touch()
+            encoded = [band_encoder.encode(band)]
+            encoded.extend(connection.recv() for connection in connections)
+            if not first_frame and not any(encoded):
+                continue
+
+            frame = "".join(encoded)
+            frame += move_cursor(0, -(-height // pixel_rows), band_encoder.encoder.cell_width)
+            if first_frame:
+                frame = CLEAR_TERMINAL + frame
+                first_frame = False
+            if synchronized:
+                frame = BEGIN_SYNCHRONIZED_UPDATE + frame + END_SYNCHRONIZED_UPDATE
+            sys.stdout.write(frame)
+            sys.stdout.flush()
+            render_time.value = time.perf_counter() - start
+    finally:
+        for connection in connections:
+            connection.send(None)
+        del band
+        framebuffer.close()
+        snapshot.close()
+
+
+class ProcessRenderer:
+    """
+    Renders frames in a separate process, so encoding them does not compete with the game
+    for the GIL. Frames are written to a shared framebuffer (see SharedFramebuffer), and
+    the renderer process draws the latest one, only writing the cells that changed.
+
+    With more than one worker, the rows of each frame are split into bands, encoded in
+    parallel by worker processes, and written to the terminal together by the renderer
+    process, in a single write.
+
+    It has the interface of RenderPipeline, so the engine can use either.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        synchronized: bool = False,
+        mode: str = "full",
+        color_depth: str = "truecolor",
+        dither: bool = False,
+        workers: int = 1,
+    ):
+        """
+        Initialize a renderer process for screens of the given size (see Renderer).
+
+        :param workers: Number of processes encoding bands of rows of each frame,
+            including the renderer process. Default is 1.
+        :type workers: int
+        """
+        if workers < 1:
+            raise ValueError(f"A process renderer needs at least 1 worker. Got {workers}")
+        # check the options here, rather than in the renderer process
+        FrameEncoder(synchronized, mode, color_depth, dither)
+
+        self.width = width
+        self.height = height
+        self.synchronized = synchronized
+        self.workers = workers
+        # the color depth submitted frames are rendered with
+        self.color_depth: str = color_depth
+        self.__encoder_options = (mode, color_depth, dither)
+        self.__framebuffers: List[SharedFramebuffer] = []
+        self.__processes: List[multiprocessing.Process] = []
+        self.__frame_ready = multiprocessing.Event()
+        self.__stopping = multiprocessing.Event()
+        self.__render_time = multiprocessing.Value("d", 0.0, lock=False)
+
+    @property
+    def render_time(self) -> float:
+        """
+        Seconds the renderer process took to encode and write the last frame (see
+        RenderPipeline.render_time).
+        """
+        return self.__render_time.value
+
+    def start(self) -> None:
+        """
+        Start the renderer process, and the worker processes.
+        """
+        if self.__processes:
+            return
+        framebuffer = SharedFramebuffer(self.width, self.height)
+        snapshot = SharedFramebuffer(self.width, self.height)
+        self.__framebuffers = [framebuffer, snapshot]
+        self.__stopping.clear()
+        self.__frame_ready.clear()
+
+        # the renderer process encodes the first band, worker processes the others
+        bands = _row_bands(self.width, self.height, self.__encoder_options[0], self.workers)
+        connections = []
+        for rows in bands[1:]:
+            connection, worker_connection = multiprocessing.Pipe()
+            self.__processes.append(
+                multiprocessing.Process(
+                    target=_encode_worker,
+                    args=(
+                        snapshot.name,
+                        self.width,
+                        self.height,
+                        self.__encoder_options,
+                        rows,
+                        worker_connection,
+                    ),
+                    name="termgame-encoder",
+                    daemon=True,
+                )
+            )
+            connections.append(connection)
+        self.__processes.insert(
+            0,
+            multiprocessing.Process(
+                target=_render_process,
+                args=(
+                    framebuffer.name,
+                    snapshot.name,
+                    self.width,
+                    self.height,
+                    self.synchronized,
+                    self.__encoder_options,
+                    bands[0],
+                    connections,
+                    self.__frame_ready,
+                    self.__stopping,
+                    self.__render_time,
+                ),
+                name="termgame-renderer",
+                daemon=True,
+            ),
+        )
+        for process in self.__processes:
+            process.start()
+        # free the shared memory even if the game never stops the renderer
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """
+        Render the latest frame, if it was not rendered yet, stop the renderer and worker
+        processes, and free the shared framebuffers.
+        """
+        if not self.__processes:
+            return
+        atexit.unregister(self.stop)
+        self.__stopping.set()
+        self.__frame_ready.set()
+        for process in self.__processes:
+            process.join()
+        self.__processes = []
+        for framebuffer in self.__framebuffers:
+            framebuffer.close()
+            framebuffer.unlink()
+        self.__framebuffers = []
+
+    def submit(
+        self,
+        screen: Screen,
+        sprites: Sequence[Placement] = (),
+        regions: Sequence[Rect] | None = None,
+    ) -> None:
+        """
+        Hand a frame to the renderer process. Never waits for it: if the process is still
+        busy with an earlier frame, it draws the latest one once it is done.
+
+        :param screen: The frame. Must match the size of the renderer.
+        :type screen: Screen
+        :param sprites: Ignored. The sprites' encoded rows live in the game's process.
+        :type sprites: Sequence[Placement]
+        :param regions: The regions of the screen that changed since the last submitted
+            frame. Default is None, which copies the whole screen.
+        :type regions: Sequence[Rect] | None
+        """
+        if not self.__processes:
+            raise RuntimeError("The process renderer is not started")
+        renderer = self.__processes[0]
+        if not renderer.is_alive():
+            raise RuntimeError(f"The renderer process exited with code {renderer.exitcode}")
+        self.__framebuffers[0].write(screen, regions, self.color_depth)
+        self.__frame_ready.set()
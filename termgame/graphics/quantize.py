@@ -0,0 +1,168 @@
+"""
+Description: Quantize colors to the 256 and 16 color palettes of the terminal.
+Author: Gregory Glatzer
+Date: 4/18/2023
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
+# Supported color depths. "truecolor" keeps 24-bit colors, the others use the xterm palettes.
+COLOR_DEPTHS = ("truecolor", "256", "16")
+
+# Number of bits per channel kept when looking up the nearest palette color.
+TABLE_BITS = 5
+
+# 4x4 Bayer matrix for ordered dithering, normalized to [-0.5, 0.5).
+BAYER_4X4 = (
+    np.array(
+        [
+            [0, 8, 2, 10],
+            [12, 4, 14, 6],
+            [3, 11, 1, 9],
+            [15, 7, 13, 5],
+        ],
+        dtype=np.float32,
+    )
+    / 16
+    - 0.5
+)
+
+# Strength of the dithering for each palette, roughly the distance between palette colors.
+DITHER_SPREAD = {"256": 48, "16": 96}
+
+ANSI_16 = np.array(
+    [
+        (0, 0, 0),
+        (205, 0, 0),
+        (0, 205, 0),
+        (205, 205, 0),
+        (0, 0, 238),
+        (205, 0, 205),
+        (0, 205, 205),
+        (229, 229, 229),
+        (127, 127, 127),
+        (255, 0, 0),
+        (0, 255, 0),
+        (255, 255, 0),
+        (92, 92, 255),
+        (255, 0, 255),
+        (0, 255, 255),
+        (255, 255, 255),
+    ],
+    dtype=np.uint8,
+)
+
+
+def pack_colors(colors: np.ndarray) -> np.ndarray:
+    """
+    Pack RGB colors into single integers (0xRRGGBB), so they can be compared and hashed at once.
+
+    :param colors: uint8 array with the RGB channels in the last axis.
+    :type colors: np.ndarray
+    :return: int64 array with the packed colors.
+    :rtype: np.ndarray
+    """
+    colors = colors.astype(np.int64)
+    return (colors[..., 0] << 16) | (colors[..., 1] << 8) | colors[..., 2]
+
+
+@lru_cache(maxsize=None)
+def palette(depth: str) -> np.ndarray:
+    """
+    The colors of the xterm palette with the given depth.
+
+    :param depth: Either "256" or "16".
+    :type depth: str
+    :return: uint8 array of shape (n_colors, 3).
+    :rtype: np.ndarray
+    """
+    if depth == "16":
+        return ANSI_16
+    if depth != "256":
+        raise ValueError(f"No palette for color depth {depth}")
+
+    # 16 system colors, a 6x6x6 color cube and 24 shades of gray
+    levels = np.array([0, 95, 135, 175, 215, 255], dtype=np.uint8)
+    cube = np.stack(np.meshgrid(levels, levels, levels, indexing="ij"), axis=-1).reshape(-1, 3)
+    grays = np.repeat(np.arange(8, 248, 10, dtype=np.uint8)[:, None], 3, axis=1)
+    return np.vstack((ANSI_16, cube, grays))
+
+
+@lru_cache(maxsize=None)
+def quantization_table(depth: str) -> np.ndarray:
+    """
+    Lookup table from colors (with TABLE_BITS bits per channel) to the index of the
+    nearest color of the palette. Computed once per depth. The 256 color palette is
+    only searched from index 16: its first 16 colors are the system colors, which
+    depend on the terminal's theme.
+
+    :param depth: Either "256" or "16".
+    :type depth: str
+    :return: uint8 array of shape (2**TABLE_BITS,) * 3.
+    :rtype: np.ndarray
+    """
+    size = 1 << TABLE_BITS
+    step = 256 // size
+    first = 16 if depth == "256" else 0
+    targets = palette(depth)[first:].astype(np.int32)
+
+    # the center of each bucket of colors
+    levels = np.arange(size, dtype=np.int32) * step + step // 2
+    colors = np.stack(np.meshgrid(levels, levels, levels, indexing="ij"), axis=-1).reshape(-1, 3)
+
+    # compute distances in chunks to bound memory use
+    table = np.empty(len(colors), dtype=np.uint8)
+    for start in range(0, len(colors), 4096):
+        chunk = colors[start : start + 4096]
+        distances = ((chunk[:, None, :] - targets[None, :, :]) ** 2).sum(axis=2)
+        table[start : start + 4096] = distances.argmin(axis=1) + first
+    return table.reshape(size, size, size)
+
+
+def quantize(
+    colors: np.ndarray,
+    depth: str = "truecolor",
+    dither: bool = False,
+    origin: Tuple[int, int] = (0, 0),
+) -> np.ndarray:
+    """
+    Quantize colors to the given color depth.
+
+    :param colors: uint8 array of shape (height, width, 3).
+    :type colors: np.ndarray
+    :param depth: One of COLOR_DEPTHS. Default is "truecolor".
+    :type depth: str
+    :param dither: Whether to apply ordered dithering before quantizing. Default is False.
+    :type dither: bool
+    :param origin: (x, y) position of the colors on the screen, so the dithering pattern
+        of a part of a screen lines up with the one of the whole screen. Default is (0, 0).
+    :type origin: Tuple[int, int]
+    :return: int64 array of shape (height, width) with packed colors (0xRRGGBB) for
+        "truecolor", or palette indices for the other depths.
+    :rtype: np.ndarray
+    """
+    if depth not in COLOR_DEPTHS:
+        raise ValueError(f"Invalid color depth: {depth}. Must be one of {list(COLOR_DEPTHS)}")
+
+    if depth == "truecolor":
+        return pack_colors(colors)
+
+    if dither:
+        height, width = colors.shape[:2]
+        x, y = origin[0] % 4, origin[1] % 4
+        reps = (-(-(y + height) // 4), -(-(x + width) // 4))
+        threshold = (
+            np.tile(BAYER_4X4, reps)[y : y + height, x : x + width, None] * DITHER_SPREAD[depth]
+        )
+        colors = np.clip(colors + threshold, 0, 255).astype(np.uint8)
+
+    shift = 8 - TABLE_BITS
+    table = quantization_table(depth)
+    return table[colors[..., 0] >> shift, colors[..., 1] >> shift, colors[..., 2] >> shift].astype(
+        np.int64
+    )
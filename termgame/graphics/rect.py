@@ -0,0 +1,104 @@
+"""
+Description: Axis-aligned rectangles, used to track the regions of a screen that changed.
+Author: Gregory Glatzer
+Date: 4/23/2023
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List, NamedTuple, Tuple
+
+
+class Rect(NamedTuple):
+    """
+    An axis-aligned rectangle of pixels (or cells), with its top-left corner at (x, y).
+    """
+
+    x: int
+    y: int
+    width: int
+    height: int
+
+    @property
+    def right(self) -> int:
+        """x-coordinate after the last column of the rectangle."""
+        return self.x + self.width
+
+    @property
+    def bottom(self) -> int:
+        """y-coordinate after the last row of the rectangle."""
+        return self.y + self.height
+
+    @property
+    def is_empty(self) -> bool:
+        return self.width <= 0 or self.height <= 0
+
+    @property
+    def slices(self) -> Tuple[slice, slice]:
+        """
+        The (y, x) slices selecting the rectangle in an array indexed as [y, x].
+        """
+        return slice(self.y, self.bottom), slice(self.x, self.right)
+
+    def intersection(self, other: Rect) -> Rect:
+        """
+        The part of this rectangle inside another one. Empty if they do not overlap.
+
+        :param other: The other rectangle.
+        :type other: Rect
+        :return: The intersection.
+        :rtype: Rect
+        """
+        x, y = max(self.x, other.x), max(self.y, other.y)
+        right, bottom = min(self.right, other.right), min(self.bottom, other.bottom)
+        return Rect(x, y, max(right - x, 0), max(bottom - y, 0))
+
+    def union(self, other: Rect) -> Rect:
+        """
+        The smallest rectangle containing both rectangles.
+
+        :param other: The other rectangle.
+        :type other: Rect
+        :return: The bounding rectangle.
+        :rtype: Rect
+        """
+        x, y = min(self.x, other.x), min(self.y, other.y)
+        right, bottom = max(self.right, other.right), max(self.bottom, other.bottom)
+        return Rect(x, y, right - x, bottom - y)
+
+    def overlaps(self, other: Rect) -> bool:
+        """
+        Check if the rectangles share at least one pixel.
+
+        :param other: The other rectangle.
+        :type other: Rect
+        :return: True if the rectangles overlap.
+        :rtype: bool
+        """
+        return not self.intersection(other).is_empty
+
+
+def merge_rects(rects: Iterable[Rect]) -> List[Rect]:
+    """
+    Merge overlapping rectangles into their bounding rectangles, until none overlap.
+    Empty rectangles are dropped.
+
+    :param rects: The rectangles to merge.
+    :type rects: Iterable[Rect]
+    :return: Non-overlapping rectangles covering every input rectangle.
+    :rtype: List[Rect]
+    """
+    merged: List[Rect] = []
+    for rect in rects:
+        if rect.is_empty:
+            continue
+
+        # a merged rectangle can overlap rectangles it did not overlap before, merge again
+        overlapping = [other for other in merged if other.overlaps(rect)]
+        while overlapping:
+            for other in overlapping:
+                merged.remove(other)
+                rect = rect.union(other)
+            overlapping = [other for other in merged if other.overlaps(rect)]
+        merged.append(rect)
+    return merged
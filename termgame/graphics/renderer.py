@@ -0,0 +1,289 @@
+"""
+Description: Draw screens to the terminal, only re-drawing what changed since the last frame.
+Author: Gregory Glatzer
+Date: 4/15/2023
+"""
+
+from __future__ import annotations
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from .encoder import Cells, FrameEncoder
+from .rect import Rect
+from .screen import Screen
+
+CLEAR_TERMINAL = "\033[2J"
+
+# (sprite, x, y): a sprite painted onto the rendered screen at (x, y), in pixels
+Placement = Tuple[Screen, int, int]
+
+
+def move_cursor(x: int, y: int, cell_width: int = 2) -> str:
+    """
+    Escape sequence moving the cursor to the terminal cell (x, y).
+
+    :param x: x-coordinate of the cell.
+    :type x: int
+    :param y: y-coordinate of the cell.
+    :type y: int
+    :param cell_width: Number of terminal columns a cell spans. Default is 2.
+    :type cell_width: int
+    :return: The escape sequence.
+    :rtype: str
+    """
+    return f"\033[{y + 1};{x * cell_width + 1}H"
+
+
+def changed_runs(changed: np.ndarray) -> List[Tuple[int, int, int]]:
+    """
+    Group the changed cells of a frame into horizontal runs.
+
+    :param changed: Boolean array of shape (height, width), True where a cell changed.
+    :type changed: np.ndarray
+    :return: List of (y, x_start, x_end) runs, with x_end exclusive.
+    :rtype: List[Tuple[int, int, int]]
+    """
+    height = changed.shape[0]
+    padding = np.zeros((height, 1), dtype=np.int8)
+    edges = np.diff(np.hstack((padding, changed.astype(np.int8), padding)), axis=1)
+
+    # np.nonzero walks the array in row-major order, so starts and ends pair up
+    starts_y, starts_x = np.nonzero(edges == 1)
+    _, ends_x = np.nonzero(edges == -1)
+    return list(zip(starts_y.tolist(), starts_x.tolist(), ends_x.tolist()))
+
+
+class Renderer:
+    """
+    Draws screens to the terminal. The renderer keeps a copy of the cells of the last
+    frame it drew (the front buffer) and only writes the cells that differ from it,
+    moving the cursor to each run of changed cells with absolute positioning.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        synchronized: bool = False,
+        mode: str = "full",
+        color_depth: str = "truecolor",
+        dither: bool = False,
+    ):
+        """
+        Initialize a renderer for screens of the given size.
+
+        :param width: Width of the screens to render.
+        :type width: int
+        :param height: Height of the screens to render.
+        :type height: int
+        :param synchronized: Whether to use the terminal's synchronized output mode.
+        :type synchronized: bool
+        :param mode: How pixels map to terminal cells, either "full" or "halfblock".
+        :type mode: str
+        :param color_depth: The colors used for output, one of "truecolor", "256" or "16".
+        :type color_depth: str
+        :param dither: Whether to dither colors when using the 256 or 16 color palettes.
+        :type dither: bool
+        """
+        self.width = width
+        self.height = height
+        self.encoder = FrameEncoder(synchronized, mode, color_depth, dither)
+        self.__front: Cells | None = None
+        # cells of the frame being rendered, updated region by region (see render)
+        self.__back: Cells | None = None
+        # whether the next render must compare the whole screen to the last frame
+        self.__compare_all = False
+
+    def reset(self) -> None:
+        """
+        Forget the last frame, so the next render clears the terminal and draws everything.
+        """
+        self.__front = None
+        self.__back = None
+
+    def set_color_depth(self, color_depth: str) -> None:
+        """
+        Change the colors used for output, e.g. to write shorter frames on a slow terminal.
+        The next render rewrites the cells whose colors change, without clearing the terminal.
+
+        :param color_depth: One of "truecolor", "256" or "16".
+        :type color_depth: str
+        """
+        if color_depth == self.encoder.color_depth:
+            return
+        encoder = self.encoder
+        self.encoder = FrameEncoder(
+            encoder.synchronized, encoder.mode, color_depth, encoder.dither
+        )
+        # the last frame's cells hold colors of the old depth
+        self.__back = None
+        self.__compare_all = True
+
+    def changed(self, cells: Cells) -> np.ndarray:
+        """
+        Compare the cells of a frame to the ones of the last rendered frame.
+
+        :param cells: The cells about to be rendered.
+        :type cells: Cells
+        :return: Boolean array with the shape of the cells, True where a cell changed.
+        :rtype: np.ndarray
+        """
+        if self.__front is None:
+            return np.ones(cells.glyphs.shape, dtype=bool)
+
+        front = self.__front
+        return (cells.fg != front.fg) | (cells.bg != front.bg) | (cells.glyphs != front.glyphs)
+
+    def spliced_rows(
+        self, cells: Cells, changed: np.ndarray, sprites: Sequence[Placement]
+    ) -> List[Tuple[int, int, str]]:
+        """
+        Find the rows of sprites that can be written from their compiled rows
+        (see Screen.compiled), instead of encoding the cells of the frame.
+        A sprite row is used when some of its cells changed, it is not clipped,
+        and the frame shows it unaltered (i.e. it is opaque and nothing covers it).
+        The cells of the used rows are unmarked in changed.
+
+        :param cells: The cells about to be rendered.
+        :type cells: Cells
+        :param changed: Boolean array of the changed cells (see changed), updated in place.
+        :type changed: np.ndarray
+        :param sprites: The sprites painted onto the screen.
+        :type sprites: Sequence[Placement]
+        :return: List of (y, x, encoded row) to write, in cells.
+        :rtype: List[Tuple[int, int, str]]
+        """
+        # number of pixel rows per cell
+        pixel_rows = 2 if self.encoder.mode == "halfblock" else 1
+
+        spliced: List[Tuple[int, int, str]] = []
+        for sprite, x, y in sprites:
+            if y % pixel_rows != 0 or x < 0 or x + sprite.width > cells.width:
+                continue
+
+            compiled = sprite.compiled(self.encoder)
+            sprite_cells = compiled.cells
+            y //= pixel_rows
+
+            # the rows of the sprite that are on the screen
+            row_start, row_end = max(-y, 0), min(sprite_cells.height, cells.height - y)
+            if row_start >= row_end or sprite_cells.width == 0:
+                continue
+
+            target = (slice(y + row_start, y + row_end), slice(x, x + sprite_cells.width))
+            rows = slice(row_start, row_end)
+            use = changed[target].any(axis=1)
+            if not use.any():
+                continue
+
+            use &= (
+                (cells.fg[target] == sprite_cells.fg[rows])
+                & (cells.bg[target] == sprite_cells.bg[rows])
+                & (cells.glyphs[target] == sprite_cells.glyphs[rows])
+            ).all(axis=1)
+            for row in (np.flatnonzero(use) + row_start).tolist():
+                changed[y + row, x : x + sprite_cells.width] = False
+                spliced.append((y + row, x, self.encoder.splice(compiled, row)))
+        return spliced
+
+    def cell_region(self, region: Rect) -> Tuple[Rect, Rect]:
+        """
+        The cells covering a region of the screen.
+
+        :param region: The region, in pixels.
+        :type region: Rect
+        :return: The region of cells, and the region of pixels drawn by those cells.
+        :rtype: Tuple[Rect, Rect]
+        """
+        region = region.intersection(Rect(0, 0, self.width, self.height))
+        if self.encoder.mode == "full":
+            return region, region
+
+        # two rows of pixels per cell
+        y, bottom = region.y // 2, -(-region.bottom // 2)
+        cells = Rect(region.x, y, region.width, bottom - y)
+        pixels = Rect(region.x, 2 * y, region.width, min(2 * bottom, self.height) - 2 * y)
+        return cells, pixels
+
+    def render(
+        self,
+        screen: Screen,
+        sprites: Sequence[Placement] = (),
+        regions: Sequence[Rect] | None = None,
+    ) -> None:
+        """
+        Draw a screen to stdout, only writing the cells that changed since the last render.
+
+        :param screen: The screen to render. Must match the size of the renderer.
+        :type screen: Screen
+        :param sprites: The sprites painted onto the screen this frame, as (sprite, x, y).
+            Their rows are written from the encoded rows cached on the sprites when the
+            screen shows them unaltered, see spliced_rows. Default is no sprites.
+        :type sprites: Sequence[Placement]
+        :param regions: The regions of the screen (in pixels) that may have changed since the
+            last render. Only those are converted and compared to the last frame.
+            Default is None, which compares the whole screen.
+        :type regions: Sequence[Rect] | None
+        """
+        if (screen.width, screen.height) != (self.width, self.height):
+            raise ValueError(
+                f"Cannot render screen of size ({screen.width}, {screen.height}) with a"
+                f" renderer of size ({self.width}, {self.height})"
+            )
+
+        first_frame = self.__front is None
+        if self.__front is None or regions is None or self.__compare_all:
+            self.__compare_all = False
+            cells = self.encoder.to_cells(screen)
+            changed = self.changed(cells)
+            cell_regions = None
+        else:
+            # outside of the regions, the frame is the same as the last one
+            if self.__back is None:
+                self.__back = self.__front.copy()
+            cells = self.__back
+            changed = np.zeros(cells.glyphs.shape, dtype=bool)
+            cell_regions = []
+            for region in regions:
+                cell_region, pixel_region = self.cell_region(region)
+                if cell_region.is_empty:
+                    continue
+                cells.view(cell_region).assign(self.encoder.to_cells(screen, pixel_region))
+                front = self.__front.view(cell_region)
+                changed[cell_region.slices] = (
+                    (cells.fg[cell_region.slices] != front.fg)
+                    | (cells.bg[cell_region.slices] != front.bg)
+                    | (cells.glyphs[cell_region.slices] != front.glyphs)
+                )
+                cell_regions.append(cell_region)
+
+        if not first_frame and not changed.any():
+            return
+
+        frame = self.encoder.begin()
+        if first_frame:
+            frame.write(CLEAR_TERMINAL)
+
+        cell_width = self.encoder.cell_width
+        for y, x, row in self.spliced_rows(cells, changed, sprites):
+            frame.write(move_cursor(x, y, cell_width))
+            frame.write(row)
+        for y, x_start, x_end in changed_runs(changed):
+            frame.write(move_cursor(x_start, y, cell_width))
+            frame.write(self.encoder.encode_row(cells, y, x_start, x_end))
+
+        # park the cursor below the frame
+        frame.write(self.encoder.end_style() + move_cursor(0, cells.height, cell_width))
+        self.encoder.flush()
+
+        # copy the cells into the front buffer, reusing it between frames
+        if self.__front is None:
+            self.__front = cells.copy()
+        elif cell_regions is None:
+            self.__front.assign(cells)
+            self.__back = None
+        else:
+            for cell_region in cell_regions:
+                self.__front.view(cell_region).assign(cells.view(cell_region))
@@ -6,15 +6,150 @@ Date: 10/22/2022
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Callable, Dict, Iterator, Sequence, Tuple
 
 import numpy as np
 from PIL import Image  # type: ignore
 
+from .encoder import CompiledScreen, FrameEncoder
+from .image_cache import image_cache
 from .pixel import RGBColor, RGBPixel
+from .quantize import quantize
+from .rect import Rect
+
+# The symbol drawn for every pixel. Each game pixel spans two terminal columns.
+DEFAULT_SYMBOL = "\u2001\u2001"
+
+# dtype of the symbol plane. Symbols are at most two characters long.
+SYMBOL_DTYPE = "<U2"
+
+# encoder used by Screen.render, so its style cache is shared by all screens
+_DEFAULT_ENCODER = FrameEncoder()
+
+
+def load_image(
+    image: np.ndarray | str, resize: Tuple[int, int] | None = None, has_alpha: bool = False
+) -> np.ndarray:
+    """
+    Load an image (can be a path to an image or a numpy array) into a uint8 array of
+    shape (height, width, channels), resizing it if resize is not None.
+    Images loaded from a path are cached, see image_cache.ImageCache.
+
+    :param image: Path to an image or a numpy array.
+    :type image: np.ndarray | str
+    :param resize: The size to resize the image to.
+    :type resize: tuple[int, int] | None
+    :param has_alpha: Whether the image has an alpha channel (a 4th channel).
+    :type has_alpha: bool
+    :return: The image.
+    :rtype: np.ndarray
+    """
+    if isinstance(image, str):
+        image = image_cache.load(image, resize, has_alpha)
+    elif resize:
+        image = np.asarray(Image.fromarray(image).resize(resize))
+
+    if image.ndim != 3 or image.shape[2] < (4 if has_alpha else 3):
+        raise ValueError(
+            f"Image must have at least {4 if has_alpha else 3} channels. Got shape {image.shape}"
+        )
+
+    if image.dtype != np.uint8:
+        if image.min() < 0 or image.max() > 255:
+            raise ValueError("Invalid image values. Values must be between 0-255, inclusive")
+        image = image.astype(np.uint8)
+
+    return image
+
+
+def _wrapped_range(start: int, length: int, size: int) -> slice | np.ndarray:
+    """
+    Index of length consecutive positions from start, wrapping around an axis of the given size.
+    A slice when the positions do not wrap around, an array of positions otherwise.
+    """
+    start %= size
+    if start + length <= size:
+        return slice(start, start + length)
+    return np.arange(start, start + length) % size
+
+
+class _Revision:
+    """
+    Revision counter, shared by a screen and its views.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0
+
+
+class PixelRow:
+    """
+    A view of a single row of a screen. Indexing it returns (or sets) RGBPixel objects,
+    which are unpacked from (or into) the screen's buffers.
+    """
+
+    def __init__(self, screen: Screen, y: int):
+        self.__screen = screen
+        self.__y = y
+
+    def __getitem__(self, x: int) -> RGBPixel:
+        screen = self.__screen
+        return RGBPixel.unchecked(
+            RGBColor.unchecked(*screen.colors[self.__y, x].tolist()),
+            str(screen.symbols[self.__y, x]),
+            not screen.alpha[self.__y, x],
+        )
+
+    def __setitem__(self, x: int, px: RGBPixel) -> None:
+        screen = self.__screen
+        screen.colors[self.__y, x] = (px.color.r, px.color.g, px.color.b)
+        screen.symbols[self.__y, x] = px.symbol
+        screen.alpha[self.__y, x] = not px.transparent
+        screen.touch()
+
+    def __len__(self) -> int:
+        return self.__screen.width
+
+    def __iter__(self) -> Iterator[RGBPixel]:
+        for x in range(self.__screen.width):
+            yield self[x]
+
+
+class PixelView:
+    """
+    Compatibility view over a screen's buffers, so ``screen.pixels[y][x]`` keeps working.
+    """
+
+    def __init__(self, screen: Screen):
+        self.__screen = screen
+
+    def __getitem__(self, y: int) -> PixelRow:
+        return PixelRow(self.__screen, y)
+
+    def __len__(self) -> int:
+        return self.__screen.height
+
+    def __iter__(self) -> Iterator[PixelRow]:
+        for y in range(self.__screen.height):
+            yield self[y]
 
 
 class Screen:
+    """
+    A 2D grid of pixels. The pixels are stored in three buffers:
+
+    - ``colors``: a ``uint8`` array of shape (height, width, 3) with the RGB color of each pixel.
+    - ``alpha``: a ``bool`` array of shape (height, width), True where the pixel is opaque.
+    - ``symbols``: an array of shape (height, width) with the symbol drawn for each pixel.
+
+    Screens can be views of other screens (see flipped and scrolled), sharing their buffers
+    and revision counter. Flipped views are strided views of the buffers. Scrolled views keep
+    the buffers as a ring, and an offset resolved when they are painted, so scrolling copies
+    nothing. Accessing the buffers of a scrolled view directly copies them, once.
+    """
+
     def __init__(self, width: int, height: int):
         """
         Initialize a new Screen object with a given width and height.
@@ -26,12 +161,290 @@ class Screen:
         """
         self.width = width
         self.height = height
+        self.__revision = _Revision()
+        self.__quantized: Dict[Tuple[str, bool], Tuple[int, np.ndarray]] = {}
+        self.__compiled: Dict[Tuple[str, str, bool], Tuple[int, CompiledScreen]] = {}
         # define the screen as a cleared screen (all pixels are black)
-        self.clear()
+        self.__colors = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        self.__alpha = np.zeros((self.height, self.width), dtype=bool)
+        self.__symbols = np.full((self.height, self.width), DEFAULT_SYMBOL, dtype=SYMBOL_DTYPE)
+        # (dx, dy) the buffers are scrolled by, wrapping around (see scrolled)
+        self.__offset = (0, 0)
+
+    @property
+    def colors(self) -> np.ndarray:
+        self.__unscroll()
+        return self.__colors
+
+    @colors.setter
+    def colors(self, colors: np.ndarray) -> None:
+        self.__unscroll()
+        self.__check_writeable()
+        self.__colors = colors
+
+    @property
+    def alpha(self) -> np.ndarray:
+        self.__unscroll()
+        return self.__alpha
+
+    @alpha.setter
+    def alpha(self, alpha: np.ndarray) -> None:
+        self.__unscroll()
+        self.__check_writeable()
+        self.__alpha = alpha
+
+    @property
+    def symbols(self) -> np.ndarray:
+        self.__unscroll()
+        return self.__symbols
+
+    @symbols.setter
+    def symbols(self, symbols: np.ndarray) -> None:
+        self.__unscroll()
+        self.__check_writeable()
+        self.__symbols = symbols
+
+    def __unscroll(self) -> None:
+        """
+        Copy the buffers of a scrolled view into buffers of its own, without an offset.
+        """
+        if self.__offset == (0, 0):
+            return
+
+        frozen = self.frozen
+        dx, dy = self.__offset
+        self.__colors = np.roll(self.__colors, (dy, dx), axis=(0, 1))
+        self.__alpha = np.roll(self.__alpha, (dy, dx), axis=(0, 1))
+        self.__symbols = np.roll(self.__symbols, (dy, dx), axis=(0, 1))
+        self.__offset = (0, 0)
+        if frozen:
+            self.freeze()
+
+    @property
+    def frozen(self) -> bool:
+        """
+        Whether the screen is read-only (see freeze).
+        """
+        return not self.__colors.flags.writeable
+
+    def freeze(self) -> Screen:
+        """
+        Make the screen read-only, so it can be shared safely (see sprite_pool.SpritePool).
+        Writing to a frozen screen, or to its views, raises a ValueError.
+        Use copy to get a screen that can be modified.
+
+        :return: The screen.
+        :rtype: Screen
+        """
+        for buffer in (self.__colors, self.__alpha, self.__symbols):
+            buffer.flags.writeable = False
+        return self
+
+    def __check_writeable(self) -> None:
+        if self.frozen:
+            raise ValueError(f"{self} is frozen. Copy it to modify it.")
+
+    def buffers(self, region: Rect | None = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        The (colors, alpha, symbols) buffers of a region of the screen, as they are displayed.
+        They are views of the screen's buffers, unless the region wraps around
+        the edge of a scrolled view, in which case only the region is copied.
+
+        :param region: The region of the screen. Default is the whole screen.
+        :type region: Rect | None
+        :return: The colors, alpha and symbols of the region.
+        :rtype: Tuple[np.ndarray, np.ndarray, np.ndarray]
+        """
+        if region is None:
+            region = Rect(0, 0, self.width, self.height)
+
+        if self.__offset == (0, 0):
+            index = region.slices
+            return self.__colors[index], self.__alpha[index], self.__symbols[index]
+
+        dx, dy = self.__offset
+        ys = _wrapped_range(region.y - dy, region.height, self.height)
+        xs = _wrapped_range(region.x - dx, region.width, self.width)
+        index: Tuple = (ys, xs)
+        if isinstance(ys, np.ndarray) and isinstance(xs, np.ndarray):
+            index = np.ix_(ys, xs)
+        return self.__colors[index], self.__alpha[index], self.__symbols[index]
+
+    def __view(
+        self, colors: np.ndarray, alpha: np.ndarray, symbols: np.ndarray, offset: Tuple[int, int]
+    ) -> Screen:
+        """
+        Create a screen using the given buffers, sharing the revision counter of this screen.
+        """
+        view = Screen.__new__(Screen)
+        view.width = self.width
+        view.height = self.height
+        view.__revision = self.__revision
+        view.__quantized = {}
+        view.__compiled = {}
+        view.__colors = colors
+        view.__alpha = alpha
+        view.__symbols = symbols
+        view.__offset = (offset[0] % max(self.width, 1), offset[1] % max(self.height, 1))
+        return view
+
+    def flipped(self, axis: str = "x") -> Screen:
+        """
+        A view of the screen flipped along the given axis. It shares the buffers of
+        the screen, so flipping copies nothing, and changes to either show in both.
+
+        :param axis: Axis to flip the screen along, either x or y. Default is x.
+        :type axis: str
+        :return: The flipped view.
+        :rtype: Screen
+        """
+        if axis not in ["x", "y"]:
+            raise ValueError("axis must be either x or y")
+
+        index = (slice(None), slice(None, None, -1)) if axis == "x" else (slice(None, None, -1),)
+        dx, dy = self.__offset
+        offset = (-dx, dy) if axis == "x" else (dx, -dy)
+        return self.__view(
+            self.__colors[index], self.__alpha[index], self.__symbols[index], offset
+        )
+
+    def scrolled(self, dx: int, dy: int) -> Screen:
+        """
+        A view of the screen scrolled by dx and dy, wrapping around its edges.
+        It shares the buffers of the screen: the scroll is only an offset, resolved
+        when the view is painted (see buffers).
+
+        :param dx: Number of pixels to scroll in the x direction.
+        :type dx: int
+        :param dy: Number of pixels to scroll in the y direction.
+        :type dy: int
+        :return: The scrolled view.
+        :rtype: Screen
+        """
+        offset = (self.__offset[0] + dx, self.__offset[1] + dy)
+        return self.__view(self.__colors, self.__alpha, self.__symbols, offset)
+
+    def scroll(self, dx: int, dy: int) -> Screen:
+        """
+        Scroll the screen in place by dx and dy, wrapping around its edges. Like scrolled,
+        only the offset changes, so a sprite can scroll every frame without copying its
+        pixels or being replaced.
+
+        :param dx: Number of pixels to scroll in the x direction.
+        :type dx: int
+        :param dy: Number of pixels to scroll in the y direction.
+        :type dy: int
+        :return: The screen.
+        :rtype: Screen
+        """
+        self.__check_writeable()
+        dx, dy = self.__offset[0] + dx, self.__offset[1] + dy
+        self.__offset = (dx % max(self.width, 1), dy % max(self.height, 1))
+        return self.touch()
+
+    @property
+    def pixels(self) -> PixelView:
+        """
+        View of the screen as RGBPixel objects, indexed as ``pixels[y][x]``.
+        """
+        return PixelView(self)
+
+    @pixels.setter
+    def pixels(self, pixels: Sequence[Sequence[RGBPixel]]) -> None:
+        """
+        Replace the screen's contents with a 2D grid of RGBPixel objects.
+        """
+        height = len(pixels)
+        width = len(pixels[0]) if height > 0 else 0
+        if (width, height) != (self.width, self.height):
+            raise ValueError(
+                f"Pixels of size ({width}, {height}) do not match screen size"
+                f" ({self.width}, {self.height})"
+            )
+        for y, row in enumerate(pixels):
+            for x, px in enumerate(row):
+                self.set_px(px, x, y)
+
+    @property
+    def revision(self) -> int:
+        """
+        Counter incremented every time the screen is modified, used to invalidate caches.
+        """
+        return self.__revision.value
+
+    def touch(self) -> Screen:
+        """
+        Mark the screen as modified. The Screen methods do this for you,
+        call it after writing to the buffers directly.
+
+        :return: The screen.
+        :rtype: Screen
+        """
+        self.__revision.value += 1
+        return self
+
+    def quantized(self, depth: str = "truecolor", dither: bool = False) -> np.ndarray:
+        """
+        The colors of the screen quantized to the given color depth (see quantize.quantize).
+        The result is cached until the screen is modified.
+
+        :param depth: One of "truecolor", "256" or "16". Default is "truecolor".
+        :type depth: str
+        :param dither: Whether to apply ordered dithering. Default is False.
+        :type dither: bool
+        :return: int64 array of shape (height, width).
+        :rtype: np.ndarray
+        """
+        # read before quantizing: a modification made meanwhile invalidates the result
+        revision = self.__revision.value
+        cached = self.__quantized.get((depth, dither))
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+
+        colors = quantize(self.buffers()[0], depth, dither)
+        self.__quantized[(depth, dither)] = (revision, colors)
+        return colors
+
+    def compiled(self, encoder: FrameEncoder) -> CompiledScreen:
+        """
+        The rows of the screen encoded by the given encoder (see FrameEncoder.compile).
+        The result is cached per render mode and color depth until the screen is modified,
+        so sprites that never change are only encoded once.
+
+        :param encoder: The encoder to encode the screen with.
+        :type encoder: FrameEncoder
+        :return: The compiled screen.
+        :rtype: CompiledScreen
+        """
+        key = (encoder.mode, encoder.color_depth, encoder.dither)
+        # read before compiling: a modification made meanwhile invalidates the result
+        revision = self.__revision.value
+        cached = self.__compiled.get(key)
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+
+        compiled = encoder.compile(self)
+        self.__compiled[key] = (revision, compiled)
+        return compiled
+
+    def transform_buffers(self, transform: Callable[[np.ndarray], np.ndarray]) -> Screen:
+        """
+        Apply a transformation to every buffer of the screen. The transformation
+        must act on the first two axes (y, x) and keep the shape of the buffer.
+
+        :param transform: Function mapping a buffer to its transformed version.
+        :type transform: Callable[[np.ndarray], np.ndarray]
+        :return: Screen object with transformed buffers.
+        :rtype: Screen
+        """
+        self.colors = np.ascontiguousarray(transform(self.colors))
+        self.alpha = np.ascontiguousarray(transform(self.alpha))
+        self.symbols = np.ascontiguousarray(transform(self.symbols))
+        return self.touch()
 
     def set_px(self, px: RGBPixel, x: int, y: int) -> Screen:
         """
-        Set pixel at (x,y) on the screen to a new pixel.
+        Set pixel at (x,y) on the screen to a new pixel. Pixels outside the screen are ignored.
 
         :param px: RGBPixel object to be set on the screen.
         :type px: RGBPixel
@@ -42,13 +455,18 @@ class Screen:
         :return: Screen object with updated pixel.
         :rtype: Screen
         """
-        self.__check_coordinate(x, y)
-        self.pixels[y][x] = px
-        return self
+        if not self.__check_coordinate(x, y):
+            return self
+
+        self.colors[y, x] = (px.color.r, px.color.g, px.color.b)
+        self.symbols[y, x] = px.symbol
+        self.alpha[y, x] = not px.transparent
+        return self.touch()
 
     def set_px_color(self, color: Tuple[int, int, int], x: int, y: int) -> Screen:
         """
         Shorthand to set pixel at (x, y) when all you want to do is change the color.
+        Pixels outside the screen are ignored.
 
         :param color: Tuple of three integers (R,G,B) representing the color of the pixel.
         :type color: Tuple[int, int, int]
@@ -59,25 +477,32 @@ class Screen:
         :return: Screen object with updated pixel.
         :rtype: Screen
         """
-        current_pixel: RGBPixel = self.pixels[y][x]
-        self.set_px(RGBPixel(RGBColor(*color), current_pixel.symbol), x, y)
+        if not self.__check_coordinate(x, y):
+            return self
+
+        self.set_px(RGBPixel(RGBColor(*color), str(self.symbols[y, x])), x, y)
 
         return self
 
-    def fill(self, color: Tuple[int, int, int]) -> Screen:
+    def fill(self, color: Tuple[int, int, int], region: Rect | None = None) -> Screen:
         """
-        Fill the entire screen with a given color.
+        Fill the entire screen (or a region of it) with a given color.
 
         :param color: Tuple of three integers (R,G,B) representing the color of the pixel.
         :type color: Tuple[int, int, int]
+        :param region: The region to fill. Default is the whole screen.
+        :type region: Rect | None
         :return: Screen object with updated pixels.
         :rtype: Screen
         """
-        for x in range(self.width):
-            for y in range(self.height):
-                self.set_px(RGBPixel(RGBColor(*color)), x, y)
+        # validate the color once, instead of once per pixel
+        rgb = RGBColor(*color)
+        target = self.__region_slices(region)
+        self.colors[target] = (rgb.r, rgb.g, rgb.b)
+        self.symbols[target] = DEFAULT_SYMBOL
+        self.alpha[target] = True
 
-        return self
+        return self.touch()
 
     def paint_image(
         self,
@@ -86,6 +511,7 @@ class Screen:
         y: int = 0,
         has_alpha: bool = False,
         resize: Tuple[int, int] = None,
+        alpha_threshold: int = 0,
     ) -> Screen:
         """
         Paint an image on the screen (can be a path to an image or a numpy array).
@@ -100,21 +526,14 @@ class Screen:
         :param has_alpha: Whether the image has an alpha channel
         :param resize: Resize the image to the given size
         :type resize: Tuple[int, int]
+        :param alpha_threshold: Pixels with an alpha value at or below this are transparent.
+            Only used if has_alpha is True. Default is 0.
+        :type alpha_threshold: int
         :return: Screen object with updated pixels.
         :rtype: Screen
         """
 
-        # load and resize image if it is a string
-        if isinstance(image, str):
-            image = Image.open(image).convert("RGB" if not has_alpha else "RGBA")
-            image = np.array(image)
-
-        if resize:
-            image = Image.fromarray(image).resize(resize)
-            image = np.array(image)
-
-        if image.shape[2] < 3:
-            raise ValueError("Image must have at least 3 channels")
+        image = load_image(image, resize, has_alpha)
 
         image_width = image.shape[1]
         image_height = image.shape[0]
@@ -126,22 +545,24 @@ class Screen:
                 f" {self.height})\nEither use a bigger screen, or call Screen.from_image."
             )
 
-        for image_x in range(image.shape[1]):
-            for image_y in range(image.shape[0]):
-
-                px = RGBPixel(RGBColor(*image[image_y][image_x][:3]))
+        target = (slice(y, y + image_height), slice(x, x + image_width))
+        self.colors[target] = image[..., :3]
+        self.symbols[target] = DEFAULT_SYMBOL
 
-                # ignore transparent pixels
-                if has_alpha and image[image_y][image_x][3] == 0:
-                    px.transparent = True
-
-                self.set_px(px, x + image_x, y + image_y)
+        # ignore transparent pixels
+        if has_alpha:
+            self.alpha[target] = image[..., 3] > alpha_threshold
+        else:
+            self.alpha[target] = True
 
-        return self
+        return self.touch()
 
     @staticmethod
     def from_image(
-        image: np.ndarray | str, resize: Tuple[int, int] | None = None, has_alpha: bool = False
+        image: np.ndarray | str,
+        resize: Tuple[int, int] | None = None,
+        has_alpha: bool = False,
+        alpha_threshold: int = 0,
     ) -> Screen:
         """
         Create a screen from an image (can be a path to an image or a numpy array).
@@ -153,23 +574,20 @@ class Screen:
         :type resize: tuple[int, int] | None
         :param has_alpha: A boolean indicating whether the image has an alpha channel.
         :type has_alpha: bool
+        :param alpha_threshold: Pixels with an alpha value at or below this are transparent.
+            Only used if has_alpha is True. Default is 0.
+        :type alpha_threshold: int
         :return: The screen created from the image.
         :rtype: Screen
         """
-        if isinstance(image, str):
-            img: Image = Image.open(image).convert("RGB" if not has_alpha else "RGBA")  # type: ignore
-        else:
-            img: Image = Image.fromarray(image)  # type: ignore
-
-        if resize is not None:
-            img = img.resize(resize)  # type: ignore
-
-        img = np.array(img)  # type: ignore
+        img = load_image(image, resize, has_alpha)
 
         image_width = img.shape[1]
         image_height = img.shape[0]
 
-        return Screen(image_width, image_height).paint_image(img, has_alpha=has_alpha)
+        return Screen(image_width, image_height).paint_image(
+            img, has_alpha=has_alpha, alpha_threshold=alpha_threshold
+        )
 
     def __check_coordinate(self, x: int, y: int) -> bool:
         """
@@ -184,9 +602,11 @@ class Screen:
         """
         return (0 <= x < self.width) and (0 <= y < self.height)
 
-    def paint_screen(self, screen: Screen, x: int, y: int) -> Screen:
+    def paint_screen(self, screen: Screen, x: int, y: int, clip: Rect | None = None) -> Screen:
         """
         Paint another screen onto the screen at the given coordinates.
+        Transparent pixels are skipped, and the parts of the other screen
+        outside of this screen (or of the clip rectangle) are clipped.
 
         :param screen: The screen to paint onto this screen.
         :type screen: Screen
@@ -194,40 +614,80 @@ class Screen:
         :type x: int
         :param y: The y-coordinate to paint the screen.
         :type y: int
+        :param clip: Only paint the pixels inside this rectangle. Default is the whole screen.
+        :type clip: Rect | None
         :return: The resulting screen after painting the other screen onto this screen.
         :rtype: Screen
         """
-        for xi in range(screen.width):
-            for yi in range(screen.height):
-
-                # ignore transparent pixels
-                if screen.pixels[yi][xi].transparent:
-                    continue
+        # intersection of the other screen with this one, in this screen's coordinates
+        painted = Rect(x, y, screen.width, screen.height).intersection(
+            Rect(0, 0, self.width, self.height)
+        )
+        if clip is not None:
+            painted = painted.intersection(clip)
+        if painted.is_empty:
+            return self
+
+        target = painted.slices
+        colors, mask, symbols = screen.buffers(
+            Rect(painted.x - x, painted.y - y, painted.width, painted.height)
+        )
 
-                self.set_px(screen.pixels[yi][xi], xi + x, yi + y)
+        if mask.all():
+            self.colors[target] = colors
+            self.symbols[target] = symbols
+            self.alpha[target] = True
+        else:
+            np.copyto(self.colors[target], colors, where=mask[..., None])
+            np.copyto(self.symbols[target], symbols, where=mask)
+            self.alpha[target] |= mask
 
-        return self
+        return self.touch()
 
-    def clear(self) -> None:
+    def clear(self, region: Rect | None = None) -> None:
         """
-        Clear the screen by setting all pixels to transparent Pixels with no color.
+        Clear the screen (or a region of it) by setting all pixels to transparent Pixels
+        with no color. The buffers are reset in place, nothing is allocated.
 
+        :param region: The region to clear. Default is the whole screen.
+        :type region: Rect | None
         :return: None
         """
-        self.pixels = np.array(
-            [[RGBPixel(transparent=True) for _ in range(self.width)] for _ in range(self.height)]
-        )
+        target = self.__region_slices(region)
+        self.colors[target] = 0
+        self.alpha[target] = False
+        self.symbols[target] = DEFAULT_SYMBOL
+        self.touch()
+
+    def __region_slices(self, region: Rect | None) -> Tuple[slice, slice]:
+        """
+        The (y, x) slices selecting a region of the screen, clipped to the screen.
+        """
+        if region is None:
+            return slice(None), slice(None)
+        return region.intersection(Rect(0, 0, self.width, self.height)).slices
+
+    def render(self, encoder: FrameEncoder | None = None) -> None:
+        """
+        Render the screen and print it to stdout, with a single write.
 
-    def render(self) -> None:
+        :param encoder: The encoder used to encode the screen. Defaults to a shared encoder.
+        :type encoder: FrameEncoder | None
         """
-        Render the screen and print it to stdout
+        encoder = encoder or _DEFAULT_ENCODER
+        encoder.begin().write(encoder.encode(self))
+        encoder.flush()
+
+    def copy(self) -> Screen:
+        """
+        Create a copy of the screen that does not share any buffers with it.
+
+        :return: The copied screen.
+        :rtype: Screen
         """
-        for row_i in range(self.height):
-            row = self.pixels[row_i]
-            pixel: RGBPixel
-            for pixel in row:
-                print(pixel, end="")
-            print()
+        screen = Screen(self.width, self.height)
+        screen.colors[:], screen.alpha[:], screen.symbols[:] = self.buffers()
+        return screen.touch()
 
     def __str__(self) -> str:
         return f"Screen ({self.width}, {self.height})"
@@ -0,0 +1,115 @@
+"""
+Description: Share a single, read-only screen between sprites with the same pixels.
+Author: Gregory Glatzer
+Date: 4/27/2023
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import weakref
+from typing import Tuple
+
+import numpy as np
+
+from .screen import Screen
+
+# (width, height, digest of the buffers)
+PoolKey = Tuple[int, int, bytes]
+
+
+def content_key(screen: Screen) -> PoolKey:
+    """
+    Hash the pixels of a screen, as they are displayed. The colors and symbols
+    of transparent pixels are ignored, since they are never drawn.
+
+    :param screen: The screen to hash.
+    :type screen: Screen
+    :return: The key of the screen's pixels.
+    :rtype: PoolKey
+    """
+    colors, alpha, symbols = screen.buffers()
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(alpha).tobytes())
+    digest.update(np.ascontiguousarray(np.where(alpha[..., None], colors, 0)).tobytes())
+    digest.update(np.ascontiguousarray(np.where(alpha, symbols, "")).tobytes())
+    return screen.width, screen.height, digest.digest()
+
+
+def _same_pixels(a: Screen, b: Screen) -> bool:
+    colors_a, alpha_a, symbols_a = a.buffers()
+    colors_b, alpha_b, symbols_b = b.buffers()
+    return (
+        np.array_equal(alpha_a, alpha_b)
+        and np.array_equal(colors_a[alpha_a], colors_b[alpha_b])
+        and np.array_equal(symbols_a[alpha_a], symbols_b[alpha_b])
+    )
+
+
+class SpritePool:
+    """
+    Deduplicates sprites by their content: interning a screen returns the frozen
+    (read-only, see Screen.freeze) screen already holding the same pixels, if any.
+    Gameobjects built from identical sprites then share a single screen, along with its
+    quantized colors and encoded rows (see Screen.quantized and Screen.compiled).
+
+    The pool only keeps weak references, so sprites that are not used anymore are freed.
+    The pool is thread-safe.
+    """
+
+    def __init__(self):
+        self.__sprites: weakref.WeakValueDictionary[PoolKey, Screen] = (
+            weakref.WeakValueDictionary()
+        )
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__sprites)
+
+    def intern(self, screen: Screen) -> Screen:
+        """
+        Get the shared sprite with the same pixels as the given screen. If there is none,
+        the screen is frozen and becomes the shared sprite.
+
+        :param screen: The sprite to deduplicate. Do not modify it after interning it.
+        :type screen: Screen
+        :return: A frozen screen with the same pixels.
+        :rtype: Screen
+        """
+        key = content_key(screen)
+        with self.__lock:
+            shared = self.__sprites.get(key)
+            if shared is not None and _same_pixels(shared, screen):
+                return shared
+            if shared is not None:
+                # hash collision, keep the screen to itself
+                return screen.freeze()
+            self.__sprites[key] = screen.freeze()
+            return screen
+
+    def solid(self, width: int, height: int, color: Tuple[int, int, int]) -> Screen:
+        """
+        Get the shared sprite of the given size, filled with a single color.
+
+        :param width: Width of the sprite.
+        :type width: int
+        :param height: Height of the sprite.
+        :type height: int
+        :param color: The (r, g, b) color of the sprite.
+        :type color: Tuple[int, int, int]
+        :return: A frozen screen of the given color.
+        :rtype: Screen
+        """
+        return self.intern(Screen(width, height).fill(color))
+
+    def clear(self) -> None:
+        """
+        Forget every sprite. Sprites already interned stay frozen and shared.
+        """
+        with self.__lock:
+            self.__sprites.clear()
+
+
+# the default pool, shared by every gameobject
+sprite_pool = SpritePool()
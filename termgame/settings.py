@@ -20,7 +20,7 @@ def _bool(s: str) -> bool:
     return s.lower() in ("yes", "true", "t", "1")
 
 
-@dataclass
+@dataclass(eq=False)
 class LogSettings:
     """
     A class for configuring logging settings.
@@ -35,19 +35,44 @@ class LogSettings:
     file: str = os.getenv("LOG_FILE", "logs/game.log")
 
 
-@dataclass
+@dataclass(eq=False)
 class RenderSettings:
     """
     A class for configuring rendering settings.
 
     :ivar fontsize: The recommended font size for the terminal (default: 6).
     :vartype fontsize: int
+    :ivar synchronized_output: Whether to wrap each frame in the terminal's synchronized
+        output mode, so it is presented at once (default: True).
+    :vartype synchronized_output: bool
+    :ivar mode: How pixels are drawn to the terminal, either "full" (one pixel per two
+        columns) or "halfblock" (two stacked pixels per column) (default: "full").
+    :vartype mode: str
+    :ivar color_depth: The colors used for output, one of "truecolor", "256" or "16".
+        The 256 and 16 color palettes use shorter escape sequences (default: "truecolor").
+    :vartype color_depth: str
+    :ivar dither: Whether to dither colors when using the 256 or 16 color palettes
+        (default: False).
+    :vartype dither: bool
+    :ivar pipelined: Whether to encode and write frames on a separate thread, while the
+        next frame is simulated (default: False).
+    :vartype pipelined: bool
+    :ivar render_processes: Number of processes encoding and writing frames, fed through
+        shared memory. 0 renders in the game's process. Takes precedence over pipelined
+        (default: 0).
+    :vartype render_processes: int
     """
 
     fontsize: int = int(os.getenv("FONT_SIZE", "6"))
+    synchronized_output: bool = _bool(os.getenv("SYNCHRONIZED_OUTPUT", "True"))
+    mode: str = os.getenv("RENDER_MODE", "full")
+    color_depth: str = os.getenv("COLOR_DEPTH", "truecolor")
+    dither: bool = _bool(os.getenv("DITHER", "False"))
+    pipelined: bool = _bool(os.getenv("PIPELINED_RENDER", "False"))
+    render_processes: int = int(os.getenv("RENDER_PROCESSES", "0"))
 
 
-@dataclass
+@dataclass(eq=False)
 class RuntimeSettings:
     """
     A class for configuring runtime settings.
@@ -59,6 +84,7 @@ class RuntimeSettings:
     :ivar ppf: The number of physics steps per frame (default: 10).
     :vartype ppf: int
     :ivar wait_for_start: Whether to wait for the user to press a key before starting the game (default: True).
+        Games that preload assets with Engine.preload show the loading progress instead.
     :vartype wait_for_start: bool
     """
 
@@ -68,6 +94,23 @@ class RuntimeSettings:
     wait_for_start: bool = _bool(os.getenv("WAIT_FOR_START", "True"))
 
 
+@dataclass(eq=False)
+class AssetSettings:
+    """
+    A class for configuring how assets (sprites) are loaded.
+
+    :ivar cache_size: Maximum number of bytes of decoded images kept in memory
+        (default: 67108864, 64 MiB).
+    :vartype cache_size: int
+    :ivar cache_dir: Directory where decoded images are cached between runs.
+        Empty to disable the on-disk cache (default: "").
+    :vartype cache_dir: str
+    """
+
+    cache_size: int = int(os.getenv("ASSET_CACHE_SIZE", str(64 * 1024 * 1024)))
+    cache_dir: str = os.getenv("ASSET_CACHE_DIR", "")
+
+
 @dataclass(frozen=True)
 class Settings:
     """
@@ -79,8 +122,11 @@ class Settings:
     :vartype render_settings: RenderSettings
     :ivar runtime_settings: An instance of RuntimeSettings.
     :vartype runtime_settings: RuntimeSettings
+    :ivar asset_settings: An instance of AssetSettings.
+    :vartype asset_settings: AssetSettings
     """
 
     log_settings: LogSettings = LogSettings()
     render_settings: RenderSettings = RenderSettings()
     runtime_settings: RuntimeSettings = RuntimeSettings()
+    asset_settings: AssetSettings = AssetSettings()
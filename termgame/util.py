@@ -5,8 +5,7 @@ Date: 4/04/2023
 """
 
 from __future__ import annotations
-from typing import Any, List
-import numpy as np
+from typing import Any, Dict, List
 import pymunk
 
 from .graphics.screen import Screen
@@ -15,6 +14,8 @@ from .graphics.screen import Screen
 def stretch_animation(sprites: List[Screen], stretch: int):
     """
     Stretch an animation out (multiply frames). This effectively slows down the animation.
+    Animations with frame durations (see Gameobject.add_animation) do the same
+    without repeating the sprites.
 
     :param sprites: List of sprites to stretch.
     :type sprites: List[Screen]
@@ -34,6 +35,7 @@ def stretch_animation(sprites: List[Screen], stretch: int):
 def flip_animation(sprites: List[Screen], axis: str = "x") -> List[Screen]:
     """
     Flip an animation along the given axis (x or y).
+    The flipped sprites are views sharing the pixels of the original ones (see Screen.flipped).
 
     :param sprites: List of sprites to flip.
     :type sprites: List[Screen]
@@ -46,17 +48,19 @@ def flip_animation(sprites: List[Screen], axis: str = "x") -> List[Screen]:
     if axis not in ["x", "y"]:
         raise ValueError("axis must be either x or y")
 
-    new_sprites: List[Screen] = []
+    # sprites repeated in the animation (e.g. stretched ones) share a single view
+    flipped: Dict[int, Screen] = {}
     for sprite in sprites:
-        new_sprite: Screen = Screen(sprite.width, sprite.height).paint_screen(sprite, 0, 0)
-        new_sprite.pixels = np.flip(new_sprite.pixels, axis=0 if axis == "y" else 1)
-        new_sprites.append(new_sprite)
-    return new_sprites
+        if id(sprite) not in flipped:
+            flipped[id(sprite)] = sprite.flipped(axis)
+    return [flipped[id(sprite)] for sprite in sprites]
 
 
 def scroll_sprite(sprite: Screen, dx: int, dy: int) -> Screen:
     """
-    Scroll a sprite by dx and dy.
+    Scroll a sprite by dx and dy, wrapping around its edges.
+    The scrolled sprite is a view sharing the pixels of the original one, so scrolling
+    copies nothing (see Screen.scrolled).
 
     :param sprite: Sprite to scroll.
     :type sprite: Screen
@@ -68,10 +72,7 @@ def scroll_sprite(sprite: Screen, dx: int, dy: int) -> Screen:
     :rtype: Screen
     """
 
-    new_sprite: Screen = Screen(sprite.width, sprite.height).paint_screen(sprite, 0, 0)
-    new_sprite.pixels = np.roll(new_sprite.pixels, dx, axis=1)
-    new_sprite.pixels = np.roll(new_sprite.pixels, dy, axis=0)
-    return new_sprite
+    return sprite.scrolled(dx, dy)
 
 
 def get_bb_poly(go) -> pymunk.Poly:
@@ -0,0 +1,106 @@
+from termgame import Engine, Gameobject, Screen
+from termgame.base.camera import Camera
+from termgame.base.compositor import Compositor
+from termgame.base.spatial_grid import SpatialGrid
+from termgame.graphics.rect import Rect
+
+
+def _actor(x: int, y: int, size: int = 2, **kwargs) -> Gameobject:
+    gameobject = Gameobject(x=x, y=y, sprites=[Screen(size, size).fill((9, 9, 9))], **kwargs)
+    gameobject.on_start(None)
+    return gameobject
+
+
+def _ids(gameobjects) -> list:
+    return [id(gameobject) for gameobject in gameobjects]
+
+
+def test_spatial_grid_query():
+    grid = SpatialGrid(cell_size=4)
+    near, far, big = _actor(1, 1), _actor(100, 100), _actor(0, 0, size=50, depth=-1)
+    for gameobject in (near, far, big):
+        grid.add(gameobject)
+    grid.update()
+    assert len(grid) == 3
+
+    # results are ordered by depth, then by when they were added
+    assert _ids(grid.query(Rect(0, 0, 10, 10))) == _ids([big, near])
+    assert _ids(grid.query(Rect(90, 90, 20, 20))) == _ids([far])
+
+    # moved and removed gameobjects are re-indexed
+    far.x, far.y = 5, 5
+    grid.remove(big)
+    grid.update()
+    assert grid.query(Rect(90, 90, 20, 20)) == []
+    assert _ids(grid.query(Rect(0, 0, 10, 10))) == _ids([near, far])
+    assert len(grid) == 2
+
+
+def test_spatial_grid_follows_size_changes():
+    grid = SpatialGrid(cell_size=4)
+    empty = Gameobject(x=1, y=1)
+    grid.add(empty)
+    grid.update()
+    assert len(grid) == 0
+
+    empty.set_sprites([Screen(3, 3)])
+    empty.on_start(None)
+    grid.update()
+    assert _ids(grid.query(Rect(3, 3, 1, 1))) == _ids([empty])
+
+    # gameobjects that were never indexed are removed too, and no longer listened to
+    grid.remove(empty)
+    grid.remove(empty)
+    empty.x = 50
+    grid.update()
+    assert grid.query(Rect(0, 0, 100, 100)) == []
+
+
+def test_engine_indexes_its_gameobjects():
+    engine = Engine(10, 10)
+    other, actor = _actor(6, 6), _actor(1, 1)
+    engine.add_gameobject(other)
+    engine.add_gameobject(actor)
+    engine.spatial_grid.update()
+    assert _ids(engine.spatial_grid.query(Rect(0, 0, 4, 4))) == _ids([actor])
+
+    engine.remove_gameobject(actor)
+    engine.spatial_grid.update()
+    assert _ids(engine.gameobjects) == _ids([other])
+    assert engine.spatial_grid.query(Rect(0, 0, 4, 4)) == []
+
+    # clones do not share the listeners of their prefab
+    clone = actor.clone(x=3)
+    engine.add_gameobject(clone)
+    actor.x = 8
+    engine.spatial_grid.update()
+    assert _ids(engine.spatial_grid.query(Rect(0, 0, 5, 5))) == _ids([clone])
+
+
+def test_camera_stays_in_world():
+    camera = Camera(10, 5, world=Rect(0, 0, 100, 20))
+    camera.move_to(95, -3)
+    assert camera.viewport == Rect(90, 0, 10, 5)
+
+    camera.center_on(_actor(50, 10))
+    assert camera.viewport == Rect(46, 8, 10, 5)
+    assert camera.to_screen(50, 10) == (4, 2)
+    assert camera.to_world(4, 2) == (50, 10)
+
+
+def test_compose_from_camera():
+    screen = Screen(4, 4)
+    compositor = Compositor(screen)
+    actor = _actor(11, 11)
+    assert compositor.compose([actor], screen.clear, origin=(10, 10)) == [Rect(0, 0, 4, 4)]
+    assert compositor.sprites == [(actor.get_active_sprite(), 1, 1)]
+    assert (screen.colors[1, 1] == 9).all()
+
+
+def test_clamp_to_world():
+    engine = Engine(10, 10, world_size=(100, 50))
+    clamped, free = _actor(200, 200), _actor(200, 200, clamp_to_world=False)
+    clamped.on_update(1, engine)
+    free.on_update(1, engine)
+    assert (clamped.x, clamped.y) == (98, 48)
+    assert (free.x, free.y) == (200, 200)
@@ -0,0 +1,76 @@
+from termgame import Gameobject, Screen
+from termgame.base.compositor import Compositor
+from termgame.graphics.rect import Rect
+
+
+def test_compose_only_repaints_changes():
+    screen = Screen(10, 10)
+    compositor = Compositor(screen)
+    background = Gameobject(sprites=[Screen(10, 10).fill((1, 1, 1))], depth=-1)
+    actor = Gameobject(x=2, y=2, sprites=[Screen(2, 2).fill((9, 9, 9))])
+    actor.on_start(None)
+    background.on_start(None)
+    gameobjects = [background, actor]
+
+    # the first frame is painted in full
+    assert compositor.compose(gameobjects, screen.clear) == [Rect(0, 0, 10, 10)]
+    assert (screen.colors[2, 2] == 9).all()
+
+    # nothing changed
+    assert compositor.compose(gameobjects, screen.clear) == []
+
+    # the old and new position of the actor are repainted, respecting depth
+    actor.x = 3
+    assert compositor.compose(gameobjects, screen.clear) == [Rect(2, 2, 3, 2)]
+    assert (screen.colors[2, 2] == 1).all()
+    assert (screen.colors[2, 4] == 9).all()
+    assert screen.alpha.all()
+
+
+def test_compose_repaints_changed_sprites():
+    screen = Screen(4, 4)
+    compositor = Compositor(screen)
+    sprite = Screen(2, 2).fill((9, 9, 9))
+    actor = Gameobject(x=1, y=1, sprites=[sprite])
+    actor.on_start(None)
+    compositor.compose([actor], screen.clear)
+
+    sprite.set_px_color((5, 5, 5), 0, 0)
+    assert compositor.compose([actor], screen.clear) == [Rect(1, 1, 2, 2)]
+    assert (screen.colors[1, 1] == 5).all()
+
+    # removed gameobjects are cleared
+    assert compositor.compose([], screen.clear) == [Rect(1, 1, 2, 2)]
+    assert not screen.alpha.any()
+
+
+def test_static_levels_are_cached_in_layers():
+    screen = Screen(6, 6)
+    compositor = Compositor(screen, static_frames=1)
+    background = Gameobject(sprites=[Screen(6, 6).fill((1, 1, 1))], depth=-2)
+    decoration = Gameobject(x=1, y=1, sprites=[Screen(2, 2).fill((5, 5, 5))], depth=-1)
+    actor = Gameobject(x=4, y=4, sprites=[Screen(1, 1).fill((9, 9, 9))])
+    gameobjects = [background, decoration, actor]
+    for gameobject in gameobjects:
+        gameobject.on_start(None)
+
+    compositor.compose(gameobjects, screen.clear)
+    compositor.compose(gameobjects, screen.clear)
+
+    # the background and the decoration stood still, they are painted as one layer
+    actor.x = 1
+    actor.y = 1
+    compositor.compose(gameobjects, screen.clear)
+    assert len(compositor.layers) == 1
+    assert len(compositor.layers[0].members) == 2
+    assert (screen.colors[1, 1] == 9).all()
+    assert (screen.colors[4, 4] == 1).all()
+
+    # moving the decoration drops the layer, and paints the decoration on its own
+    decoration.x = 3
+    actor.x = 0
+    compositor.compose(gameobjects, screen.clear)
+    assert compositor.layers == []
+    assert (screen.colors[1, 1] == 1).all()
+    assert (screen.colors[1, 3] == 5).all()
+    assert (screen.colors[1, 0] == 9).all()
@@ -47,3 +47,23 @@ def test_get_gameobjects(full_engine_fixture: Engine):
         full_engine_fixture.gameobjects[3],
     ]
     assert full_engine_fixture.get_gameobjects() == full_engine_fixture.gameobjects
+
+
+def test_clear_in_place():
+    """
+    Test that clearing the engine resets its screen without reallocating it.
+    """
+    engine = Engine(4, 4)
+    colors = engine.screen.colors
+    engine.screen.fill((1, 2, 3))
+    engine.clear()
+    assert engine.screen.colors is colors
+    assert not engine.screen.alpha.any()
+    assert not engine.screen.colors.any()
+
+
+def test_clear_color():
+    engine = Engine(4, 4, clear_color=(1, 2, 3))
+    engine.clear()
+    assert engine.screen.alpha.all()
+    assert (engine.screen.colors == (1, 2, 3)).all()
@@ -1,5 +1,6 @@
 import pytest
 from termgame import Gameobject, Screen, Engine
+from termgame.base.gameobject import AnimationClip, GameobjectAnimator
 
 
 def test_init():
@@ -106,3 +107,102 @@ def test_get_active_sprite_no_sprites():
     go = Gameobject(sprites=None)
 
     assert go.get_active_sprite() is None
+
+
+def _played(animator, frames: int) -> list:
+    """
+    Indices of the active frame over the given number of engine frames.
+    """
+    animator.start(0)
+    played = []
+    for frame in range(frames):
+        animator.next(frame)
+        played.append(animator.active_el_idx)
+    return played
+
+
+def test_animation_durations():
+    animator = GameobjectAnimator([Screen(1, 1), Screen(1, 1)])
+    animator.add_clip("slow", AnimationClip(animator.elements, durations=[2, 1]))
+    animator.play("slow")
+    assert _played(animator, 6) == [0, 0, 1, 0, 0, 1]
+
+
+def test_animation_modes():
+    sprites = [Screen(1, 1), Screen(1, 1), Screen(1, 1)]
+    animator = GameobjectAnimator(sprites)
+    animator.add_clip("once", AnimationClip(sprites, mode="once"))
+    animator.add_clip("pingpong", AnimationClip(sprites, mode="pingpong"))
+
+    animator.play("once")
+    assert _played(animator, 5) == [0, 1, 2, 2, 2]
+    assert animator.finished
+
+    animator.play("pingpong")
+    assert _played(animator, 7) == [0, 1, 2, 1, 0, 1, 2]
+
+    with pytest.raises(ValueError):
+        AnimationClip(sprites, mode="bounce")
+    with pytest.raises(ValueError):
+        AnimationClip(sprites, durations=[1, 2])
+
+
+def test_animation_in_seconds():
+    animator = GameobjectAnimator([Screen(1, 1), Screen(1, 1)])
+    animator.add_clip("seconds", AnimationClip(animator.elements, durations=0.1, seconds=True))
+    animator.play("seconds")
+    for frame in range(1, 3):
+        animator.next(frame, dt=1 / 30)
+    assert animator.active_el_idx == 0
+    animator.next(3, dt=1 / 30)
+    assert animator.active_el_idx == 1
+
+
+def test_set_same_sprites_keeps_animation():
+    sprites = [Screen(1, 1), Screen(1, 1)]
+    go = Gameobject(sprites=sprites)
+    go.on_start(None)
+    animator = go.animator
+    animator.next(1)
+
+    # setting the sprites that are playing does not restart the animation
+    go.set_sprites(sprites)
+    assert go.animator is animator
+    assert animator.active_el_idx == 1
+
+    go.add_animation("other", [Screen(2, 2)])
+    go.play("other")
+    assert go.width == 2
+    go.set_sprites(sprites)
+    assert go.get_active_sprite() is sprites[0]
+
+
+def test_clone_shares_sprites_and_animations():
+    class Counter(Gameobject):
+        def __init__(self):
+            Gameobject.__init__(self, sprites=[Screen(1, 1), Screen(2, 2)], on_start=self.count)
+
+        def count(self, engine):
+            self.state["started"] = self.state.get("started", 0) + 1
+
+    prefab = Counter()
+    prefab.add_animation("big", [Screen(3, 3)])
+    instance = prefab.clone(x=5, y=6)
+
+    assert (instance.x, instance.y, prefab.x) == (5, 6, 0)
+    assert instance.get_sprites() is prefab.get_sprites()
+    assert instance.animator is not prefab.animator
+    assert instance.animator.clips["big"] is prefab.animator.clips["big"]
+
+    # callbacks run on the instance
+    instance.on_start(None)
+    assert instance.state == {"started": 1}
+    assert prefab.state == {}
+
+    # playback and new animations are not shared
+    instance.animator.next(1)
+    prefab.on_start(None)
+    assert instance.get_active_sprite().width == 2
+    assert prefab.get_active_sprite().width == 1
+    instance.add_animation("small", [Screen(1, 1)])
+    assert "small" not in prefab.animator.clips
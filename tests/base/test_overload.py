@@ -0,0 +1,48 @@
+import pytest
+from termgame.base.overload import OverloadPolicy
+
+
+def test_skips_rendering_while_behind():
+    policy = OverloadPolicy(max_skipped=2)
+    policy.start("truecolor")
+    assert policy.should_render()
+
+    policy.frame_done(True, 0.3, 0.1, on_time=False)
+    decisions = []
+    for _ in range(3):
+        decisions.append(policy.should_render())
+        policy.frame_done(decisions[-1], 0.15, 0.1, on_time=False)
+    # at most two frames in a row are skipped
+    assert decisions == [False, False, True]
+
+    policy.frame_done(True, 0.05, 0.1, on_time=True)
+    assert policy.should_render()
+    assert (policy.stats.rendered, policy.stats.skipped) == (3, 2)
+
+
+def test_degrades_and_restores_quality():
+    events = []
+    policy = OverloadPolicy(cooldown=3, smoothing=1, on_change=lambda e, s: events.append(e))
+    policy.start("256")
+    assert policy.color_depths == ["256", "16"]
+
+    for _ in range(3):
+        policy.frame_done(True, 0.2, 0.1)
+    assert policy.color_depth == "16"
+    # there is no lower quality
+    for _ in range(3):
+        policy.frame_done(True, 0.2, 0.1)
+    assert policy.stats.level == 1
+
+    for _ in range(3):
+        policy.frame_done(True, 0.01, 0.1)
+    assert policy.color_depth == "256"
+    assert events == ["degrade", "restore"]
+    assert (policy.stats.degraded, policy.stats.restored) == (1, 1)
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError):
+        OverloadPolicy(color_depths=["24bit"])
+    with pytest.raises(ValueError):
+        OverloadPolicy(degrade_load=0.5, restore_load=0.6)
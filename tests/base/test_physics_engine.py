@@ -1,6 +1,6 @@
 import pytest
 import pymunk
-from termgame import PhysicsEngine, PhysicsGameobject, Gameobject
+from termgame import PhysicsEngine, PhysicsGameobject, Gameobject, Screen
 
 
 def test_init():
@@ -36,3 +36,58 @@ def test_add_gameobject():
     assert isinstance(engine.gameobjects[1], PhysicsGameobject)
     assert engine.gameobjects[1].name == "test2"
     assert engine.gameobjects[1].rb.body_type == pymunk.Body.STATIC
+
+
+def test_clone_has_own_rigidbody():
+    prefab = PhysicsGameobject(name="prefab", x=1, y=1, max_velocity=2)
+    engine = PhysicsEngine(10, 10)
+    for x in range(3):
+        engine.add_gameobject(prefab.clone(x=x + 2, y=3))
+
+    bodies = engine.space.bodies
+    assert len(bodies) == 3
+    assert prefab.rb not in bodies
+    assert [body.position for body in bodies] == [(2, 3), (3, 3), (4, 3)]
+
+
+def test_step_physics_uses_fixed_steps():
+    engine = PhysicsEngine(10, 10, max_steps=5)
+    step_time = engine.step_time
+
+    # partial steps are carried over to the next frame
+    assert engine.step_physics(step_time * 2.5) == 2
+    assert engine.step_physics(step_time * 0.6) == 1
+
+    # far behind, the simulation is capped and drops the rest
+    assert engine.step_physics(step_time * 100) == 5
+    assert engine.step_physics(0) == 0
+
+
+def test_interpolated_positions():
+    engine = PhysicsEngine(100, 100, gravity=(0, 0), interpolate=True)
+    go = PhysicsGameobject(x=10, y=10)
+    go.rb.mass, go.rb.moment = 1, 1
+    go.rb.velocity = (engine.step_time**-1, 0)  # a pixel per step
+    engine.add_gameobject(go)
+
+    engine.step_physics(engine.step_time * 2.25)
+    assert engine.interpolation_alpha == pytest.approx(0.25)
+    assert go.rb.position.x == pytest.approx(12)
+    go.on_fixed_update(0, engine)
+    # a quarter of the way from 11 to 12
+    assert go.x == 11
+
+
+def test_remove_gameobject():
+    engine = PhysicsEngine(10, 10)
+    go = PhysicsGameobject(x=1, y=1, sprites=[Screen(2, 2)])
+    engine.add_gameobject(go)
+    engine.remove_gameobject(go)
+    assert engine.gameobjects == []
+    assert go.rb not in engine.space.bodies
+
+
+@pytest.mark.parametrize("max_steps", [0, -1])
+def test_max_steps_must_be_positive(max_steps):
+    with pytest.raises(ValueError):
+        PhysicsEngine(10, 10, max_steps=max_steps)
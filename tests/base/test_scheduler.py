@@ -0,0 +1,60 @@
+import pytest
+from termgame.base.scheduler import FrameScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _scheduler(clock: FakeClock) -> FrameScheduler:
+    scheduler = FrameScheduler(10, spin=0, clock=clock, sleep=clock.sleep)
+    scheduler.start()
+    return scheduler
+
+
+def test_sleeps_only_the_remaining_budget():
+    clock = FakeClock()
+    scheduler = _scheduler(clock)
+    assert scheduler.begin_frame() == pytest.approx(0.1)
+    clock.now += 0.03
+    assert scheduler.wait()
+    for _ in range(2):
+        scheduler.begin_frame()
+        clock.now += 0.03  # work
+        assert scheduler.wait()
+    assert clock.slept == pytest.approx([0.07, 0.07, 0.07])
+    assert scheduler.elapsed == pytest.approx(0.3)
+    assert scheduler.begin_frame() == pytest.approx(0.1)
+    assert scheduler.frame_time == pytest.approx(0.03)
+
+
+def test_missed_deadlines():
+    clock = FakeClock()
+    scheduler = _scheduler(clock)
+
+    # a slightly late frame is caught up on the next one
+    scheduler.begin_frame()
+    clock.now += 0.12
+    assert not scheduler.wait()
+    scheduler.begin_frame()
+    assert scheduler.wait()
+    assert clock.now == pytest.approx(0.2)
+
+    # far behind, the deadlines start over from now
+    scheduler.begin_frame()
+    clock.now += 0.5
+    assert not scheduler.wait()
+    scheduler.begin_frame()
+    assert scheduler.wait()
+    assert clock.now == pytest.approx(0.8)
+    assert scheduler.missed_deadlines == 2
+    assert scheduler.dt == pytest.approx(0.5)
@@ -0,0 +1,64 @@
+import pytest
+from termgame import Screen
+from termgame.graphics.encoder import (
+    DEFAULT_COLOR,
+    LOWER_HALF_BLOCK,
+    UPPER_HALF_BLOCK,
+    FrameEncoder,
+)
+
+
+def test_encode_row():
+    screen = Screen(2, 1).fill((1, 2, 3))
+    encoder = FrameEncoder()
+    row = encoder.encode_row(encoder.to_cells(screen), 0)
+    assert row.count("\033[48;2;1;2;3m") == 1
+    assert row.count("\u2001\u2001") == 2
+
+
+def test_render_single_write(capsys):
+    screen = Screen(3, 2).fill((4, 5, 6))
+    screen.render()
+    out = capsys.readouterr().out
+    assert out.count("\n") == 2
+    assert out.count("\033[48;2;4;5;6m") == 2
+
+
+def test_encode_row_coalesces_colors():
+    screen = Screen(6, 1).fill((1, 2, 3))
+    screen.set_px_color((7, 7, 7), 4, 0)
+    encoder = FrameEncoder()
+    row = encoder.encode_row(encoder.to_cells(screen), 0)
+
+    # one style per run of equal colors: (1, 2, 3) x4, (7, 7, 7), (1, 2, 3)
+    assert row.count("\033[48;2;") == 3
+    assert row.count("\033[38;2;") == 1
+    assert row.count("\u2001") == 12
+
+
+def test_invalid_mode():
+    with pytest.raises(ValueError):
+        FrameEncoder(mode="sextant")
+
+
+def test_halfblock_cells():
+    screen = Screen(3, 3)
+    screen.set_px_color((0, 0, 1), 0, 0)
+    screen.set_px_color((0, 0, 2), 0, 1)
+    screen.set_px_color((0, 0, 3), 1, 1)
+    screen.set_px_color((0, 0, 4), 2, 2)
+
+    cells = FrameEncoder(mode="halfblock").to_cells(screen)
+    assert cells.glyphs.shape == (2, 3)
+
+    # both pixels opaque
+    assert cells.glyphs[0, 0] == UPPER_HALF_BLOCK
+    assert (cells.fg[0, 0], cells.bg[0, 0]) == (1, 2)
+    # only the bottom pixel is opaque
+    assert cells.glyphs[0, 1] == LOWER_HALF_BLOCK
+    assert (cells.fg[0, 1], cells.bg[0, 1]) == (3, DEFAULT_COLOR)
+    # nothing is opaque
+    assert cells.glyphs[0, 2] == " "
+    # the odd last row is paired with a transparent row
+    assert cells.glyphs[1, 2] == UPPER_HALF_BLOCK
+    assert (cells.fg[1, 2], cells.bg[1, 2]) == (4, DEFAULT_COLOR)
@@ -0,0 +1,72 @@
+import os
+
+import numpy as np
+from PIL import Image
+from termgame.graphics import image_cache
+from termgame.graphics.image_cache import ImageCache
+
+
+def save_image(path, color, size=(4, 2)):
+    image = np.zeros((size[1], size[0], 3), dtype=np.uint8)
+    image[:] = color
+    Image.fromarray(image).save(path)
+    return str(path)
+
+
+def test_load_is_cached(tmp_path):
+    path = save_image(tmp_path / "a.png", (1, 2, 3))
+    cache = ImageCache(1024)
+
+    image = cache.load(path)
+    assert image.shape == (2, 4, 3)
+    assert not image.flags.writeable
+    assert cache.load(path) is image
+    assert cache.load(path, resize=(2, 1)) is not image
+    assert len(cache) == 2
+
+
+def test_modified_file_is_decoded_again(tmp_path):
+    path = save_image(tmp_path / "a.png", (1, 2, 3))
+    cache = ImageCache(1024)
+    cache.load(path)
+
+    save_image(path, (4, 5, 6))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert tuple(cache.load(path)[0, 0]) == (4, 5, 6)
+    assert len(cache) == 1
+
+
+def test_lru_eviction(tmp_path):
+    a = save_image(tmp_path / "a.png", (1, 1, 1))
+    b = save_image(tmp_path / "b.png", (2, 2, 2))
+    c = save_image(tmp_path / "c.png", (3, 3, 3))
+
+    # room for two images of 4x2x3 bytes
+    cache = ImageCache(48)
+    image_a = cache.load(a)
+    cache.load(b)
+    cache.load(a)
+    cache.load(c)
+
+    # b was the least recently used
+    assert len(cache) == 2
+    assert cache.nbytes == 48
+    assert cache.load(a) is image_a
+
+
+def test_disk_cache(tmp_path, monkeypatch):
+    path = save_image(tmp_path / "a.png", (1, 2, 3))
+    directory = str(tmp_path / "cache")
+
+    ImageCache(1024, directory).load(path)
+    assert len(os.listdir(directory)) == 1
+
+    # a new cache (e.g. a new run of the game) loads the decoded image from disk
+    def fail_decode(*args):
+        raise AssertionError("image should not be decoded")
+
+    monkeypatch.setattr(image_cache, "decode_image", fail_decode)
+    image = ImageCache(1024, directory).load(path)
+    assert tuple(image[0, 0]) == (1, 2, 3)
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+from termgame import Screen
+from termgame.graphics import IndexedScreen
+from termgame.graphics.encoder import FrameEncoder
+
+
+def _sprite() -> Screen:
+    screen = Screen(3, 2)
+    screen.colors[0] = [(255, 0, 0), (0, 0, 255), (255, 0, 0)]
+    screen.alpha[0] = True
+    screen.colors[1, 1] = (0, 255, 0)
+    screen.alpha[1, 1] = True
+    return screen.touch()
+
+
+def test_from_screen_round_trip():
+    screen = _sprite()
+    indexed = IndexedScreen.from_screen(screen)
+    assert indexed.indices.dtype == np.uint8
+    # red, green, blue and transparent
+    assert len(indexed.palette) == 4
+    assert indexed.transparent_index == 3
+
+    restored = indexed.to_screen()
+    assert (restored.alpha == screen.alpha).all()
+    assert (restored.colors[screen.alpha] == screen.colors[screen.alpha]).all()
+
+
+def test_paint_skips_transparent_index():
+    indexed = IndexedScreen.from_screen(_sprite())
+    target = Screen(4, 4).fill((9, 9, 9))
+    target.paint_screen(indexed, 1, 1)
+    assert tuple(target.colors[1, 1]) == (255, 0, 0)
+    assert tuple(target.colors[2, 2]) == (0, 255, 0)
+    # transparent pixels leave the target untouched
+    assert tuple(target.colors[2, 1]) == (9, 9, 9)
+
+
+def test_palette_swap_shares_indices():
+    indexed = IndexedScreen(np.array([[0, 1]]), [(255, 0, 0), (0, 0, 255)])
+    swapped = indexed.with_palette(indexed.palette[:, ::-1])
+    assert swapped.indices is indexed.indices
+    assert tuple(swapped.buffers()[0][0, 0]) == (0, 0, 255)
+    assert tuple(indexed.buffers()[0][0, 0]) == (255, 0, 0)
+
+    with pytest.raises(ValueError):
+        indexed.with_palette([(0, 0, 0)])
+
+
+def test_palette_swap_keeps_other_variants_cached():
+    encoder = FrameEncoder()
+    indexed = IndexedScreen(np.array([[0, 1]]), [(255, 0, 0), (0, 0, 255)])
+    flashing = indexed.with_palette(indexed.palette)
+    compiled = indexed.compiled(encoder)
+
+    flashing.set_palette([(255, 255, 255), (255, 255, 255)])
+    assert indexed.compiled(encoder) is compiled
+    assert flashing.compiled(encoder) is not compiled
+
+    # modifying the shared index plane invalidates every variant
+    indexed.indices[0, 0] = 1
+    flashing.touch()
+    assert indexed.compiled(encoder) is not compiled
+
+
+def test_caches_follow_palette():
+    indexed = IndexedScreen(np.array([[0, 1]]), [(255, 0, 0), (0, 0, 255)])
+    encoder = FrameEncoder()
+    quantized, compiled = indexed.quantized(), indexed.compiled(encoder)
+    assert indexed.quantized() is quantized
+    assert indexed.compiled(encoder) is compiled
+    assert encoder.encode(indexed) == FrameEncoder().encode(indexed.to_screen())
+
+    indexed.set_palette([(0, 255, 0), (0, 0, 255)])
+    encoder = FrameEncoder()
+    assert indexed.compiled(encoder) is not compiled
+    assert encoder.encode(indexed) == FrameEncoder().encode(indexed.to_screen())
+
+
+def test_too_many_colors():
+    screen = Screen(17, 16).fill((0, 0, 0))
+    screen.colors[..., 0] = np.arange(17 * 16).reshape(16, 17) % 256
+    screen.colors[..., 1] = np.arange(17 * 16).reshape(16, 17) // 256
+    with pytest.raises(ValueError):
+        IndexedScreen.from_screen(screen)
+    with pytest.raises(ValueError):
+        IndexedScreen(np.array([[2]]), [(0, 0, 0)])
@@ -0,0 +1,103 @@
+import threading
+
+import pytest
+from termgame import Screen
+from termgame.graphics.pipeline import RenderPipeline
+from termgame.graphics.rect import Rect
+from termgame.graphics.renderer import Renderer
+
+
+class BlockingRenderer(Renderer):
+    """
+    Renderer that records the frames it renders, and waits to be released before each one.
+    """
+
+    def __init__(self, width: int, height: int):
+        super().__init__(width, height)
+        self.release = threading.Semaphore(0)
+        self.started = threading.Semaphore(0)
+        self.frames = []
+        self.sprites = []
+
+    def render(self, screen, sprites=(), regions=None):
+        self.started.release()
+        self.release.acquire()
+        self.frames.append((screen.copy(), regions))
+        self.sprites.append(list(sprites))
+
+
+def test_frames_are_copied():
+    renderer = BlockingRenderer(2, 1)
+    pipeline = RenderPipeline(renderer)
+    pipeline.start()
+    screen = Screen(2, 1).fill((1, 1, 1))
+    pipeline.submit(screen)
+    renderer.started.acquire()
+
+    # the game keeps drawing while the writer renders the first frame
+    screen.fill((2, 2, 2), Rect(1, 0, 1, 1))
+    pipeline.submit(screen, regions=[Rect(1, 0, 1, 1)])
+    renderer.release.release()
+    renderer.release.release()
+    pipeline.stop()
+
+    (first, _), (second, regions) = renderer.frames
+    assert tuple(first.colors[0, 1]) == (1, 1, 1)
+    assert tuple(second.colors[0, 1]) == (2, 2, 2)
+    assert regions == [Rect(1, 0, 1, 1)]
+
+
+def test_latest_frame_replaces_pending_one():
+    renderer = BlockingRenderer(4, 1)
+    pipeline = RenderPipeline(renderer)
+    pipeline.start()
+    screen = Screen(4, 1)
+    pipeline.submit(screen)
+    renderer.started.acquire()
+
+    # submitting never waits for the writer, the pending frame is replaced
+    for x in range(3):
+        screen.fill((9, 9, 9), Rect(x, 0, 1, 1))
+        pipeline.submit(screen, regions=[Rect(x, 0, 1, 1)])
+    for _ in range(2):
+        renderer.release.release()
+    pipeline.stop()
+
+    assert pipeline.rendered == 2
+    assert pipeline.replaced == 2
+    last, regions = renderer.frames[-1]
+    assert (last.colors[0, :3] == 9).all()
+    assert regions == [Rect(x, 0, 1, 1) for x in range(3)]
+
+
+def test_writer_errors_are_raised():
+    renderer = Renderer(2, 2)
+    pipeline = RenderPipeline(renderer)
+    pipeline.color_depth = "24bit"
+    pipeline.start()
+    pipeline.submit(Screen(2, 2))
+    with pytest.raises(RuntimeError):
+        pipeline.stop()
+
+
+def test_only_frozen_sprites_are_spliced():
+    renderer = BlockingRenderer(4, 1)
+    renderer.release.release()
+    pipeline = RenderPipeline(renderer)
+    pipeline.start()
+    frozen = Screen(2, 1).freeze()
+    pipeline.submit(Screen(4, 1), [(Screen(2, 1), 0, 0), (frozen, 2, 0)])
+    pipeline.stop()
+
+    # the game may modify the other sprites while the writer reads them
+    assert renderer.sprites == [[(frozen, 2, 0)]]
+
+
+def test_render_time_is_measured():
+    renderer = BlockingRenderer(2, 1)
+    renderer.release.release()
+    pipeline = RenderPipeline(renderer)
+    pipeline.start()
+    pipeline.submit(Screen(2, 1))
+    pipeline.stop()
+    assert pipeline.render_time > 0
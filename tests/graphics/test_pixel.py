@@ -0,0 +1,55 @@
+import pickle
+
+import pytest
+from termgame import Screen
+from termgame.graphics.pixel import RGBColor, RGBPixel
+
+
+def test_colors_are_interned():
+    assert RGBColor(1, 2, 3) is RGBColor(1, 2, 3)
+    assert RGBColor() is RGBColor(0, 0, 0)
+    assert RGBColor(1, 2, 3) is not RGBColor(3, 2, 1)
+
+
+def test_colors_are_immutable():
+    rgb = RGBColor(1, 2, 3)
+    with pytest.raises(AttributeError):
+        rgb.r = 10
+    with pytest.raises(AttributeError):
+        rgb.alpha = 1
+
+
+def test_set_returns_new_color():
+    rgb = RGBColor(1, 2, 3)
+    assert rgb.set(10, "g") is RGBColor(1, 10, 3)
+    assert rgb.set_tuple((4, 5, 6)) is RGBColor(4, 5, 6)
+    assert (rgb.r, rgb.g, rgb.b) == (1, 2, 3)
+
+
+def test_invalid_colors():
+    with pytest.raises(ValueError):
+        RGBColor(256, 0, 0)
+    with pytest.raises(ValueError):
+        RGBColor(1, 2, 3).set(-1, "r")
+    with pytest.raises(ValueError):
+        RGBColor(1, 2, 3).set(1, "a")
+
+
+def test_pixels_are_interned():
+    assert RGBPixel(RGBColor(1, 2, 3)) is RGBPixel(RGBColor(1, 2, 3), "\u2001\u2001", False)
+    assert RGBPixel(RGBColor(1, 2, 3)) is not RGBPixel(RGBColor(1, 2, 3), transparent=True)
+    with pytest.raises(AttributeError):
+        RGBPixel().color = RGBColor(1, 2, 3)
+
+
+def test_screen_pixels_are_shared():
+    screen = Screen(2, 1)
+    screen.fill((10, 20, 30))
+    assert screen.pixels[0][0] is screen.pixels[0][1]
+
+
+def test_pickle_keeps_interning():
+    rgb = RGBColor(7, 8, 9)
+    assert pickle.loads(pickle.dumps(rgb)) is rgb
+    px = RGBPixel(rgb, "ab")
+    assert pickle.loads(pickle.dumps(px)) is px
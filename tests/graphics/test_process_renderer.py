@@ -0,0 +1,90 @@
+import pytest
+from termgame import Screen
+from termgame.graphics.encoder import FrameEncoder
+from termgame.graphics.process_renderer import BandEncoder, ProcessRenderer, SharedFramebuffer
+from termgame.graphics.rect import Rect
+from termgame.graphics.renderer import CLEAR_TERMINAL
+
+
+@pytest.fixture
+def framebuffer():
+    framebuffer = SharedFramebuffer(3, 2)
+    yield framebuffer
+    framebuffer.close()
+    framebuffer.unlink()
+
+
+def test_frames_are_shared(framebuffer):
+    screen = Screen(3, 2).fill((1, 2, 3))
+    sequence = framebuffer.write(screen, color_depth="256")
+
+    attached = SharedFramebuffer(3, 2, framebuffer.name)
+    copy = Screen(3, 2)
+    assert attached.read(copy) == (sequence, "256")
+    assert (copy.colors == screen.colors).all()
+    assert copy.alpha.all()
+    # nothing new to read
+    assert attached.read(copy, sequence) is None
+    del copy
+    attached.close()
+
+
+def test_only_changed_regions_are_written(framebuffer):
+    screen = Screen(3, 2).fill((1, 1, 1))
+    framebuffer.write(screen)
+    screen.fill((2, 2, 2))
+    sequence = framebuffer.write(screen, [Rect(2, 1, 1, 1)])
+
+    copy = Screen(3, 2)
+    assert framebuffer.read(copy) == (sequence, "truecolor")
+    assert tuple(copy.colors[1, 2]) == (2, 2, 2)
+    assert tuple(copy.colors[0, 0]) == (1, 1, 1)
+    # even sequence numbers are complete frames
+    assert sequence % 2 == 0
+
+
+def test_new_framebuffer_is_a_cleared_screen(framebuffer):
+    screen = Screen(3, 2).fill((1, 1, 1))
+    framebuffer.write(screen, [Rect(0, 0, 1, 1)])
+
+    copy = Screen(3, 2).fill((2, 2, 2))
+    framebuffer.read(copy)
+    cleared = Screen(3, 2)
+    assert (copy.symbols[:, 1:] == cleared.symbols[:, 1:]).all()
+    assert not copy.alpha[:, 1:].any()
+
+
+def test_size_must_match(framebuffer):
+    with pytest.raises(ValueError):
+        framebuffer.write(Screen(2, 2))
+
+
+def test_band_encoder_only_encodes_changes():
+    band_encoder = BandEncoder(FrameEncoder(), 3)
+    screen = Screen(2, 1).fill((5, 5, 5))
+    first = band_encoder.encode(screen)
+    # the band is drawn at its row of the terminal
+    assert first.startswith("\033[4;1H")
+    assert band_encoder.encode(screen) == ""
+
+    screen.fill((6, 6, 6), Rect(1, 0, 1, 1))
+    assert band_encoder.encode(screen).startswith("\033[4;3H")
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_process_renderer_draws_frames(capfd, workers):
+    renderer = ProcessRenderer(4, 6, mode="halfblock", workers=workers)
+    with pytest.raises(RuntimeError):
+        renderer.submit(Screen(4, 6))
+    renderer.start()
+    renderer.submit(Screen(4, 6).fill((255, 0, 0)))
+    renderer.stop()
+    assert renderer.render_time > 0
+
+    output = capfd.readouterr().out
+    assert output.startswith(CLEAR_TERMINAL)
+    assert "\033[38;2;255;0;0m" in output
+    # each of the 3 rows of cells is drawn, whichever process encoded it
+    for row in range(1, 4):
+        assert f"\033[{row};1H" in output
+    assert output.count("\u2580" * 4) == 3
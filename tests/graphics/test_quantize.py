@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from termgame import Screen
+from termgame.graphics.encoder import FrameEncoder
+from termgame.graphics.quantize import palette, quantization_table, quantize
+
+
+def test_palettes():
+    assert palette("256").shape == (256, 3)
+    assert palette("16").shape == (16, 3)
+    assert quantization_table("256").shape == (32, 32, 32)
+
+
+def test_256_colors_skip_system_colors():
+    assert quantization_table("256").min() >= 16
+    assert quantization_table("16").max() < 16
+
+
+def test_quantize_exact_palette_colors():
+    colors = np.array([[(0, 0, 0), (255, 255, 255), (255, 0, 0)]], dtype=np.uint8)
+    indices = quantize(colors, "256")
+    assert (palette("256")[indices[0]] == colors[0]).all()
+
+
+def test_quantize_truecolor_packs_colors():
+    colors = np.array([[(1, 2, 3)]], dtype=np.uint8)
+    assert quantize(colors)[0, 0] == 0x010203
+
+
+def test_quantize_invalid_depth():
+    with pytest.raises(ValueError):
+        quantize(np.zeros((1, 1, 3), dtype=np.uint8), "8")
+
+
+def test_dither_mixes_colors():
+    colors = np.full((8, 8, 3), 123, dtype=np.uint8)
+    assert len(np.unique(quantize(colors, "256"))) == 1
+    assert len(np.unique(quantize(colors, "256", dither=True))) > 1
+
+
+def test_quantized_cache_invalidation():
+    screen = Screen(2, 2).fill((255, 0, 0))
+    first = screen.quantized("16")
+    assert screen.quantized("16") is first
+
+    screen.set_px_color((0, 0, 255), 0, 0)
+    assert screen.quantized("16") is not first
+
+
+def test_encode_256_colors():
+    screen = Screen(2, 1).fill((255, 0, 0))
+    encoder = FrameEncoder(color_depth="256")
+    row = encoder.encode_row(encoder.to_cells(screen), 0)
+    # the color cube's red, not the system red, whose color depends on the terminal
+    assert "\033[48;5;196m" in row
+    assert "\033[38;5;196m" in row
+
+
+def test_encode_16_colors():
+    screen = Screen(2, 1).fill((0, 0, 238))
+    encoder = FrameEncoder(color_depth="16")
+    row = encoder.encode_row(encoder.to_cells(screen), 0)
+    assert "\033[44m" in row
+    assert "\033[91m" in row
+
+
+def test_dither_origin_matches_whole_screen():
+    colors = np.random.default_rng(0).integers(0, 256, (6, 7, 3), dtype=np.uint8)
+    whole = quantize(colors, "16", dither=True)
+    part = quantize(colors[1:5, 3:], "16", dither=True, origin=(3, 1))
+    assert (part == whole[1:5, 3:]).all()
@@ -0,0 +1,16 @@
+from termgame.graphics.rect import Rect, merge_rects
+
+
+def test_intersection():
+    assert Rect(0, 0, 4, 4).intersection(Rect(2, 1, 4, 4)) == Rect(2, 1, 2, 3)
+    assert Rect(0, 0, 2, 2).intersection(Rect(5, 5, 1, 1)).is_empty
+    assert not Rect(0, 0, 2, 2).overlaps(Rect(2, 0, 2, 2))
+
+
+def test_merge_rects():
+    rects = [Rect(0, 0, 2, 2), Rect(5, 5, 2, 2), Rect(1, 1, 2, 2), Rect(0, 0, 0, 3)]
+    assert sorted(merge_rects(rects)) == [Rect(0, 0, 3, 3), Rect(5, 5, 2, 2)]
+
+    # merging two rectangles can make them overlap a third one
+    rects = [Rect(0, 4, 2, 2), Rect(0, 0, 2, 2), Rect(3, 0, 2, 6)]
+    assert merge_rects(rects + [Rect(0, 0, 4, 1)]) == [Rect(0, 0, 5, 6)]
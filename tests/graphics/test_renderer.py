@@ -0,0 +1,147 @@
+import numpy as np
+from termgame import Screen
+from termgame.graphics.rect import Rect
+from termgame.graphics.renderer import Renderer, changed_runs, move_cursor
+
+
+def test_changed_runs():
+    changed = np.array(
+        [
+            [1, 1, 0, 1],
+            [0, 0, 0, 0],
+            [0, 1, 1, 1],
+        ],
+        dtype=bool,
+    )
+    assert changed_runs(changed) == [(0, 0, 2), (0, 3, 4), (2, 1, 4)]
+
+
+def test_first_render_draws_everything(capsys):
+    renderer = Renderer(3, 2)
+    renderer.render(Screen(3, 2).fill((1, 2, 3)))
+    out = capsys.readouterr().out
+    assert out.startswith("\033[2J")
+    assert move_cursor(0, 0) in out
+    assert move_cursor(0, 1) in out
+
+
+def test_render_only_writes_changes(capsys):
+    renderer = Renderer(4, 4)
+    screen = Screen(4, 4).fill((1, 2, 3))
+    renderer.render(screen)
+    capsys.readouterr()
+
+    # nothing changed, nothing is written
+    renderer.render(screen)
+    assert capsys.readouterr().out == ""
+
+    screen.set_px_color((9, 9, 9), 2, 1)
+    renderer.render(screen)
+    out = capsys.readouterr().out
+    assert move_cursor(2, 1) in out
+    assert out.count("\033[2;") == 1
+    assert move_cursor(0, 0) not in out
+
+
+def test_synchronized_output(capsys):
+    renderer = Renderer(2, 2, synchronized=True)
+    renderer.render(Screen(2, 2))
+    out = capsys.readouterr().out
+    assert out.startswith("\033[?2026h")
+    assert out.endswith("\033[?2026l")
+
+
+def test_halfblock_render(capsys):
+    renderer = Renderer(2, 4, mode="halfblock")
+    screen = Screen(2, 4).fill((1, 2, 3))
+    renderer.render(screen)
+    capsys.readouterr()
+
+    # pixel (1, 3) is the bottom half of cell (1, 1), one column per cell
+    screen.set_px_color((9, 9, 9), 1, 3)
+    renderer.render(screen)
+    out = capsys.readouterr().out
+    assert move_cursor(1, 1, cell_width=1) in out
+    assert "\033[48;2;9;9;9m" in out
+
+
+def test_render_splices_sprite_rows(capsys):
+    renderer = Renderer(6, 4)
+    sprite = Screen(2, 2).fill((9, 9, 9))
+    screen = Screen(6, 4).fill((1, 2, 3))
+    renderer.render(screen)
+    capsys.readouterr()
+
+    screen.paint_screen(sprite, 3, 1)
+    renderer.render(screen, [(sprite, 3, 1)])
+    out = capsys.readouterr().out
+    compiled = sprite.compiled(renderer.encoder)
+    assert move_cursor(3, 1) + "\033[0m" + compiled.rows[0] in out
+    assert move_cursor(3, 2) in out
+    assert out.count("\033[48;2;9;9;9m") == 2
+
+
+def test_render_skips_covered_sprite_rows(capsys):
+    renderer = Renderer(4, 2)
+    sprite = Screen(2, 2).fill((9, 9, 9))
+    screen = Screen(4, 2).fill((1, 2, 3))
+    renderer.render(screen)
+    capsys.readouterr()
+
+    # the second row of the sprite is covered, it is encoded from the screen instead
+    screen.paint_screen(sprite, 0, 0)
+    screen.set_px_color((5, 5, 5), 1, 1)
+    renderer.render(screen, [(sprite, 0, 0)])
+    out = capsys.readouterr().out
+    assert sprite.compiled(renderer.encoder).rows[0] + move_cursor(0, 1) in out
+    assert "\033[48;2;5;5;5m" in out
+
+
+def test_render_regions(capsys):
+    renderer = Renderer(4, 4)
+    screen = Screen(4, 4).fill((1, 2, 3))
+    renderer.render(screen)
+    capsys.readouterr()
+
+    # changes outside of the given regions are not looked at
+    screen.set_px_color((9, 9, 9), 0, 0)
+    screen.set_px_color((8, 8, 8), 3, 3)
+    renderer.render(screen, regions=[Rect(2, 2, 2, 2)])
+    out = capsys.readouterr().out
+    assert move_cursor(3, 3) in out
+    assert move_cursor(0, 0) not in out
+
+    renderer.render(screen, regions=[Rect(2, 2, 2, 2)])
+    assert capsys.readouterr().out == ""
+
+
+def test_halfblock_render_regions(capsys):
+    renderer = Renderer(2, 5, mode="halfblock")
+    screen = Screen(2, 5).fill((1, 2, 3))
+    renderer.render(screen)
+    capsys.readouterr()
+
+    # pixel (0, 4) is the top half of the padded last cell row
+    screen.set_px_color((9, 9, 9), 0, 4)
+    renderer.render(screen, regions=[Rect(0, 3, 1, 2)])
+    out = capsys.readouterr().out
+    assert move_cursor(0, 2, cell_width=1) in out
+    assert "\033[38;2;9;9;9m" in out
+
+
+def test_set_color_depth(capsys):
+    renderer = Renderer(2, 2)
+    screen = Screen(2, 2).fill((255, 0, 0))
+    renderer.render(screen)
+    capsys.readouterr()
+
+    # the whole frame is rewritten with the new colors, without clearing the terminal
+    renderer.set_color_depth("256")
+    renderer.render(screen, regions=[])
+    out = capsys.readouterr().out
+    assert not out.startswith("\033[2J")
+    assert "\033[48;5;" in out
+    assert move_cursor(0, 1) in out
+
+    renderer.render(screen, regions=[])
+    assert capsys.readouterr().out == ""
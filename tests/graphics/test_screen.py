@@ -0,0 +1,198 @@
+import numpy as np
+import pytest
+from PIL import Image
+from termgame import Screen
+from termgame.graphics.encoder import FrameEncoder
+from termgame.graphics.pixel import RGBColor, RGBPixel
+
+
+def test_init():
+    """
+    Test that a new screen is fully transparent and black.
+    """
+    screen = Screen(4, 3)
+    assert screen.colors.shape == (3, 4, 3)
+    assert screen.colors.dtype == np.uint8
+    assert screen.alpha.shape == (3, 4)
+    assert not screen.alpha.any()
+    assert not screen.colors.any()
+
+
+def test_fill():
+    screen = Screen(4, 3).fill((1, 2, 3))
+    assert screen.alpha.all()
+    assert (screen.colors == (1, 2, 3)).all()
+
+    with pytest.raises(ValueError):
+        screen.fill((256, 0, 0))
+
+
+def test_pixels_view():
+    """
+    Test that pixels[y][x] reads and writes the screen's buffers.
+    """
+    screen = Screen(4, 3)
+    screen.pixels[1][2] = RGBPixel(RGBColor(10, 20, 30))
+    assert tuple(screen.colors[1, 2]) == (10, 20, 30)
+    assert screen.alpha[1, 2]
+
+    px = screen.pixels[1][2]
+    assert px.color == RGBColor(10, 20, 30)
+    assert not px.transparent
+    assert screen.pixels[0][0].transparent
+
+
+def test_set_px_color_keeps_symbol():
+    screen = Screen(2, 2)
+    screen.set_px(RGBPixel(RGBColor(), symbol="ab"), 0, 0)
+    screen.set_px_color((5, 5, 5), 0, 0)
+    assert screen.pixels[0][0].symbol == "ab"
+    assert tuple(screen.colors[0, 0]) == (5, 5, 5)
+
+
+def test_paint_screen_skips_transparent():
+    screen = Screen(4, 4).fill((255, 255, 255))
+    sprite = Screen(2, 2)
+    sprite.set_px_color((1, 1, 1), 0, 0)
+
+    screen.paint_screen(sprite, 1, 1)
+
+    assert tuple(screen.colors[1, 1]) == (1, 1, 1)
+    assert tuple(screen.colors[2, 2]) == (255, 255, 255)
+
+
+def test_paint_screen_clips():
+    """
+    Test painting a screen partially (or entirely) outside of another one.
+    """
+    screen = Screen(4, 4)
+    sprite = Screen(3, 3).fill((1, 1, 1))
+    sprite.set_px_color((2, 2, 2), 2, 2)
+
+    screen.paint_screen(sprite, -1, -1)
+    assert screen.alpha[:2, :2].all()
+    assert screen.alpha.sum() == 4
+    assert tuple(screen.colors[1, 1]) == (2, 2, 2)
+
+    screen.clear()
+    screen.paint_screen(sprite, 3, 2)
+    assert screen.alpha.sum() == 2
+    assert screen.alpha[2:, 3].all()
+
+    screen.clear()
+    screen.paint_screen(sprite, 10, -10)
+    assert not screen.alpha.any()
+
+
+def test_set_px_outside_screen():
+    screen = Screen(2, 2)
+    screen.set_px(RGBPixel(RGBColor(1, 1, 1)), -1, 0)
+    screen.set_px_color((1, 1, 1), 0, 5)
+    assert not screen.alpha.any()
+
+
+def test_from_image_alpha(tmp_path):
+    image = np.zeros((2, 3, 4), dtype=np.uint8)
+    image[..., :3] = (10, 20, 30)
+    image[0, :, 3] = 255
+    image[1, 0, 3] = 100
+
+    screen = Screen.from_image(image, has_alpha=True)
+    assert (screen.width, screen.height) == (3, 2)
+    assert (screen.colors == (10, 20, 30)).all()
+    assert screen.alpha.tolist() == [[True, True, True], [True, False, False]]
+
+    screen = Screen.from_image(image, has_alpha=True, alpha_threshold=100)
+    assert screen.alpha.tolist() == [[True, True, True], [False, False, False]]
+
+    # load from a file, and resize
+    path = str(tmp_path / "image.png")
+    Image.fromarray(image).save(path)
+    screen = Screen.from_image(path, resize=(6, 4), has_alpha=True)
+    assert (screen.width, screen.height) == (6, 4)
+    assert screen.alpha[0].all()
+
+
+def test_paint_image_too_big():
+    with pytest.raises(ValueError):
+        Screen(2, 2).paint_image(np.zeros((3, 3, 3), dtype=np.uint8))
+
+
+def test_compiled_rows_are_cached():
+    encoder = FrameEncoder()
+    screen = Screen(2, 2).fill((1, 2, 3))
+    compiled = screen.compiled(encoder)
+    assert screen.compiled(encoder) is compiled
+    assert compiled.rows[0].count("\033[48;2;1;2;3m") == 1
+
+    screen.set_px_color((4, 5, 6), 0, 0)
+    assert screen.compiled(encoder) is not compiled
+    assert screen.compiled(FrameEncoder(mode="halfblock")).cells.height == 1
+
+
+def test_compiled_rows_modified_meanwhile_are_not_cached():
+    screen = Screen(2, 1)
+
+    class ModifyingEncoder(FrameEncoder):
+        def compile(self, compiled_screen):
+            compiled = super().compile(compiled_screen)
+            # e.g. the game modifying a sprite while the writer thread compiles it
+            screen.fill((1, 2, 3))
+            return compiled
+
+    encoder = ModifyingEncoder()
+    stale = screen.compiled(encoder)
+    assert screen.compiled(encoder) is not stale
+
+
+def _numbered_screen(width: int, height: int) -> Screen:
+    screen = Screen(width, height)
+    screen.colors[..., 0] = np.arange(width * height).reshape(height, width)
+    screen.alpha[:] = True
+    return screen.touch()
+
+
+def test_flipped_view_shares_buffers():
+    screen = _numbered_screen(3, 2)
+    flipped = screen.flipped("x")
+    assert (flipped.colors == np.flip(screen.colors, axis=1)).all()
+    assert np.shares_memory(flipped.colors, screen.colors)
+
+    # changes show in both, and invalidate the caches of both
+    quantized = flipped.quantized()
+    screen.set_px_color((99, 0, 0), 0, 0)
+    assert flipped.revision == screen.revision
+    assert flipped.quantized() is not quantized
+    assert tuple(flipped.colors[0, 2]) == (99, 0, 0)
+
+
+def test_scrolled_view_paints_wrapped():
+    screen = _numbered_screen(4, 3)
+    scrolled = screen.scrolled(1, -1).scrolled(2, 0)
+    expected = np.roll(screen.colors, (-1, 3), axis=(0, 1))
+
+    target = Screen(4, 3).paint_screen(scrolled, 0, 0)
+    assert (target.colors == expected).all()
+    assert (scrolled.copy().colors == expected).all()
+    assert (scrolled.flipped("y").copy().colors == np.flip(expected, axis=0)).all()
+
+    # accessing the buffers of the view copies them, leaving the screen untouched
+    assert (scrolled.colors == expected).all()
+    assert not np.shares_memory(scrolled.colors, screen.colors)
+    assert (screen.colors[..., 0] == np.arange(12).reshape(3, 4)).all()
+
+
+def test_scroll_in_place():
+    screen = _numbered_screen(4, 3)
+    expected = Screen(4, 3).paint_screen(screen.scrolled(-1, 2), 0, 0).colors
+    colors = screen.buffers()[0]
+    revision = screen.revision
+
+    assert screen.scroll(-1, 0).scroll(0, 2) is screen
+    assert screen.revision > revision
+    assert (Screen(4, 3).paint_screen(screen, 0, 0).colors == expected).all()
+    # the pixels were not moved, only the offset changed
+    assert (colors[..., 0] == np.arange(12).reshape(3, 4)).all()
+
+    with pytest.raises(ValueError):
+        screen.copy().freeze().scroll(1, 0)
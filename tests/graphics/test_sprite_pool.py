@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from termgame import Screen
+from termgame.graphics import SpritePool
+
+
+def test_identical_sprites_are_shared():
+    pool = SpritePool()
+    a = pool.solid(2, 2, (1, 2, 3))
+    b = pool.intern(Screen(2, 2).fill((1, 2, 3)))
+    assert a is b
+    assert a.frozen
+    assert pool.solid(2, 2, (3, 2, 1)) is not a
+    assert pool.solid(2, 1, (1, 2, 3)) is not a
+
+
+def test_hidden_pixels_are_ignored():
+    pool = SpritePool()
+    a, b = Screen(2, 1), Screen(2, 1)
+    a.colors[0, 0] = (9, 9, 9)
+    assert pool.intern(a) is pool.intern(b)
+
+
+def test_shared_sprites_are_read_only():
+    sprite = SpritePool().solid(2, 2, (1, 2, 3))
+    with pytest.raises(ValueError):
+        sprite.fill((0, 0, 0))
+    with pytest.raises(ValueError):
+        sprite.flipped().set_px_color((0, 0, 0), 0, 0)
+    with pytest.raises(ValueError):
+        sprite.colors = np.zeros((2, 2, 3), dtype=np.uint8)
+
+    # copies can be modified
+    copy = sprite.copy().fill((0, 0, 0))
+    assert not copy.frozen
+    assert (sprite.colors == (1, 2, 3)).all()
+
+
+def test_unused_sprites_are_freed():
+    pool = SpritePool()
+    pool.solid(1, 1, (1, 2, 3))
+    assert len(pool) == 0
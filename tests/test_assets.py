@@ -0,0 +1,79 @@
+import threading
+import time
+
+import numpy as np
+from PIL import Image
+from termgame import Engine, Screen
+from termgame.assets import Asset, preload
+
+
+def test_preload(tmp_path):
+    paths = []
+    for i in range(3):
+        image = np.full((2, 3, 3), i, dtype=np.uint8)
+        path = str(tmp_path / f"{i}.png")
+        Image.fromarray(image).save(path)
+        paths.append(path)
+
+    progress = []
+    futures = preload(
+        [paths[0], Asset(paths[1], resize=(6, 4)), Asset(paths[2], has_alpha=True)],
+        on_progress=lambda loaded, total: progress.append((loaded, total)),
+    )
+    sprites = [future.result() for future in futures]
+
+    assert all(isinstance(sprite, Screen) for sprite in sprites)
+    assert (sprites[1].width, sprites[1].height) == (6, 4)
+    assert (sprites[2].colors == 2).all()
+    assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_preload_reports_progress_in_order(tmp_path, monkeypatch):
+    path = str(tmp_path / "a.png")
+    Image.fromarray(np.zeros((2, 2, 3), dtype=np.uint8)).save(path)
+    load = Asset.load
+
+    def slow_load(asset):
+        # finish the loads on the worker threads, at about the same time
+        time.sleep(0.01)
+        return load(asset)
+
+    monkeypatch.setattr(Asset, "load", slow_load)
+    progress = []
+    done = threading.Event()
+
+    def on_progress(loaded, total):
+        # slow down some reports, so the next ones would overtake them
+        time.sleep(0.005 if loaded % 2 else 0)
+        progress.append(loaded)
+        if loaded == total:
+            done.set()
+
+    preload([path] * 20, on_progress, max_workers=8)
+    assert done.wait(5)
+    assert progress == list(range(1, 21))
+
+
+def test_engine_preload(tmp_path):
+    path = str(tmp_path / "a.png")
+    Image.fromarray(np.zeros((2, 2, 3), dtype=np.uint8)).save(path)
+
+    engine = Engine(10, 10)
+    progress = []
+    futures = engine.preload([path, path], lambda *counts: progress.append(counts))
+    assert futures[0].result().width == 2
+    # the progress is reported while the engine waits, even for assets already loaded
+    assert progress == []
+    assert engine.wait_for_assets()
+    assert progress == [(1, 2), (2, 2)]
+    assert not engine.wait_for_assets()
+
+
+def test_engine_prints_loading_progress(tmp_path, capsys):
+    path = str(tmp_path / "a.png")
+    Image.fromarray(np.zeros((2, 2, 3), dtype=np.uint8)).save(path)
+
+    engine = Engine(10, 10)
+    engine.preload([path])[0].result()
+    engine.wait_for_assets()
+    assert capsys.readouterr().out == "\rLoading assets... 1/1\n"